@@ -0,0 +1,25 @@
+"""Sizes and action classes shared by the benchmarks.
+
+Kept out of `conftest.py`, so benchmarks import them without clashing with `tests/conftest.py`
+when both dirs are collected in one run.
+"""
+
+from github_custom_actions.action_base import ActionBase
+from github_custom_actions.inputs_outputs import ActionInputs, ActionOutputs
+
+KB = 1024
+MB = 1024 * KB
+
+
+class BenchInputs(ActionInputs):
+    my_input: str
+    another_input: str
+
+
+class BenchOutputs(ActionOutputs):
+    my_output: str
+
+
+class BenchAction(ActionBase):
+    inputs: BenchInputs
+    outputs: BenchOutputs
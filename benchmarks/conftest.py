@@ -0,0 +1,31 @@
+"""Benchmarks of the package hot paths.
+
+Run with `invoke bench` to compare with the saved baseline, and `invoke bench-save`
+to save a new baseline to `benchmarks/baselines/`.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from bench_helpers import BenchAction
+
+
+@pytest.fixture
+def action_env():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = {
+            "INPUT_MY-INPUT": "value1",
+            "INPUT_ANOTHER-INPUT": "value2",
+            "GITHUB_OUTPUT": str(Path(temp_dir) / "output.txt"),
+            "GITHUB_STEP_SUMMARY": str(Path(temp_dir) / "summary.md"),
+            "RUNNER_OS": "Linux",
+        }
+        with patch.dict("os.environ", env):
+            yield Path(temp_dir)
+
+
+@pytest.fixture
+def action(action_env):
+    return BenchAction()
@@ -0,0 +1,58 @@
+"""Import time of the package modules from `python -X importtime`.
+
+Usage:
+    python benchmarks/importtime.py [module] [--top N]
+
+Prints the heaviest imports, so you can spot new heavy dependencies.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, NamedTuple
+
+PACKAGE = "github_custom_actions"
+MODULES = [
+    PACKAGE,
+    f"{PACKAGE}.action_base",
+    f"{PACKAGE}.github_vars",
+    f"{PACKAGE}.inputs_outputs",
+]
+
+
+class ImportTime(NamedTuple):
+    self_us: int
+    cumulative_us: int
+
+
+def import_times(module: str = PACKAGE) -> Dict[str, ImportTime]:
+    """Import `module` in a fresh interpreter and return import times of all imported modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = ImportTime(int(self_us), int(cumulative_us))
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default=PACKAGE)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    times = import_times(args.module)
+    print(f"{'cumulative, us':>15} {'self, us':>10}  module")
+    for name, time in sorted(times.items(), key=lambda item: -item[1].cumulative_us)[: args.top]:
+        print(f"{time.cumulative_us:>15} {time.self_us:>10}  {name}")
+
+
+if __name__ == "__main__":
+    main()
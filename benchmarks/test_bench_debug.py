@@ -0,0 +1,20 @@
+import io
+from contextlib import redirect_stdout
+
+import pytest
+
+PAYLOAD = {f"key{i}": list(range(20)) for i in range(100)}
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_debug_lazy_args(benchmark, action, enabled, monkeypatch):
+    """`debug()` with `%`-style args, that are formatted only if debug is enabled."""
+    monkeypatch.setenv("RUNNER_DEBUG", "1" if enabled else "0")
+    with redirect_stdout(io.StringIO()):
+        benchmark(action.debug, "Payload: %r", PAYLOAD)
+
+
+def test_debug_disabled_eager_fstring(benchmark, action, monkeypatch):
+    """The cost the lazy args avoid: building the message before the call."""
+    monkeypatch.delenv("RUNNER_DEBUG", raising=False)
+    benchmark(lambda: action.debug(f"Payload: {PAYLOAD!r}"))
@@ -0,0 +1,45 @@
+import glob
+from pathlib import Path
+
+import pytest
+
+from github_custom_actions.globs import clear_glob_cache, expand_globs
+
+
+@pytest.fixture(scope="module")
+def tree(tmp_path_factory):
+    """2k source files and 20k files in `node_modules` like in a typical JS monorepo."""
+    root = tmp_path_factory.mktemp("tree")
+    for top, packages in (("src", 20), ("node_modules", 200)):
+        for package in range(packages):
+            directory = root / top / f"pkg{package}" / "lib"
+            directory.mkdir(parents=True)
+            for index in range(100):
+                (directory / f"m{index}.py").write_text("")
+    return root
+
+
+def test_glob_stdlib(benchmark, tree):
+    def expand():
+        return [
+            Path(path)
+            for path in glob.glob(str(tree / "**/*.py"), recursive=True)
+            if "/node_modules/" not in path
+        ]
+
+    assert len(expand()) == 2_000
+    benchmark(expand)
+
+
+def test_expand_globs(benchmark, tree):
+    def expand():
+        clear_glob_cache()
+        return list(expand_globs(["**/*.py"], tree))
+
+    assert len(expand()) == 2_000
+    benchmark(expand)
+
+
+def test_expand_globs_cached(benchmark, tree):
+    list(expand_globs(["**/*.py"], tree))
+    benchmark(lambda: list(expand_globs(["**/*.py"], tree)))
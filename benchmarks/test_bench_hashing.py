@@ -0,0 +1,43 @@
+import hashlib
+
+import pytest
+
+from github_custom_actions.hashing import FileHasher
+
+from bench_helpers import KB, MB
+
+
+@pytest.fixture(scope="module")
+def files(tmp_path_factory):
+    """1000 files of 64 KB and 4 files of 16 MB."""
+    root = tmp_path_factory.mktemp("files")
+    paths = []
+    for index in range(1000):
+        path = root / f"small{index}"
+        path.write_bytes(bytes([index % 256]) * 64 * KB)
+        paths.append(path)
+    for index in range(4):
+        path = root / f"big{index}"
+        path.write_bytes(bytes([index]) * 16 * MB)
+        paths.append(path)
+    return paths
+
+
+def test_hash_sequential(benchmark, files):
+    def hash_all():
+        combined = hashlib.sha256()
+        for path in sorted(files):
+            combined.update(hashlib.sha256(path.read_bytes()).digest())
+        return combined.hexdigest()
+
+    benchmark(hash_all)
+
+
+def test_hash_parallel(benchmark, files):
+    benchmark(lambda: FileHasher().hash_files(files))
+
+
+def test_hash_cached(benchmark, files, tmp_path):
+    cache_path = tmp_path / "hashes.json"
+    FileHasher(cache_path).hash_files(files)
+    benchmark(lambda: FileHasher(cache_path).hash_files(files))
@@ -0,0 +1,25 @@
+import random
+import string
+
+import pytest
+
+from github_custom_actions.masking import SecretMasker
+
+from bench_helpers import MB
+
+
+def random_secret(rng):
+    return "".join(rng.choices(string.ascii_letters + string.digits, k=32))
+
+
+@pytest.mark.parametrize("secrets", [1, 100, 1_000])
+def test_mask(benchmark, secrets):
+    """Mask 1 MB of text with `secrets` registered secrets."""
+    rng = random.Random(secrets)
+    masker = SecretMasker()
+    for _ in range(secrets):
+        masker.add(random_secret(rng))
+    text = "".join(rng.choices(string.ascii_letters + " \n", k=MB))
+    masker.mask("warm up the compiled regexp")
+
+    benchmark(masker.mask, text)
@@ -0,0 +1,19 @@
+from jinja2 import DictLoader, Environment
+
+TEMPLATE = (
+    "### {{ inputs.my_input }}\n"
+    "{% for item in items %}| {{ item }} | {{ env.runner_os }} |\n{% endfor %}"
+)
+ITEMS = list(range(100))
+
+
+def test_render(benchmark, action):
+    """Render the same template string repeatedly."""
+    benchmark(action.render, TEMPLATE, items=ITEMS)
+
+
+def test_render_template(benchmark, action):
+    """Render the same template file repeatedly."""
+    action.environment = Environment(loader=DictLoader({"report.md": TEMPLATE}))  # noqa: S701
+
+    benchmark(action.render_template, "report.md", items=ITEMS)
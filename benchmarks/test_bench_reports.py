@@ -0,0 +1,67 @@
+import json
+import tracemalloc
+
+import pytest
+
+from github_custom_actions.annotations import AnnotationCollector
+from github_custom_actions.reports import iter_report
+
+RECORDS = 50_000
+
+
+@pytest.fixture(scope="module")
+def sarif_report(tmp_path_factory):
+    path = tmp_path_factory.mktemp("reports") / "report.sarif"
+    result = {
+        "level": "warning",
+        "message": {"text": "Line too long " + "x" * 100},
+        "ruleId": "E501",
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": "src/module.py"},
+                    "region": {"startLine": 1, "startColumn": 100},
+                }
+            }
+        ],
+    }
+    path.write_text(json.dumps({"runs": [{"tool": {}, "results": [result] * RECORDS}]}))
+    return path
+
+
+@pytest.fixture(scope="module")
+def junit_report(tmp_path_factory):
+    path = tmp_path_factory.mktemp("reports") / "junit.xml"
+    testcase = (
+        '<testcase classname="tests.test_module" name="test_{i}" file="tests/test_module.py"'
+        ' line="{i}"><failure message="assert False">trace</failure></testcase>'
+    )
+    path.write_text(
+        "<testsuites><testsuite>"
+        + "".join(testcase.format(i=i) for i in range(RECORDS))
+        + "</testsuite></testsuites>"
+    )
+    return path
+
+
+def ingest(path):
+    collector = AnnotationCollector()
+    for annotation in iter_report(path):
+        collector.add(*annotation)
+    return collector
+
+
+@pytest.mark.parametrize("report", ["sarif_report", "junit_report"])
+def test_ingest_report(benchmark, request, report):
+    """Ingest 50k findings, `extra_info` has the peak memory."""
+    path = request.getfixturevalue(report)
+
+    tracemalloc.start()
+    ingest(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["records"] = RECORDS
+    benchmark.extra_info["report_bytes"] = path.stat().st_size
+    benchmark.extra_info["peak_memory_bytes"] = peak
+
+    benchmark.pedantic(ingest, args=(path,), rounds=3)
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+from github_custom_actions.github_vars import GithubVars
+
+from bench_helpers import BenchAction, BenchInputs, BenchOutputs
+from importtime import MODULES, import_times
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import(benchmark, module):
+    """Cold start: a fresh interpreter importing `module`.
+
+    Per-module `-X importtime` numbers are saved to the benchmark `extra_info`.
+    """
+    times = import_times(module)
+    for name in MODULES:
+        if name in times:
+            benchmark.extra_info[name] = times[name].cumulative_us
+
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", f"import {module}"],),
+        kwargs={"check": True},
+        rounds=10,
+        warmup_rounds=1,
+    )
+
+
+def test_github_vars_init(benchmark):
+    benchmark(GithubVars)
+
+
+def test_inputs_init(benchmark, action_env):
+    benchmark(BenchInputs)
+
+
+def test_outputs_init(benchmark, action_env):
+    benchmark(BenchOutputs)
+
+
+def test_action_init(benchmark, action_env):
+    benchmark(BenchAction)
+
+
+def test_first_run(benchmark, action_env):
+    """`run()` of a freshly created action."""
+
+    class Action(BenchAction):
+        def main(self):
+            self.outputs.my_output = self.inputs.my_input
+            self.summary += self.render("### {{ inputs.another_input }}")
+
+    def setup():
+        return (Action(),), {}
+
+    benchmark.pedantic(lambda action: action.run(), setup=setup, rounds=100)
@@ -0,0 +1,30 @@
+import pytest
+
+from bench_helpers import KB, MB
+
+SUMMARY_SIZES = [KB, MB, 50 * MB]
+
+
+@pytest.mark.parametrize("size", SUMMARY_SIZES)
+def test_summary_append(benchmark, action, size):
+    """Append a line to the summary that already has `size` bytes, below the size limit."""
+    action.summary_limit = 2 * size
+    action.env.github_step_summary.write_text("x" * (size - 1) + "\n")
+
+    def append():
+        action.summary += "| a | b |\n"
+
+    benchmark.pedantic(append, rounds=10, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("policy", ["truncate", "drop", "spill"])
+def test_summary_append_overflow(benchmark, action, policy):
+    """Append a line to the summary that already exceeds the size limit."""
+    action.summary_limit = MB
+    action.summary_overflow = policy
+    action.env.github_step_summary.write_text("x" * (2 * MB - 1) + "\n")
+
+    def append():
+        action.summary += "| a | b |\n"
+
+    benchmark.pedantic(append, rounds=10, warmup_rounds=1)
@@ -0,0 +1,61 @@
+import pytest
+
+from github_custom_actions.file_attr_dict_vars import FileAttrDictVars
+
+from bench_helpers import BenchInputs
+
+OUTPUT_COUNTS = [10, 1_000, 100_000]
+
+
+def prefilled_vars(path, count):
+    path.write_text("\n".join(f"var{i}=value{i}" for i in range(count)))
+    return FileAttrDictVars(path)
+
+
+@pytest.mark.parametrize("count", OUTPUT_COUNTS)
+def test_output_write(benchmark, tmp_path, count):
+    """Set one output when the outputs file already has `count` outputs."""
+    output_vars = prefilled_vars(tmp_path / "output.txt", count)
+    output_vars["var0"] = "warm up the cache"
+
+    benchmark(output_vars.__setitem__, "new_var", "value")
+
+
+@pytest.mark.parametrize("count", OUTPUT_COUNTS)
+def test_output_load(benchmark, tmp_path, count):
+    """Read an output from the outputs file with `count` outputs."""
+    path = tmp_path / "output.txt"
+    prefilled_vars(path, count)
+
+    benchmark(lambda: FileAttrDictVars(path)["var0"])
+
+
+def test_input_first_access(benchmark, action_env):
+    benchmark(lambda: BenchInputs().my_input)
+
+
+def test_input_cached_access(benchmark, action_env):
+    inputs = BenchInputs()
+    assert inputs.my_input == "value1"
+
+    benchmark(lambda: inputs.my_input)
+
+
+def test_input_dict_access(benchmark, action_env):
+    inputs = BenchInputs()
+
+    benchmark(inputs.__getitem__, "my-input")
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_structured_output_dumps(benchmark, monkeypatch, backend):
+    """Encode a 1000-entry build matrix as compact JSON."""
+    from github_custom_actions import serializers
+
+    if backend == "json":
+        monkeypatch.setattr(serializers, "orjson", None)
+    elif serializers.orjson is None:
+        pytest.skip("orjson is not installed")
+    matrix = {"include": [{"os": f"os{i}", "python": ["3.8", "3.12"]} for i in range(1000)]}
+
+    benchmark(serializers.dumps, matrix)
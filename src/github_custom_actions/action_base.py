@@ -1,13 +1,68 @@
+import os
 import sys
 import traceback
+from contextlib import contextmanager
 from functools import partialmethod
 from pathlib import Path
-from typing import Any, Literal, Optional, Type, get_type_hints
-
-from jinja2 import Environment, FileSystemLoader, Template
-
-from github_custom_actions.github_vars import GithubVars
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    get_type_hints,
+)
+
+from jinja2 import Environment, Template
+
+from github_custom_actions.annotations import AnnotationCollector
+from github_custom_actions.event_payload import EventPayload
+from github_custom_actions.github_vars import GithubVars, runner_temp_dir, runner_tool_cache_dir
 from github_custom_actions.inputs_outputs import ActionInputs, ActionOutputs
+from github_custom_actions.masking import is_single_line, masker
+from github_custom_actions.problem_matchers import ProblemPattern, write_matcher
+from github_custom_actions.profiling import profiling_top
+from github_custom_actions.resources import (
+    RESOURCES_OUTPUT,
+    ResourceMonitor,
+    render_resources,
+    resources_enabled,
+    tracemalloc_top,
+)
+from github_custom_actions.step_summary import (
+    SUMMARY_SIZE_LIMIT,
+    StepSummaryProperty,
+    SummaryOverflow,
+)
+from github_custom_actions.tracing import (
+    span,
+    start_tracing,
+    stop_tracing,
+    tracing_active,
+    tracing_enabled,
+)
+from github_custom_actions.vars_storage import VarsStorage
+
+if TYPE_CHECKING:  # heavy modules are imported on use to keep the action start fast
+    from github_custom_actions.profiling import ProfileEntry
+    from github_custom_actions.reports import ReportFormat
+    from github_custom_actions.tools import Command, ToolResult
+
+_DATA_ESCAPES = (("%", "%25"), ("\r", "%0D"), ("\n", "%0A"))
+_PROPERTY_ESCAPES = _DATA_ESCAPES + ((":", "%3A"), (",", "%2C"))
+
+
+def _escape(value: str, escapes: Sequence[Sequence[str]]) -> str:
+    """Escape workflow command message or property value so the runner reads it back as is."""
+    for char, escaped in escapes:
+        value = value.replace(char, escaped)
+    return value
 
 
 class FileTextProperty:
@@ -84,21 +139,121 @@ class ActionBase:
     inputs: ActionInputs
     outputs: ActionOutputs
     env: GithubVars
+    annotations: AnnotationCollector
+
+    def __init__(self, *, outputs_storage: Optional[VarsStorage] = None) -> None:
+        """Initialize inputs, outputs according to the type than could be set in subclass.
+
+        `outputs_storage` is where to keep outputs instead of the `GITHUB_OUTPUT` file,
+        for example [MemoryStorage][github_custom_actions.vars_storage.MemoryStorage]
+        in tests or when actions exchange outputs in-process.
+        """
+        if tracing_enabled():
+            start_tracing()
+        with span("action.init", action=self.__class__.__name__):
+            types = self.get_type_hints()
+            self.inputs = types["inputs"]()
+            self.outputs = (
+                types["outputs"]() if outputs_storage is None else types["outputs"](outputs_storage)
+            )
+            self.env = GithubVars()
+            self.annotations = AnnotationCollector()
+
+    _type_hints_cache: Dict[type, Dict[str, Any]] = {}
+
+    @classmethod
+    def get_type_hints(cls) -> Dict[str, Any]:
+        """Type hints of the action class, resolved once per process."""
+        if cls not in cls._type_hints_cache:
+            cls._type_hints_cache[cls] = get_type_hints(cls)
+        return cls._type_hints_cache[cls]
+
+    summary = StepSummaryProperty("github_step_summary")
+
+    summary_limit: int = SUMMARY_SIZE_LIMIT
+    """Max size of the step summary in bytes."""
+
+    summary_overflow: SummaryOverflow = "truncate"
+    """What to do if the summary exceeds `summary_limit`: `truncate`, `drop` or `spill`.
+
+    See [StepSummaryProperty][github_custom_actions.step_summary.StepSummaryProperty]."""
 
-    def __init__(self) -> None:
-        """Initialize inputs, outputs according to the type than could be set in subclass."""
-        types = get_type_hints(self.__class__)
-        self.inputs = types["inputs"]()
-        self.outputs = types["outputs"]()
-        self.env = GithubVars()
-
-        base_dir = Path(__file__).resolve().parent
-        templates_dir = base_dir / "templates"
-        self.environment = Environment(  # noqa: S701
-            loader=FileSystemLoader(str(templates_dir)),
+    template_path: Optional[Sequence[Union[str, Path]]] = None
+    """Where `render_template()` looks for templates, see `get_template_path()`."""
+
+    templates_auto_reload: bool = False
+    """Check if the template files changed on each render, for development."""
+
+    _environment: Optional[Environment] = None
+
+    track_resources: bool = False
+    """Report resources used by `main()`, also switched on by `ACTION_RESOURCES` env var."""
+
+    def get_template_path(self) -> List[str]:
+        """Template search path: `template_path` or the default one.
+
+        Entries are directories, `package:<name>[/<dir>]` or `<archive>.zip[/<dir>]`.
+        By default the `templates` dirs in `GITHUB_ACTION_PATH` (the action repo),
+        this package and `GITHUB_WORKSPACE`.
+        The workspace is the checked out code, possibly from a pull request, so it is
+        searched last and cannot replace the templates of the action.
+        """
+        if self.template_path is not None:
+            return [str(entry) for entry in self.template_path]
+        from github_custom_actions.template_loader import (  # noqa: PLC0415
+            TEMPLATES_DIR,
+            default_search_path,
         )
 
-    summary = FileTextProperty("github_step_summary")
+        search_path = list(default_search_path(self._env_paths("github_action_path")))
+        search_path.extend(
+            str(Path(directory) / TEMPLATES_DIR)
+            for directory in self._env_paths("github_workspace")
+        )
+        return search_path
+
+    def _env_paths(self, *names: str) -> List[Path]:
+        """The `env` paths that are set."""
+        paths = []
+        for name in names:
+            try:
+                path = getattr(self.env, name)
+            except AttributeError:
+                continue
+            if path:
+                paths.append(path)
+        return paths
+
+    @property
+    def environment(self) -> Environment:
+        """Jinja environment of the template search path, built on the first render."""
+        if self._environment is None:
+            from github_custom_actions.template_loader import template_environment  # noqa: PLC0415
+
+            self._environment = template_environment(
+                tuple(self.get_template_path()),
+                self.templates_auto_reload,
+            )
+        return self._environment
+
+    @environment.setter
+    def environment(self, value: Environment) -> None:
+        self._environment = value
+
+    @property
+    def event(self) -> EventPayload:
+        """The webhook event payload from `env.github_event_path`.
+
+        Loaded lazily and cached per process.
+
+        Usage:
+        ```python
+        sha = self.event.get("pull_request.head.sha")
+        for commit in self.event.iter_items("commits"):
+            print(commit["message"])
+        ```
+        """
+        return EventPayload(self.env.github_event_path)
 
     def main(self) -> None:
         """Business logic of the action.
@@ -120,26 +275,148 @@ class ActionBase:
         ```
 
         `main()` is where you implement the business logic of your action.
+
+        If the environment variable `ACTION_PROFILE` is set to `true`, `main()` runs
+        under cProfile.
+        The full statistics are saved to `<RUNNER_TEMP>/<action class name>.pstats`
+        and the top functions (`ACTION_PROFILE_TOP`, 20 by default) are added to the summary.
+
+        If `track_resources` is True or the environment variable `ACTION_RESOURCES` is set to
+        `true`, the CPU time, peak memory, block I/O and bytes written by `main()` are added
+        to the summary and set as JSON to the output `resources`.
+        `ACTION_RESOURCES_TRACEMALLOC=<N>` also traces Python allocations and reports
+        the top N of them.
+
+        If the environment variable `ACTION_TRACE` is set to `true`, the spans of the action
+        phases (inputs validation, `main()`, rendering, outputs load and save) are written to
+        `<RUNNER_TEMP>/<action class name>.trace.json` to open in a trace viewer.
+
+        Before `main()` all inputs with `_fields` table (generated from `action.yml`) are
+        validated at once, and if any is missing or invalid, all the problems are reported
+        as error annotations and the action fails without calling `main()`.
+        Hand-written inputs classes without `_fields` are not validated.
+
+        After `main()` (even if it fails) the top annotations collected in `self.annotations`
+        are emitted, and the counts of all of them are added to the summary.
         """
         try:
-            self.main()
+            with span("action.run", action=self.__class__.__name__):
+                self._run_main()
+        finally:
+            if tracing_active():
+                stop_tracing(runner_temp_dir(self.env) / f"{self.__class__.__name__}.trace.json")
+
+    def _run_main(self) -> None:
+        """Validate inputs, call `main()` and report failure and annotations."""
+        try:
+            with span("inputs.validate"):
+                self._validate_inputs()
+            top = profiling_top()
+            with self._resources_tracked(), span("main"):
+                if top is None:
+                    self.main()
+                else:
+                    self._run_profiled(top)
         except Exception:  # noqa: BLE001
             traceback.print_exc(file=sys.stderr)
             sys.exit(1)
+        finally:
+            with span("annotations.flush"):
+                self._flush_annotations()
+
+    def _validate_inputs(self) -> None:
+        """Report all invalid inputs at once and exit."""
+        problems = self.inputs.validate_inputs()
+        if problems:
+            for problem in problems:
+                self.error_message(problem, title="Invalid input")
+            sys.exit(1)
+
+    def _flush_annotations(self) -> None:
+        """Emit collected annotations and add their counts to the summary, if it is set."""
+        if len(self.annotations):
+            self.annotations.emit(self.message)
+            if self._env_paths("github_step_summary"):
+                self.summary += self.annotations.render_summary()
+
+    @contextmanager
+    def _resources_tracked(self) -> Iterator[None]:
+        """Report resources used in the block to the summary and outputs, if switched on."""
+        if not (self.track_resources or resources_enabled()):
+            yield
+            return
+        files = {}
+        for name, var_name in (("outputs", "github_output"), ("summary", "github_step_summary")):
+            try:
+                files[name] = getattr(self.env, var_name)
+            except AttributeError:  # not set, like with outputs in `MemoryStorage`
+                continue
+        monitor = ResourceMonitor(files, tracemalloc_top=tracemalloc_top())
+        monitor.start()
+        try:
+            yield
+        finally:
+            usage = monitor.stop()
+            self.outputs[RESOURCES_OUTPUT] = usage._asdict()
+            if "summary" in files:
+                self.summary += render_resources(usage)
+
+    def _run_profiled(self, top: int) -> None:
+        """Run `main()` under profiler and report the hot functions to the summary."""
+        from github_custom_actions.profiling import profile_call, render_profile  # noqa: PLC0415
+
+        stats_file = runner_temp_dir(self.env) / f"{self.__class__.__name__}.pstats"
+
+        def report(entries: List["ProfileEntry"]) -> None:
+            if self._env_paths("github_step_summary"):
+                self.summary += render_profile(entries, stats_file)
+
+        profile_call(self.main, stats_file, top, on_stats=report)
+
+    @staticmethod
+    def add_mask(secret: str) -> None:
+        """Mask the secret in the log, summary, outputs and messages.
+
+        Emits `::add-mask::` for each line of the secret and its base64, URL and JSON
+        encodings, and registers them in the scrubber applied to everything the action writes.
+        A multiline secret is never emitted as a whole - the runner reads a command
+        as one line, so the rest of the lines would be printed to the log.
+
+        Usage:
+        ```python
+        self.add_mask(self.inputs.token)
+        ```
+        """
+        for value in masker.add(secret):
+            if is_single_line(value):
+                print(f"::add-mask::{_escape(value, _DATA_ESCAPES)}")
 
     @staticmethod
-    def debug(message: str):
+    def debug(message: Union[str, Callable[[], str]], *args: Any) -> None:
         """
         Emits a debug message. The runner needs to be invoked with enabled debug
         logging to show these.
 
+        If debug logging is not enabled (`env.runner_debug` is not set) this is a no-op,
+        so make the message lazy if it is expensive to build: pass `%`-style `args`
+        or a callable that returns the message.
+        They are formatted / called only if debug logging is enabled.
+
         Example usage:
 
         ```python
         self.debug("Action invoked.")
+        self.debug("Payload: %r", payload)
+        self.debug(lambda: f"Stats: {json.dumps(stats, indent=2)}")
         ```
         """
-        print(f"::debug::{message}")
+        if os.environ.get("RUNNER_DEBUG") != "1":
+            return
+        if callable(message):
+            message = message()
+        elif args:
+            message = message % args
+        print(f"::debug::{_escape(masker.mask(message), _DATA_ESCAPES)}")
 
     @staticmethod
     def message(  # noqa: PLR0913
@@ -179,18 +456,157 @@ class ActionBase:
         ```
 
         """
-        _locals = locals().copy()
+        properties = {
+            "title": title,
+            "file": file,
+            "line": line,
+            "column": column,
+            "end_line": end_line,
+            "end_column": end_column,
+        }
         parameters = ",".join(
-            f"{x}={value}"
-            for x in ("title", "file", "line", "column", "end_line", "end_column")
-            if (value := _locals[x]) is not None
+            f"{name}={_escape(masker.mask(str(value)), _PROPERTY_ESCAPES)}"
+            for name, value in properties.items()
+            if value is not None
         )
+        message = _escape(masker.mask(message), _DATA_ESCAPES)
         print(f"::{severity}{(' ' + parameters) if parameters else ''}::{message}")
 
     error_message = partialmethod(message, "error")
     notice_message = partialmethod(message, "notice")
     warning_message = partialmethod(message, "warning")
 
+    @contextmanager
+    def problem_matcher(
+        self,
+        owner: str,
+        *patterns: Union[str, ProblemPattern],
+        severity: Optional[Literal["error", "warning"]] = None,
+    ) -> Iterator[Path]:
+        """Let the runner turn tool output into annotations inside the `with` block.
+
+        Writes a problem matcher file under `env.runner_temp` and emits `::add-matcher::`
+        on enter and `::remove-matcher::` on exit.
+        Patterns are Python regexps with named groups `file`, `line`, `column`, `severity`,
+        `code`, `message` or [ProblemPattern][github_custom_actions.problem_matchers.ProblemPattern]
+        for multiline matchers.
+
+        So you do not have to parse the tool output in Python, just pass it through:
+
+        ```python
+        with self.problem_matcher(
+            "mypy",
+            r"^(?P<file>[^:]+):(?P<line>\\d+): (?P<severity>error|warning): (?P<message>.+)$",
+        ):
+            subprocess.run(["mypy", "src"])
+        ```
+        """
+        matcher_patterns = [
+            ProblemPattern.from_regex(pattern) if isinstance(pattern, str) else pattern
+            for pattern in patterns
+        ]
+        path = write_matcher(
+            runner_temp_dir(self.env) / f"{owner}-problem-matcher.json",
+            owner,
+            matcher_patterns,
+            severity,
+        )
+        print(f"::add-matcher::{path}", flush=True)
+        try:
+            yield path
+        finally:
+            print(f"::remove-matcher owner={owner}::", flush=True)
+
+    def run_tool(
+        self,
+        args: "Command",
+        pattern: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "ToolResult":
+        """Run the tool streaming its output to the log.
+
+        Memory is bounded: only the last lines are kept in the result `tail`.
+        Lines matched by `pattern` (a regexp with named groups `file`, `line`, `column`,
+        `severity`, `code`, `message`) are added to `self.annotations` as they come.
+
+        Other `kwargs` are passed to
+        [run_tool_async][github_custom_actions.tools.run_tool_async], for example
+        `check=True` to raise `subprocess.CalledProcessError` if the tool fails.
+
+        Usage:
+        ```python
+        result = self.run_tool(
+            ["ruff", "check", "src"],
+            pattern=r"^(?P<file>[^:]+):(?P<line>\\d+):\\d+: (?P<code>\\w+) (?P<message>.+)$",
+            severity="warning",
+        )
+        self.outputs["ruff-exit-code"] = result.returncode
+        ```
+        """
+        import asyncio  # noqa: PLC0415
+
+        from github_custom_actions.tools import run_tool_async  # noqa: PLC0415
+
+        return asyncio.run(
+            run_tool_async(args, pattern=pattern, annotations=self.annotations, **kwargs),
+        )
+
+    def run_tools(self, commands: List["Command"], **kwargs: Any) -> List["ToolResult"]:
+        """Run several tools concurrently, see `run_tool()`.
+
+        Output lines are prefixed with the tool name.
+        """
+        import asyncio  # noqa: PLC0415
+
+        from github_custom_actions.tools import run_tools_async  # noqa: PLC0415
+
+        return asyncio.run(run_tools_async(commands, annotations=self.annotations, **kwargs))
+
+    def ingest_report(
+        self,
+        path: Union[str, Path],
+        report_format: Optional["ReportFormat"] = None,
+    ) -> int:
+        """Add findings from a SARIF, JUnit or checkstyle report to `self.annotations`.
+
+        The report is streamed record by record, so it can be arbitrary big.
+        The format is detected by the file if `report_format` is not specified.
+        Returns the number of findings.
+
+        Usage:
+        ```python
+        self.ingest_report("ruff.sarif")
+        self.ingest_report("pytest.xml", "junit")
+        ```
+        """
+        from github_custom_actions.reports import iter_report  # noqa: PLC0415
+
+        count = 0
+        for annotation in iter_report(path, report_format):
+            self.annotations.add(*annotation)
+            count += 1
+        return count
+
+    def hash_files(self, *patterns: str) -> str:
+        """Key of the files content, like the workflow `hashFiles()` function.
+
+        `patterns` are globs relative to the workspace, `!pattern` excludes.
+        The files are expanded with [expand_globs][github_custom_actions.globs.expand_globs]
+        (so `.git`, `node_modules` and git-ignored files are skipped) and hashed in parallel.
+        Digests are cached by path, size and mtime under `runner_tool_cache`,
+        so unchanged files are not read again.
+
+        Usage:
+        ```python
+        self.outputs.cache_key = f"deps-{self.hash_files('**/requirements*.txt')}"
+        ```
+        """
+        from github_custom_actions.globs import expand_globs  # noqa: PLC0415
+        from github_custom_actions.hashing import HASH_CACHE_FILE, FileHasher  # noqa: PLC0415
+
+        hasher = FileHasher(runner_tool_cache_dir(self.env) / HASH_CACHE_FILE)
+        return hasher.hash_files(expand_globs(patterns))
+
     def render(self, template: str, **kwargs: Any) -> str:
         """Render the template from the string with Jinja.
 
@@ -204,15 +620,20 @@ class ActionBase:
         ```
 
         """
-        return Template(template.replace("\\n", "\n")).render(
-            env=self.env,
-            inputs=self.inputs,
-            outputs=self.outputs,
-            **kwargs,
-        )
+        with span("render"):
+            with span("template.compile"):
+                compiled = Template(template.replace("\\n", "\n"))
+            return compiled.render(
+                env=self.env,
+                inputs=self.inputs,
+                outputs=self.outputs,
+                **kwargs,
+            )
 
     def render_template(self, template_name: str, **kwargs: Any) -> str:
-        """Render template from the `templates` directory.
+        """Render template found in the template search path.
+
+        See [get_template_path][github_custom_actions.action_base.ActionBase.get_template_path].
 
         `template_name` is the name of the template file without the extension.
         `kwargs` are the template context variables.
@@ -224,10 +645,12 @@ class ActionBase:
         self.render_template("executor.json", image="ubuntu-latest")
         ```
         """
-        template = self.environment.get_template(template_name)
-        return template.render(
-            env=self.env,
-            inputs=self.inputs,
-            outputs=self.outputs,
-            **kwargs,
-        )
+        with span("render_template", template=template_name):
+            with span("template.load", template=template_name):
+                template = self.environment.get_template(template_name)
+            return template.render(
+                env=self.env,
+                inputs=self.inputs,
+                outputs=self.outputs,
+                **kwargs,
+            )
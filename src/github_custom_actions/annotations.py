@@ -0,0 +1,176 @@
+"""Collect annotations, emit only the most important ones and summarize the rest."""
+
+import heapq
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+SEVERITIES = ("error", "warning", "notice")
+MAX_ANNOTATIONS_PER_SEVERITY = 10
+"""GitHub shows at most 10 annotations of each severity per step."""
+MAX_GROUPS = 1000
+MAX_SEEN = 10_000
+"""Recent annotations remembered to skip duplicates."""
+MAX_SUMMARY_ROWS = 50
+OTHER_GROUP = ("(other)", "")
+
+
+class CollectedAnnotation(NamedTuple):
+    severity: str
+    message: str
+    title: Optional[str] = None
+    file: Optional[str] = None
+    line: Optional[int] = None
+    column: Optional[int] = None
+    end_line: Optional[int] = None
+    end_column: Optional[int] = None
+    rule: Optional[str] = None
+    priority: int = 0
+
+
+class AnnotationCollector:
+    """De-duplicate, rank and group annotations in bounded memory.
+
+    Only the `max_per_severity` annotations with the highest `priority` (the first added
+    win on ties) of each severity are kept to be emitted as workflow commands.
+    All others are only counted per (file, rule).
+    Duplicates are detected among the last `max_seen` distinct annotations.
+
+    Usage:
+        ```python
+        for finding in findings:
+            self.annotations.add(
+                "warning", finding.text, file=finding.path, line=finding.line, rule=finding.code
+            )
+        ```
+
+    `ActionBase.run()` emits the collected annotations and adds the counts table
+    to the summary after `main()`.
+    """
+
+    def __init__(
+        self,
+        max_per_severity: int = MAX_ANNOTATIONS_PER_SEVERITY,
+        max_groups: int = MAX_GROUPS,
+        max_seen: int = MAX_SEEN,
+    ) -> None:
+        """Init limits: annotations to emit per severity, (file, rule) groups to count,
+        and recent annotations to check for duplicates.
+        """
+        self.max_per_severity = max_per_severity
+        self.max_groups = max_groups
+        self.max_seen = max_seen
+        self._top: Dict[str, List[Tuple[int, int, CollectedAnnotation]]] = {
+            severity: [] for severity in SEVERITIES
+        }
+        self._seen: Dict[Tuple[Optional[object], ...], None] = {}
+        """Recent annotations, oldest first."""
+        self._groups: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._seq = 0
+        self.duplicates = 0
+
+    def add(  # noqa: PLR0913
+        self,
+        severity: str,
+        message: str,
+        title: Optional[str] = None,
+        file: Optional[str] = None,
+        line: Optional[int] = None,
+        column: Optional[int] = None,
+        end_line: Optional[int] = None,
+        end_column: Optional[int] = None,
+        rule: Optional[str] = None,
+        priority: int = 0,
+    ) -> None:
+        """Add an annotation. Duplicates (same severity, message and location) are ignored."""
+        if severity not in self._top:
+            raise ValueError(f"Unknown severity `{severity}`, expected one of {SEVERITIES}")
+        annotation = CollectedAnnotation(
+            severity,
+            message,
+            title,
+            file,
+            line,
+            column,
+            end_line,
+            end_column,
+            rule,
+            priority,
+        )
+        key = (severity, message, file, line, column, end_line, end_column, rule)
+        if key in self._seen:
+            del self._seen[key]
+            self._seen[key] = None
+            self.duplicates += 1
+            return
+        self._seen[key] = None
+        if len(self._seen) > self.max_seen:
+            del self._seen[next(iter(self._seen))]
+
+        group_key = (file or "", rule or "")
+        if group_key not in self._groups and len(self._groups) >= self.max_groups:
+            group_key = OTHER_GROUP
+        counts = self._groups.setdefault(group_key, dict.fromkeys(SEVERITIES, 0))
+        counts[severity] += 1
+
+        self._seq += 1
+        top = self._top[severity]
+        item = (priority, -self._seq, annotation)
+        if len(top) < self.max_per_severity:
+            heapq.heappush(top, item)
+        elif item > top[0]:
+            heapq.heapreplace(top, item)
+
+    def __len__(self) -> int:
+        return sum(sum(counts.values()) for counts in self._groups.values())
+
+    def top(self) -> List[CollectedAnnotation]:
+        """Annotations to emit: by severity, then by file and line."""
+        return [
+            annotation
+            for severity in SEVERITIES
+            for annotation in sorted(
+                (item[2] for item in self._top[severity]),
+                key=lambda a: (a.file or "", a.line or 0, a.column or 0),
+            )
+        ]
+
+    def emit(self, message: Callable[..., None]) -> None:
+        """Emit the top annotations with `message` like `ActionBase.message`."""
+        for annotation in self.top():
+            message(
+                annotation.severity,
+                annotation.message,
+                title=annotation.title,
+                file=annotation.file,
+                line=annotation.line,
+                column=annotation.column,
+                end_line=annotation.end_line,
+                end_column=annotation.end_column,
+            )
+
+    def render_summary(self, max_rows: int = MAX_SUMMARY_ROWS) -> str:
+        """Markdown table with annotation counts per file and rule."""
+        if not self._groups:
+            return ""
+        emitted = len(self.top())
+        lines = [
+            "\n### Annotations\n",
+            f"Shown {emitted} of {len(self)} annotations"
+            + (f", {self.duplicates} duplicates skipped" if self.duplicates else "")
+            + ".\n",
+            "| File | Rule | Errors | Warnings | Notices |",
+            "| --- | --- | ---: | ---: | ---: |",
+        ]
+        groups = sorted(self._groups.items(), key=lambda item: -sum(item[1].values()))
+        lines.extend(
+            f"| {_cell(file)} | {_cell(rule)} | {counts['error']} | {counts['warning']} "
+            f"| {counts['notice']} |"
+            for (file, rule), counts in groups[:max_rows]
+        )
+        if len(groups) > max_rows:
+            lines.append(f"\n{len(groups) - max_rows} more file / rule groups are not shown.")
+        return "\n".join(lines) + "\n"
+
+
+def _cell(text: str) -> str:
+    """Text safe to put in a markdown table cell."""
+    return text.replace("|", "&#124;").replace("\n", " ")
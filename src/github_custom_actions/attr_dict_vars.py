@@ -1,20 +1,50 @@
 import typing
-from typing import Any, Dict, Type
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Type
+
+
+class VarField(NamedTuple):
+    """Declared var description, generated from `action.yml` or written by hand."""
+
+    name: str
+    """Var name as in `action.yml`."""
+    type: Any = str
+    """Type the value is converted to: `str`, `Path`, `int`, `float` or `bool`."""
+    required: bool = False
+    default: Optional[str] = None
+    description: str = ""
+    pattern: Optional[str] = None
+    """Regexp the whole value should match."""
+    choices: Tuple[str, ...] = ()
+    """Allowed values, any value if empty."""
 
 
 class AttrDictVars:
     """Common base class for accessing variables as attributes or dict."""
 
-    _type_hints_cache: Dict[str, Dict[str, Type[Any]]] = {}
+    _type_hints_cache: Dict[type, Dict[str, Type[Any]]] = {}
+
+    _fields: Dict[str, VarField] = {}
+    """Precompiled attribute name -> field table.
+
+    Generated classes define it, so the declared vars are taken from the table
+    instead of the class annotations reflection.
+    """
 
     @classmethod
     def get_type_hints(cls) -> Dict[str, Any]:
-        class_name = cls.__name__
-        if class_name not in cls._type_hints_cache:
-            cls._type_hints_cache[class_name] = typing.get_type_hints(cls)
-        return cls._type_hints_cache[class_name]
+        if cls not in cls._type_hints_cache:
+            if "_fields" in cls.__dict__:
+                cls._type_hints_cache[cls] = {
+                    attr: field.type for attr, field in cls._fields.items()
+                }
+            else:
+                cls._type_hints_cache[cls] = typing.get_type_hints(cls)
+        return cls._type_hints_cache[cls]
 
     def _attr_to_var_name(self, name: str) -> str:
+        field = self._fields.get(name)
+        if field is not None:
+            return field.name
         return name.replace("_", "-")
 
     def _external_name(self, name: str) -> str:
@@ -0,0 +1,198 @@
+"""Generate typed `ActionInputs` / `ActionOutputs` subclasses from `action.yml`.
+
+The generated classes have precompiled field tables (`_fields`), so at runtime the
+declared vars are taken from the table instead of the class annotations reflection.
+
+Usage:
+```bash
+python -m github_custom_actions.codegen action.yml -o action_io.py --path report-file
+python -m github_custom_actions.codegen action.yml -o action_io.py --check  # in CI
+```
+
+`--check` does not write anything and fails if the file differs from what `action.yml`
+generates, so the YAML and the classes cannot drift apart.
+
+Reading `action.yml` needs PyYAML (`pip install github-custom-actions[codegen]`).
+"""
+
+import argparse
+import difflib
+import json
+import keyword
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from github_custom_actions.attr_dict_vars import AttrDictVars, VarField
+
+
+def load_action_yml(path: Union[str, Path]) -> Dict[str, Any]:
+    """Parse `action.yml`."""
+    try:
+        import yaml  # noqa: PLC0415  # optional dependency
+    except ImportError as exc:
+        raise ImportError(
+            "Reading action.yml requires PyYAML: pip install github-custom-actions[codegen]",
+        ) from exc
+    return yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+
+
+def attr_name(name: str) -> str:
+    """Python attribute name for the `action.yml` input / output name."""
+    attr = name.replace("-", "_")
+    if keyword.iskeyword(attr):
+        attr += "_"
+    if not attr.isidentifier():
+        raise ValueError(f"`{name}` cannot be converted to a Python attribute name")
+    return attr
+
+
+def action_fields(
+    action: Dict[str, Any],
+    path_vars: Iterable[str] = (),
+) -> Tuple[Dict[str, VarField], Dict[str, VarField]]:
+    """Input and output field tables of the parsed `action.yml`.
+
+    `path_vars` are the names of the vars with `Path` values.
+    """
+    path_vars = set(path_vars)
+
+    def fields(section: str) -> Dict[str, VarField]:
+        result = {}
+        for name, spec in (action.get(section) or {}).items():
+            props = spec or {}
+            default = props.get("default")
+            result[attr_name(name)] = VarField(
+                name=name,
+                type=Path if name in path_vars else str,
+                required=bool(props.get("required", False)),
+                default=None if default is None else _yaml_str(default),
+                description=str(props.get("description", "")).strip(),
+            )
+        return result
+
+    return fields("inputs"), fields("outputs")
+
+
+def _yaml_str(value: Any) -> str:
+    """Env value the runner sets for the YAML scalar."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def render_module(
+    inputs: Dict[str, VarField],
+    outputs: Dict[str, VarField],
+    *,
+    inputs_class: str = "Inputs",
+    outputs_class: str = "Outputs",
+    source: str = "action.yml",
+) -> str:
+    """Python source of the module with the inputs and outputs classes."""
+    all_fields = list(inputs.values()) + list(outputs.values())
+    lines = [
+        f'"""Inputs and outputs of `{source}`.',
+        "",
+        "Generated by `python -m github_custom_actions.codegen`, do not edit.",
+        '"""',
+        "",
+    ]
+    if any(field.type is Path for field in all_fields):
+        lines += ["from pathlib import Path", ""]
+    lines += [
+        "from github_custom_actions.attr_dict_vars import VarField",
+        "from github_custom_actions.inputs_outputs import ActionInputs, ActionOutputs",
+    ]
+    lines += _render_class(inputs_class, "ActionInputs", inputs)
+    lines += _render_class(outputs_class, "ActionOutputs", outputs)
+    return "\n".join(lines) + "\n"
+
+
+def _render_class(name: str, base: str, fields: Dict[str, VarField]) -> List[str]:
+    lines = ["", "", f"class {name}({base}):"]
+    for attr, field in fields.items():
+        lines.append(f"    {attr}: {field.type.__name__}")
+        if field.description:
+            description = field.description.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append('    """{}"""'.format(description.replace("\n", "\n    ")))
+        lines.append("")
+    lines.append("    _fields = {  # noqa: RUF012")
+    for attr, field in fields.items():
+        args = [json.dumps(field.name)]
+        if field.type is not str:
+            args.append(f"type={field.type.__name__}")
+        if field.required:
+            args.append("required=True")
+        if field.default is not None:
+            args.append(f"default={json.dumps(field.default)}")
+        lines.append(f'        "{attr}": VarField({", ".join(args)}),')
+    lines.append("    }")
+    return lines
+
+
+def check_class(vars_class: Type[AttrDictVars], fields: Dict[str, VarField]) -> List[str]:
+    """Differences between the class and the `action.yml` field table.
+
+    Works for hand-written classes too: without `_fields` table only the names are checked.
+    Empty list if the class is in sync.
+    """
+    problems = []
+    declared = [attr for attr in vars_class.get_type_hints() if not attr.startswith("_")]
+    for attr in fields:
+        if attr not in declared:
+            problems.append(f"{vars_class.__name__}.{attr} is missing")
+    for attr in declared:
+        if attr not in fields:
+            problems.append(f"{vars_class.__name__}.{attr} is not in action.yml")
+    table = vars_class._fields  # noqa: SLF001
+    for attr, field in fields.items():
+        if attr in table and table[attr][:4] != field[:4]:
+            problems.append(
+                f"{vars_class.__name__}.{attr} is {table[attr]!r}, action.yml has {field!r}",
+            )
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m github_custom_actions.codegen")
+    parser.add_argument("action_yml", type=Path, help="Path to action.yml")
+    parser.add_argument("-o", "--output", type=Path, help="Module to write, stdout if not set")
+    parser.add_argument("--path", action="append", default=[], help="Var with Path values")
+    parser.add_argument("--inputs-class", default="Inputs")
+    parser.add_argument("--outputs-class", default="Outputs")
+    parser.add_argument("--check", action="store_true", help="Fail if the module is outdated")
+    args = parser.parse_args(argv)
+
+    inputs, outputs = action_fields(load_action_yml(args.action_yml), args.path)
+    source = render_module(
+        inputs,
+        outputs,
+        inputs_class=args.inputs_class,
+        outputs_class=args.outputs_class,
+        source=args.action_yml.name,
+    )
+    if args.check:
+        if args.output is None:
+            parser.error("--check requires --output")
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else ""
+        if current == source:
+            return 0
+        sys.stderr.writelines(
+            difflib.unified_diff(
+                current.splitlines(keepends=True),
+                source.splitlines(keepends=True),
+                str(args.output),
+                f"generated from {args.action_yml}",
+            ),
+        )
+        return 1
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        args.output.write_text(source, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,45 @@
 import os
+import re
 import typing
 from pathlib import Path
-from typing import Any
+from typing import Any, List
 
 from github_custom_actions.attr_dict_vars import AttrDictVars
 
+BOOL_VALUES = {"true": True, "false": False}
+
+
+def _is_text(type_hint: Any) -> bool:
+    return isinstance(type_hint, type) and issubclass(type_hint, str)
+
+
+def convert_text(value: str, type_hint: Any) -> Any:
+    """Convert the env var string for a var declared only by the type hint.
+
+    Empty `Path` is None, `str` subclasses (like `GlobPattern`) are created from the value,
+    other types are left as the string.
+    """
+    if type_hint is Path:
+        return Path(value) if value else None
+    if _is_text(type_hint):
+        return type_hint(value)  # like `GlobPattern`
+    return value
+
+
+def convert_value(value: str, type_hint: Any) -> Any:
+    """Convert the env var string of a `_fields` var, raise `ValueError` if it is not valid.
+
+    In addition to `convert_text()`, `int` and `float` are parsed and `bool` is
+    `true` or `false` in any case like YAML booleans.
+    """
+    if type_hint is bool:
+        if value.lower() not in BOOL_VALUES:
+            raise ValueError(f"`{value}` is not `true` or `false`")
+        return BOOL_VALUES[value.lower()]
+    if type_hint in (int, float):
+        return type_hint(value)
+    return convert_text(value, type_hint)
+
 
 class EnvAttrDictVars(AttrDictVars):
     """Dual access env vars.
@@ -39,18 +74,54 @@ class EnvAttrDictVars(AttrDictVars):
             if name not in type_hints:
                 raise AttributeError(f"Unknown {name}") from exc
             env_var_name = self._external_name(self._attr_to_var_name(name))
-            if env_var_name in os.environ:
-                value: typing.Optional[typing.Union[str, Path]] = os.environ[env_var_name]
-
-                # If the type hint is Path, convert the value to Path
-                if type_hints[name] is Path:
-                    value = Path(value) if value else None
+            raw_value = os.environ.get(env_var_name)
+            field = self._fields.get(name)
+            if raw_value is None and field is not None:
+                raw_value = field.default  # as the runner does with action.yml
+            if raw_value == "" and field is not None and not _is_text(field.type):
+                # the runner sets empty values for inputs without default
+                raw_value = field.default or None
+                if raw_value is None:
+                    self.__dict__[name] = None
+                    return None
+            if raw_value is not None:
+                convert = convert_value if field is not None else convert_text
+                value = convert(raw_value, type_hints[name])
                 self.__dict__[name] = value
                 return value
             raise AttributeError(
                 f"`{name}` ({env_var_name}) not found in environment variables",
             ) from exc
 
+    def validate_inputs(self) -> List[str]:
+        """Check all vars of the `_fields` table at once, return the problems.
+
+        Vars declared only by type hints have no `required` flag or constraints to check.
+
+        Checks `required`, the type conversion, `pattern` and `choices`.
+        Empty values of not required vars are not checked, the runner sets them
+        for inputs without default.
+        Reading such a var of not `str` type gives its default, or None without it.
+        """
+        problems = []
+        for field in self._fields.values():
+            env_var_name = self._external_name(field.name)
+            value = os.environ.get(env_var_name, field.default)
+            if not value:
+                if field.required:
+                    problems.append(f"`{field.name}` ({env_var_name}) is required")
+                continue
+            try:
+                convert_value(value, field.type)
+            except ValueError as exc:
+                problems.append(f"`{field.name}` is not a valid {field.type.__name__}: {exc}")
+            if field.pattern is not None and re.fullmatch(field.pattern, value) is None:
+                problems.append(f"`{field.name}` `{value}` does not match `{field.pattern}`")
+            if field.choices and value not in field.choices:
+                choices = ", ".join(f"`{choice}`" for choice in field.choices)
+                problems.append(f"`{field.name}` `{value}` is not one of {choices}")
+        return problems
+
     def __getitem__(self, key: str) -> Any:
         env_var_name = self._external_name(key)
         if env_var_name in os.environ:
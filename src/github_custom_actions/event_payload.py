@@ -0,0 +1,99 @@
+"""Lazy access to the webhook event payload (`GITHUB_EVENT_PATH`)."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Union
+
+from github_custom_actions.json_stream import JsonScanner
+
+_MISSING = object()
+
+_text_cache: Dict[str, str] = {}
+_data_cache: Dict[str, Any] = {}
+
+
+def clear_cache() -> None:
+    """Forget cached payloads, so they are re-read from the files."""
+    _text_cache.clear()
+    _data_cache.clear()
+
+
+class EventPayload:
+    """The webhook event payload that triggered the workflow.
+
+    Loaded lazily and cached per process.
+
+    Usage:
+        ```python
+        sha = action.event.get("pull_request.head.sha")
+        number = action.event["number"]
+        for commit in action.event.iter_items("commits"):
+            print(commit["id"])
+        ```
+
+    `get()` and `iter_items()` never build the whole payload: they stop as soon as the
+    target is found, and values before it are decoded one by one and dropped.
+    `data` and `[]` parse the whole payload once.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Init with the path to the event payload file."""
+        self.path = Path(path)
+
+    @property
+    def text(self) -> str:
+        """Raw JSON text of the payload."""
+        key = str(self.path)
+        if key not in _text_cache:
+            _text_cache[key] = self.path.read_text(encoding="utf-8")
+        return _text_cache[key]
+
+    @property
+    def data(self) -> Any:
+        """Whole payload as Python objects."""
+        key = str(self.path)
+        if key not in _data_cache:
+            _data_cache[key] = json.loads(self.text)
+        return _data_cache[key]
+
+    def __getitem__(self, key: str) -> Any:
+        return self.data[key]
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Get the value by dot-separated path like `pull_request.head.sha` or `commits.0.id`.
+
+        Returns `default` if there is no such value.
+        """
+        parts = path.split(".")
+        if str(self.path) in _data_cache:
+            value = _get_by_path(self.data, parts)
+            return default if value is _MISSING else value
+        scanner = JsonScanner(self.text)
+        try:
+            scanner.locate(parts)
+        except KeyError:
+            return default
+        return scanner.decode()
+
+    def iter_items(self, path: str) -> Iterator[Any]:
+        """Iterate over the array at `path` decoding one item at a time.
+
+        Does not build the whole array, so it is suitable for big arrays like push `commits`.
+        """
+        scanner = JsonScanner(self.text)
+        scanner.locate(path.split(".") if path else [])
+        if scanner.char != "[":
+            raise TypeError(f"`{path}` in the event payload is not an array")
+        for _ in scanner.iter_array():
+            yield scanner.decode()
+
+
+def _get_by_path(data: Any, parts: List[str]) -> Any:
+    for part in parts:
+        if isinstance(data, dict) and part in data:
+            data = data[part]
+        elif isinstance(data, list) and part.isdigit() and int(part) < len(data):
+            data = data[int(part)]
+        else:
+            return _MISSING
+    return data
@@ -1,8 +1,95 @@
+import dataclasses
+import os
+import re
+import sys
+import uuid
 from collections.abc import MutableMapping
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import IO, Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
 
 from github_custom_actions.attr_dict_vars import AttrDictVars
+from github_custom_actions.masking import masker
+from github_custom_actions.serializers import Codec, compile_codecs, dumps
+from github_custom_actions.tracing import span
+from github_custom_actions.vars_storage import FileStorage, VarsStorage
+
+HEREDOC_RE = re.compile(r"^([^=]+)<<(.+)$")
+COPY_BUFSIZE = 1024 * 1024
+
+
+class FileValue(NamedTuple):
+    """Reference to a file which content is the var value.
+
+    Returned by `FileAttrDictVars.set_from_file()`.
+    The content is streamed to the vars file once and is never loaded to memory.
+    """
+
+    path: Path
+    delimiter: str
+
+    def read_text(self, encoding: str = "utf-8") -> str:
+        """Read the value. Loads the whole file to memory."""
+        return self.path.read_text(encoding=encoding)
+
+
+def iter_vars(content: str) -> Iterator[Tuple[str, str]]:
+    """Parse `name=value` lines and multiline `name<<DELIMITER` blocks."""
+    lines = iter(content.splitlines())
+    for line in lines:
+        heredoc = HEREDOC_RE.match(line)
+        if heredoc:
+            name, delimiter = heredoc.groups()
+            value_lines = []
+            for value_line in lines:
+                if value_line == delimiter:
+                    break
+                value_lines.append(value_line)
+            yield name, "\n".join(value_lines)
+        elif "=" in line:
+            name, value = line.split("=", 1)
+            yield name, value
+
+
+def _heredoc_delimiter() -> str:
+    return f"ghadelimiter_{uuid.uuid4()}"
+
+
+def _stream_file(src: Path, dst: IO[bytes]) -> Tuple[int, bool]:
+    """Copy `src` content to `dst` without loading it to memory.
+
+    Uses `os.sendfile()` on Linux so the data is copied in the kernel.
+    Returns the number of bytes copied and if the content ends with a newline.
+    """
+    dst.flush()
+    with src.open("rb") as src_file:
+        size = os.fstat(src_file.fileno()).st_size
+        copied = 0
+        if sys.platform.startswith("linux") and _has_fileno(dst):
+            while copied < size:
+                sent = os.sendfile(dst.fileno(), src_file.fileno(), copied, size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            dst.seek(0, os.SEEK_END)  # sync the file object position with the fd
+        else:
+            while copied < size:
+                chunk = src_file.read(min(COPY_BUFSIZE, size - copied))
+                if not chunk:
+                    break
+                dst.write(chunk)
+                copied += len(chunk)
+        if copied == 0:
+            return 0, False
+        src_file.seek(copied - 1)
+        return copied, src_file.read(1) == b"\n"
+
+
+def _has_fileno(file: IO[bytes]) -> bool:
+    try:
+        file.fileno()
+    except (AttributeError, OSError):  # io.UnsupportedOperation is OSError
+        return False
+    return True
 
 
 class FileAttrDictVars(AttrDictVars, MutableMapping):  # type: ignore
@@ -15,6 +102,9 @@ class FileAttrDictVars(AttrDictVars, MutableMapping):  # type: ignore
     with dict-like access you can access any var.
     This way you can find your balance between strictly defined vars and flexibility.
 
+    The vars are kept in a file, or in another `VarsStorage` backend,
+    like `MemoryStorage` for tests and in-process pipelines.
+
     Usage:
        class MyVars(FileAttrDictVars):
            documented_var: str
@@ -33,13 +123,34 @@ class FileAttrDictVars(AttrDictVars, MutableMapping):  # type: ignore
 
     Attribute access also uses `_attr_to_var_name()` - by default it converts Python attribute names
     from snake_case to kebab-case.
+
+    Big values can be set from a file with `set_from_file()`, that streams the file content
+    to the vars file as a multiline `name<<DELIMITER` block.
+    The blocks are kept at the beginning of the vars file and are written once,
+    later writes rewrite only the `key=value` lines after them.
+
+    Secrets registered with `ActionBase.add_mask()` are masked in the written values,
+    except the values streamed from files.
     """
 
-    def __init__(self, vars_file: Path, *, prefix: str = "") -> None:
-        """Init the vars file and prefix."""
+    def __init__(self, vars_file: Union[Path, VarsStorage], *, prefix: str = "") -> None:
+        """Init the vars file (or other storage backend) and prefix."""
         self._external_name_prefix = prefix
-        self._vars_file: Path = vars_file
+        self._storage: VarsStorage = (
+            vars_file if isinstance(vars_file, VarsStorage) else FileStorage(vars_file)
+        )
         self._var_keys_cache: Optional[Dict[str, Any]] = None
+        self._blocks_end = 0
+        """Size of the `set_from_file()` blocks at the beginning of the storage, bytes."""
+
+    _codecs_cache: Dict[type, Dict[str, Codec]] = {}
+
+    @classmethod
+    def get_codecs(cls) -> Dict[str, Codec]:
+        """JSON codecs of the structured vars, compiled once per class."""
+        if cls not in cls._codecs_cache:
+            cls._codecs_cache[cls] = compile_codecs(cls.get_type_hints())
+        return cls._codecs_cache[cls]
 
     def _external_name(self, name: str) -> str:
         """Convert variable name to the external form."""
@@ -55,26 +166,38 @@ class FileAttrDictVars(AttrDictVars, MutableMapping):  # type: ignore
         except AttributeError as exc:
             type_hints = self.__class__.get_type_hints()
             if name in type_hints:
-                var_name = self._attr_to_var_name(name)
-                value = self[var_name]
-                self.__dict__[var_name] = value
+                value = self[self._attr_to_var_name(name)]
+                codec = self.__class__.get_codecs().get(name)
+                if codec is not None and isinstance(value, str) and value:
+                    return codec.decode(value)
                 return value
             raise AttributeError(f"Unknown {name}") from exc
 
     def __getitem__(self, key: str) -> Any:
         try:
-            return self._get_var_keys[key]
+            value = self._get_var_keys[key]
         except KeyError:
             self._get_var_keys[key] = ""
             self._save_var_file()
-            print(f"Variable `{key}` not found in `{self._vars_file}`")
+            print(f"Variable `{key}` not found in `{self._storage}`")
             return ""
+        if isinstance(value, FileValue):
+            return self._stored_values()[self._external_name(key)]
+        return value
+
+    def _stored_values(self) -> Dict[str, str]:
+        """All values in the storage by external names, loads the file values to memory."""
+        return dict(iter_vars(self._storage.read_text()))
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Access dict-style.
 
         vars["key"] = "value"
         """
+        if isinstance(value, (dict, list)) or (
+            dataclasses.is_dataclass(value) and not isinstance(value, type)
+        ):
+            value = dumps(value)
         value_str = str(value)
         if "\n" in value_str or "\r" in value_str:
             raise ValueError(
@@ -84,6 +207,32 @@ class FileAttrDictVars(AttrDictVars, MutableMapping):  # type: ignore
         self._get_var_keys[key] = value
         self._save_var_file()
 
+    def set_from_file(self, key: str, path: Union[str, Path]) -> FileValue:
+        """Set the var `key` to the content of the file `path`.
+
+        The file is not loaded to memory - the content is streamed to the vars file once,
+        so the file can be changed or deleted after that.
+        Reading the var loads the value from the vars file.
+
+        Usage:
+            ```python
+            action.outputs.set_from_file("sbom", Path("sbom.json"))
+            ```
+        """
+        path = Path(path)
+        value = FileValue(path, _heredoc_delimiter())
+        var_keys = self._get_var_keys
+        with self._storage.open_tail(self._blocks_end) as vars_file:
+            header = f"{self._external_name(key)}<<{value.delimiter}\n".encode()
+            vars_file.write(header)
+            copied, newline = _stream_file(path, vars_file)
+            footer = (b"" if newline else b"\n") + f"{value.delimiter}\n".encode()
+            vars_file.write(footer)
+        self._blocks_end += len(header) + copied + len(footer)
+        var_keys[key] = value
+        self._save_var_file()
+        return value
+
     def __setattr__(self, name: str, value: Any) -> None:
         """Access attribute-style.
 
@@ -93,14 +242,27 @@ class FileAttrDictVars(AttrDictVars, MutableMapping):  # type: ignore
         if not name.startswith("_"):
             if name not in type_hints:
                 raise AttributeError(f"Unknown {name}")
+            codec = self.__class__.get_codecs().get(name)
+            if codec is not None and not isinstance(value, str):  # str is already encoded
+                value = codec.encode(value)
             self[self._attr_to_var_name(name)] = value
         else:
             super().__setattr__(name, value)
 
     def __delitem__(self, key: str) -> None:
-        del self._get_var_keys[key]
+        value = self._get_var_keys.pop(key)
+        if isinstance(value, FileValue):
+            self._inline_blocks()
         self._save_var_file()
 
+    def _inline_blocks(self) -> None:
+        """Load the `set_from_file()` values to memory, so the whole storage is rewritten."""
+        stored = self._stored_values()
+        for key, value in self._get_var_keys.items():
+            if isinstance(value, FileValue):
+                self._get_var_keys[key] = stored[self._external_name(key)]
+        self._blocks_end = 0
+
     def __iter__(self) -> Iterator[str]:
         return iter(self._get_var_keys)
 
@@ -114,19 +276,32 @@ class FileAttrDictVars(AttrDictVars, MutableMapping):  # type: ignore
     def _get_var_keys(self) -> Dict[str, Any]:
         """Load key-value pairs from a file, returning {} if the file does not exist."""
         if self._var_keys_cache is None:
-            try:
-                content = self._vars_file.read_text(encoding="utf-8")
-                self._var_keys_cache = {
-                    self._name_from_external(k): v
-                    for k, v in (line.split("=", 1) for line in content.splitlines() if "=" in line)
-                }
-            except FileNotFoundError:
-                self._var_keys_cache = {}
+            with span("vars.load", storage=self._storage):
+                try:
+                    content = self._storage.read_text()
+                    self._var_keys_cache = {
+                        self._name_from_external(k): v for k, v in iter_vars(content)
+                    }
+                except FileNotFoundError:
+                    self._var_keys_cache = {}
         return self._var_keys_cache
 
     def _save_var_file(self) -> None:
-        self._vars_file.parent.mkdir(parents=True, exist_ok=True)
-        lines: List[str] = [
-            f"{self._external_name(key)}={value}" for key, value in self._get_var_keys.items()
-        ]
-        self._vars_file.write_text("\n".join(lines), encoding="utf-8")
+        """Rewrite the `key=value` lines after the `set_from_file()` blocks."""
+        with span("vars.save", storage=self._storage), self._storage.open_tail(
+            self._blocks_end,
+        ) as vars_file:
+            first = True
+            for key, value in self._get_var_keys.items():
+                if isinstance(value, FileValue):  # already in the blocks
+                    continue
+                if not first:
+                    vars_file.write(b"\n")
+                first = False
+                name = self._external_name(key)
+                value_str = masker.mask(str(value))
+                if "\n" in value_str:  # multiline value loaded from the file
+                    delimiter = _heredoc_delimiter()
+                    vars_file.write(f"{name}<<{delimiter}\n{value_str}\n{delimiter}".encode())
+                else:
+                    vars_file.write(f"{name}={value_str}".encode())
@@ -1,3 +1,4 @@
+import tempfile
 from pathlib import Path
 
 from github_custom_actions.env_attr_dict_vars import EnvAttrDictVars
@@ -234,3 +235,19 @@ class GithubVars(EnvAttrDictVars):
     """The path to the directory containing preinstalled tools for GitHub-hosted runners.
     For more information, see "Using GitHub-hosted runners".
     For example, C:\\hostedtoolcache\\windows"""
+
+
+def runner_temp_dir(env: GithubVars) -> Path:
+    """`env.runner_temp`, or the system temp dir if it is not set (running outside of GitHub)."""
+    try:
+        return env.runner_temp or Path(tempfile.gettempdir())
+    except AttributeError:
+        return Path(tempfile.gettempdir())
+
+
+def runner_tool_cache_dir(env: GithubVars) -> Path:
+    """`env.runner_tool_cache`, or the system temp dir if it is not set (outside of GitHub)."""
+    try:
+        return Path(env.runner_tool_cache or tempfile.gettempdir())
+    except AttributeError:
+        return Path(tempfile.gettempdir())
@@ -0,0 +1,291 @@
+"""Parallel expansion of glob patterns in the workspace.
+
+Directories are scanned with `os.scandir` in a thread pool, `.git`, `node_modules`
+and everything ignored by `.gitignore` files are pruned without descending into them,
+and the matched files are yielded as soon as their directory is scanned.
+Symlinks to directories are not followed.
+"""
+
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Pattern, Sequence, Set, Tuple, Union
+
+DEFAULT_EXCLUDES = ("**/.git", "**/node_modules")
+GLOB_WORKERS = 16
+
+_MAGIC_RE = re.compile(r"[*?\[]")
+
+
+class _Expansion(NamedTuple):
+    """Cached expansion with the mtimes of the scanned directories to validate it."""
+
+    files: List[Path]
+    mtimes: Dict[str, int]
+
+
+_expansions: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...], bool], _Expansion] = {}
+
+
+def glob_regex(pattern: str) -> str:
+    """Regexp for the glob pattern matched against a relative posix path.
+
+    `**` matches any number of directories, `*` and `?` do not match `/`.
+    """
+    result = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith("**/", index):
+            result.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            result.append(".*")
+            index += 2
+        elif pattern[index] == "*":
+            result.append("[^/]*")
+            index += 1
+        elif pattern[index] == "?":
+            result.append("[^/]")
+            index += 1
+        elif pattern[index] == "[" and "]" in pattern[index + 2 :]:
+            end = pattern.index("]", index + 2)
+            chars = pattern[index + 1 : end]
+            if chars.startswith("!"):
+                chars = "^" + chars[1:]
+            result.append("[{}]".format(chars.replace("\\", "\\\\")))
+            index = end + 1
+        else:
+            result.append(re.escape(pattern[index]))
+            index += 1
+    return "".join(result)
+
+
+def _compile(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{glob_regex(pattern.strip('/'))})" for pattern in patterns))
+
+
+class IgnoreRule(NamedTuple):
+    """One line of a `.gitignore` file."""
+
+    regexp: Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def gitignore_rules(text: str, base: str = "") -> List[IgnoreRule]:
+    """Rules of the `.gitignore` file in the directory `base` (relative posix path)."""
+    rules = []
+    prefix = re.escape(f"{base}/") if base else ""
+    for raw_line in text.splitlines():
+        line = raw_line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line  # a slash at the beginning or in the middle
+        regexp = prefix + ("" if anchored else "(?:.*/)?") + glob_regex(line.lstrip("/"))
+        rules.append(IgnoreRule(re.compile(regexp), negate, dir_only))
+    return rules
+
+
+def is_ignored(rules: Sequence[IgnoreRule], path: str, is_dir: bool) -> bool:
+    """If the relative posix path is ignored by the rules, the last matching rule wins."""
+    ignored = False
+    for rule in rules:
+        if (is_dir or not rule.dir_only) and rule.regexp.fullmatch(path):
+            ignored = not rule.negate
+    return ignored
+
+
+def _literal_base(pattern: str) -> str:
+    """Leading directories of the pattern without glob magic."""
+    parts = pattern.strip("/").split("/")[:-1]
+    base = []
+    for part in parts:
+        if _MAGIC_RE.search(part):
+            break
+        base.append(part)
+    return "/".join(base)
+
+
+def _read_rules(root: Path, rel_dir: str) -> List[IgnoreRule]:
+    try:
+        text = (root / rel_dir / ".gitignore").read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+    return gitignore_rules(text, rel_dir)
+
+
+class _Walker:
+    """Scan directories in a thread pool, pruning excluded and ignored ones."""
+
+    def __init__(
+        self,
+        root: Path,
+        exclude: Optional[Pattern[str]],
+        gitignore: bool,
+    ) -> None:
+        self.root = root
+        self.exclude = exclude
+        self.gitignore = gitignore
+        self.mtimes: Dict[str, int] = {}
+        """Scanned dir -> its mtime before the scan."""
+
+    def scan(
+        self,
+        rel_dir: str,
+        rules: List[IgnoreRule],
+    ) -> Tuple[List[str], List[Tuple[str, List[IgnoreRule]]]]:
+        """Files and subdirectories (with their ignore rules) of the directory."""
+        if self.gitignore and rel_dir:
+            rules = rules + _read_rules(self.root, rel_dir)
+        files, dirs = [], []
+        try:
+            self.mtimes[rel_dir] = os.stat(self.root / rel_dir).st_mtime_ns
+            entries = list(os.scandir(self.root / rel_dir))
+        except OSError:
+            return files, dirs
+        for entry in entries:
+            path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not is_dir and entry.is_symlink() and entry.is_dir():
+                    continue  # not followed to avoid cycles
+            except OSError:
+                continue
+            if self.exclude is not None and self.exclude.fullmatch(path):
+                continue
+            if rules and is_ignored(rules, path, is_dir):
+                continue
+            if is_dir:
+                dirs.append((path, rules))
+            else:
+                files.append(path)
+        return files, dirs
+
+    def walk(self, bases: Sequence[str], workers: int) -> Iterator[str]:
+        """Relative paths of all not ignored files under the base dirs."""
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: Set[Future] = set()
+            for base in bases:
+                pending.add(executor.submit(self.scan, base, self._base_rules(base)))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, dirs = future.result()
+                    for rel_dir, rules in dirs:
+                        pending.add(executor.submit(self.scan, rel_dir, rules))
+                    yield from files
+
+    def _base_rules(self, base: str) -> List[IgnoreRule]:
+        """Ignore rules from the root down to the base dir, the base's own are read by `scan`."""
+        if not self.gitignore:
+            return []
+        rules = _read_rules(self.root, "")
+        parts = base.split("/") if base else []
+        for depth in range(1, len(parts)):
+            rules += _read_rules(self.root, "/".join(parts[:depth]))
+        return rules
+
+
+def expand_globs(
+    patterns: Sequence[str],
+    root: Optional[Union[str, Path]] = None,
+    *,
+    exclude: Sequence[str] = DEFAULT_EXCLUDES,
+    gitignore: bool = True,
+    workers: int = GLOB_WORKERS,
+) -> Iterator[Path]:
+    """Stream files matching the glob patterns, in no particular order.
+
+    Patterns are relative to `root` (`GITHUB_WORKSPACE` or the current dir by default),
+    patterns starting with `!` are excludes.
+    The result is cached in the process. A repeated expansion only checks the mtimes
+    of the scanned directories, and rescans if files were added, removed or renamed.
+    """
+    root = Path(root or os.environ.get("GITHUB_WORKSPACE") or Path.cwd())
+    includes = [pattern for pattern in patterns if pattern and not pattern.startswith("!")]
+    excludes = list(exclude) + [pattern[1:] for pattern in patterns if pattern.startswith("!")]
+    key = (str(root), tuple(includes), tuple(excludes), gitignore)
+    cached = _expansions.get(key)
+    if cached is not None and _unchanged(root, cached.mtimes):
+        yield from cached.files
+        return
+
+    include_re = _compile(includes)
+    if include_re is None:
+        return
+    bases = sorted({_literal_base(pattern) for pattern in includes})
+    bases = [  # nested bases are walked as a part of their parents
+        base
+        for base in bases
+        if not any(base != other and base.startswith(f"{other}/") for other in bases)
+    ]
+    if "" in bases:
+        bases = [""]
+    walker = _Walker(root, _compile(excludes), gitignore)
+    found = []
+    for path in walker.walk(bases, workers):
+        if include_re.fullmatch(path):
+            file_path = root / path
+            found.append(file_path)
+            yield file_path
+    _expansions[key] = _Expansion(found, walker.mtimes)
+
+
+def _unchanged(root: Path, mtimes: Dict[str, int]) -> bool:
+    """If no files were added to or removed from the scanned dirs since the scan."""
+    for rel_dir, mtime in mtimes.items():
+        try:
+            if os.stat(root / rel_dir).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def clear_glob_cache() -> None:
+    """Forget cached expansions, so the next expansion rescans the workspace."""
+    _expansions.clear()
+
+
+class GlobPattern(str):
+    """Input with glob patterns, one per line, `!pattern` lines are excludes.
+
+    Usage:
+        ```python
+        class MyInputs(ActionInputs):
+            files: GlobPattern
+
+        for path in action.inputs.files.expand():
+            print(path)
+        ```
+    """
+
+    @property
+    def patterns(self) -> List[str]:
+        """Not empty lines of the input."""
+        return [line.strip() for line in self.splitlines() if line.strip()]
+
+    def expand(
+        self,
+        root: Optional[Union[str, Path]] = None,
+        *,
+        exclude: Sequence[str] = DEFAULT_EXCLUDES,
+        gitignore: bool = True,
+        workers: int = GLOB_WORKERS,
+    ) -> Iterator[Path]:
+        """Stream matching files, see `expand_globs()`."""
+        return expand_globs(
+            self.patterns,
+            root,
+            exclude=exclude,
+            gitignore=gitignore,
+            workers=workers,
+        )
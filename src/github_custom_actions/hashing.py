@@ -0,0 +1,142 @@
+"""Parallel content hashing of files with a persistent stat-keyed cache.
+
+Files are hashed in a thread pool (`hashlib` releases the GIL on big buffers),
+big files are hashed from `mmap`. Digests are cached by `(path, size, mtime_ns)`
+in a JSON file, so unchanged files are not read again in the next runs.
+Paths that are not files (removed after they were listed, or directories) are skipped
+as the workflow `hashFiles()` does.
+"""
+
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+HASH_BUFSIZE = 1024 * 1024
+MMAP_THRESHOLD = 4 * 1024 * 1024
+HASH_WORKERS = 8
+HASH_CACHE_FILE = "github-custom-actions-hashes.json"
+HASH_CACHE_MAX_ENTRIES = 200_000
+
+_NOT_FILE_ERRORS = (FileNotFoundError, IsADirectoryError, NotADirectoryError)
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of the file content."""
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return hashlib.sha256(content).hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file.read(HASH_BUFSIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def combine_digests(digests: Iterable[str]) -> str:
+    """One key from the file digests, like the workflow `hashFiles()`: empty if no files."""
+    combined = hashlib.sha256()
+    empty = True
+    for digest in digests:
+        combined.update(bytes.fromhex(digest))
+        empty = False
+    return "" if empty else combined.hexdigest()
+
+
+class FileHasher:
+    """Hash files in parallel, caching digests by path, size and mtime.
+
+    Usage:
+        ```python
+        hasher = FileHasher(Path(os.environ["RUNNER_TOOL_CACHE"]) / HASH_CACHE_FILE)
+        key = hasher.hash_files(Path("src").rglob("*.py"))
+        ```
+
+    Without `cache_path` digests are cached in the object only.
+    The cache file is replaced atomically, it keeps the most recently used
+    `HASH_CACHE_MAX_ENTRIES` digests.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, workers: Optional[int] = None) -> None:
+        """Init with the cache file path and the number of hashing threads.
+
+        By default there is a thread per CPU, up to `HASH_WORKERS`.
+        """
+        self.cache_path = cache_path
+        self.workers = workers or min(HASH_WORKERS, os.cpu_count() or 1)
+        self._cache: Optional[Dict[str, List]] = None
+
+    def _load(self) -> Dict[str, List]:
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path is not None:
+                with contextlib.suppress(OSError, ValueError):  # no or broken cache
+                    self._cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        return self._cache
+
+    def _save(self) -> None:
+        if self.cache_path is None or self._cache is None:
+            return
+        while len(self._cache) > HASH_CACHE_MAX_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_name(f"{self.cache_path.name}.tmp-{os.getpid()}")
+        temp_path.write_text(json.dumps(self._cache), encoding="utf-8")
+        os.replace(temp_path, self.cache_path)
+
+    def _digest(
+        self,
+        path: Path,
+        cache: Dict[str, List],
+    ) -> Tuple[Optional[str], Optional[List]]:
+        """Digest and the new cache entry, None if the cached one is valid.
+
+        The digest is None if the path is not a file.
+        """
+        key = str(path.absolute())
+        try:
+            stat = path.stat()
+            cached = cache.get(key)
+            if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                return cached[2], None
+            digest = file_digest(path)
+        except _NOT_FILE_ERRORS:
+            return None, None
+        return digest, [stat.st_size, stat.st_mtime_ns, digest]
+
+    def digests(self, paths: Iterable[Path]) -> Dict[Path, str]:
+        """sha256 digests of the files, paths that are not files are skipped."""
+        cache = self._load()
+        paths = list(dict.fromkeys(paths))
+        changed = False
+        result = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # hashing in one thread does not need the pool overhead
+            map_func = executor.map if self.workers > 1 else map
+            for path, (digest, entry) in zip(
+                paths,
+                map_func(lambda path: self._digest(path, cache), paths),
+            ):
+                key = str(path.absolute())
+                if digest is None:
+                    changed = cache.pop(key, None) is not None or changed
+                    continue
+                if entry is None:
+                    cache[key] = cache.pop(key)  # most recently used are at the end
+                else:
+                    cache.pop(key, None)
+                    cache[key] = entry
+                    changed = True
+                result[path] = digest
+        if changed:
+            self._save()
+        return result
+
+    def hash_files(self, paths: Iterable[Path]) -> str:
+        """One key for the file set, stable regardless of the order of `paths`."""
+        digests = self.digests(paths)
+        return combine_digests(digests[path] for path in sorted(digests))
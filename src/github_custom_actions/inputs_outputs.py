@@ -6,9 +6,11 @@ So no fancy features like walrus operator, @cached_property, etc.
 
 import os
 from pathlib import Path
+from typing import Optional
 
 from github_custom_actions.env_attr_dict_vars import EnvAttrDictVars
 from github_custom_actions.file_attr_dict_vars import FileAttrDictVars
+from github_custom_actions.vars_storage import FileStorage, VarsStorage
 
 INPUT_PREFIX = "INPUT_"
 
@@ -45,7 +47,20 @@ class ActionInputs(EnvAttrDictVars):
 
     Uses lazy loading of the values.
     So the value is read from the environment only when accessed and only once,
-    and saved in the object's internal dict."""
+    and saved in the object's internal dict.
+
+    Instead of writing the class by hand you can generate it from `action.yml`
+    with `python -m github_custom_actions.codegen action.yml -o action_io.py`.
+    Generated classes know the exact input names, `required` flags and defaults
+    from `action.yml`, and `--check` fails if the file is outdated.
+
+    Inputs with glob patterns like `files: "**/*.py"` can be declared as `GlobPattern`
+    to expand them in parallel with `.gitignore` pruning: `action.inputs.files.expand()`.
+
+    Inputs in the `_fields` table are validated all at once before `main()`:
+    `required`, type (`str`, `Path`, `int`, `float`, `bool`), `pattern` and `choices`.
+    Only they are converted to `int`, `float` and `bool`, inputs declared just by
+    type hints are strings (or `Path`) as before."""
 
     # pylint: disable=abstract-method  # we want RO implementation that raises NotImplementedError on write
 
@@ -80,7 +95,19 @@ class ActionOutputs(FileAttrDictVars):
 
     Each output var assignment changes the GitHub outputs file
     (the path is defined as `action.env.github_output`).
+
+    To publish a big file (SBOM, coverage report) as a multiline output use
+    `action.outputs.set_from_file("sbom", path)`.
+    The file content is streamed to the outputs file without loading it to memory.
+
+    Pass a `storage` backend (like `MemoryStorage`) to keep outputs somewhere else
+    than the `GITHUB_OUTPUT` file.
+
+    Outputs annotated as `dict`, `list`, dataclasses or NamedTuples are written as compact
+    JSON (with `orjson` if it is installed), so the workflow can read them with `fromJSON()`,
+    and are decoded back when read as attributes.
     """
 
-    def __init__(self) -> None:
-        super().__init__(Path(os.environ["GITHUB_OUTPUT"]))
+    def __init__(self, storage: Optional[VarsStorage] = None) -> None:
+        """Init with the outputs `storage`, by default the file `GITHUB_OUTPUT`."""
+        super().__init__(storage or FileStorage(Path(os.environ["GITHUB_OUTPUT"])))
@@ -0,0 +1,137 @@
+"""Incremental JSON reading without building the whole object tree."""
+
+import json
+import re
+from typing import Any, Iterator, List, Optional, TextIO
+
+CHUNK_SIZE = 1024 * 1024
+_WS_RE = re.compile(r"\s*")
+_decoder = json.JSONDecoder()
+
+
+class JsonScanner:
+    """Walk JSON text decoding only the values we ask for.
+
+    Reads from a text string, or from a file in chunks so the memory is bounded by the
+    biggest single value decoded, not by the file size.
+
+    Usage:
+        ```python
+        with open("report.sarif") as file:
+            scanner = JsonScanner(file=file)
+            scanner.locate(["runs"])
+            for _ in scanner.iter_array():
+                run = scanner.decode()
+        ```
+    """
+
+    def __init__(self, text: str = "", file: Optional[TextIO] = None) -> None:
+        """Init with the whole JSON `text` or with the `file` to read in chunks."""
+        self.text = text
+        self.pos = 0
+        self._file = file
+        self._eof = file is None
+        self._skip_ws()
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping the consumed text. Returns False at the end of file."""
+        if self._eof:
+            return False
+        # at least double the pending text, so a big value is re-decoded O(log(size)) times
+        size = max(CHUNK_SIZE, len(self.text) - self.pos)
+        chunk = self._file.read(size)  # type: ignore[union-attr]
+        if not chunk:
+            self._eof = True
+            return False
+        self.text = self.text[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def _skip_ws(self) -> None:
+        while True:
+            self.pos = _WS_RE.match(self.text, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.text) or not self._fill():
+                return
+
+    @property
+    def char(self) -> str:
+        """The current char, empty string at the end."""
+        return self.text[self.pos : self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.char != char:
+            raise ValueError(f"Expected `{char}` in JSON, got `{self.char}`")
+        self.pos += 1
+        self._skip_ws()
+
+    def decode(self) -> Any:
+        """Decode the value at the current position."""
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # a number at the end of the buffer could continue in the next chunk
+            if end < len(self.text) or not self._fill():
+                break
+        self.pos = end
+        self._skip_ws()
+        return value
+
+    def skip_value(self) -> None:
+        """Skip the value, it is decoded by C JSON decoder and immediately dropped."""
+        self.decode()
+
+    def _after_item(self, closing: str) -> bool:
+        """Skip the comma after an item, return False if the container is closed."""
+        if self.char == ",":
+            self.expect(",")
+            return True
+        self.expect(closing)
+        return False
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield keys, the caller must consume each value before requesting the next key."""
+        self.expect("{")
+        if self.char == "}":
+            self.expect("}")
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if not self._after_item("}"):
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """Position at each element, the caller must consume it before the next one."""
+        self.expect("[")
+        if self.char == "]":
+            self.expect("]")
+            return
+        while True:
+            yield None
+            if not self._after_item("]"):
+                return
+
+    def locate(self, parts: List[str]) -> None:
+        """Move to the value at the path `parts`, raise KeyError if there is no such value."""
+        for part in parts:
+            if self.char == "{":
+                for key in self.iter_object():
+                    if key == part:
+                        break
+                    self.skip_value()
+                else:
+                    raise KeyError(part)
+            elif self.char == "[" and part.isdigit():
+                for index, _ in enumerate(self.iter_array()):
+                    if index == int(part):
+                        break
+                    self.skip_value()
+                else:
+                    raise KeyError(part)
+            else:
+                raise KeyError(part)
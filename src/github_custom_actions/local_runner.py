@@ -0,0 +1,228 @@
+"""Local stand-in for the GitHub Actions runner.
+
+Runs `ActionBase` subclasses in-process with temporary output / summary files
+and `INPUT_*` env vars, and parses outputs, annotations and the summary back.
+"""
+
+import contextlib
+import io
+import os
+import re
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Type
+
+from github_custom_actions.action_base import ActionBase
+from github_custom_actions.event_payload import clear_cache
+from github_custom_actions.file_attr_dict_vars import iter_vars
+from github_custom_actions.globs import clear_glob_cache
+from github_custom_actions.inputs_outputs import INPUT_PREFIX
+from github_custom_actions.masking import masker
+
+COMMAND_RE = re.compile(r"^::([a-zA-Z-]+)(?: (.*?))?::(.*)$")
+"""Workflow command: the properties end at the first `::`, as the runner parses them."""
+
+_UNESCAPES = (("%0D", "\r"), ("%0A", "\n"), ("%3A", ":"), ("%2C", ","), ("%25", "%"))
+
+PASSTHROUGH_ENV = ("PATH", "HOME", "LANG", "TMPDIR", "TEMP", "TMP", "SYSTEMROOT")
+"""Host env vars kept in local runs, everything else (like `GITHUB_*`, `INPUT_*`) is dropped."""
+
+
+class Annotation(NamedTuple):
+    """Workflow command printed by the action, like `::error file=a.py::Message`."""
+
+    command: str
+    message: str
+    properties: Dict[str, str]
+
+
+class RunResult(NamedTuple):
+    """Result of one action invocation."""
+
+    exit_code: int
+    outputs: Dict[str, str]
+    summary: str
+    annotations: List[Annotation]
+    stdout: str
+    stderr: str
+
+
+def parse_outputs(text: str) -> Dict[str, str]:
+    """Parse GitHub outputs file with `name=value` and `name<<DELIMITER` multiline values."""
+    return dict(iter_vars(text))
+
+
+def _unescape(value: str) -> str:
+    """Undo the escaping of workflow command message and properties."""
+    for escaped, char in _UNESCAPES:
+        value = value.replace(escaped, char)
+    return value
+
+
+def parse_annotations(text: str) -> List[Annotation]:
+    """Parse workflow commands from the action stdout."""
+    annotations = []
+    for line in text.splitlines():
+        match = COMMAND_RE.match(line)
+        if match:
+            command, properties, message = match.groups()
+            pairs = (prop.split("=", 1) for prop in (properties or "").split(",") if "=" in prop)
+            annotations.append(
+                Annotation(
+                    command,
+                    _unescape(message),
+                    {key.strip(): _unescape(value) for key, value in pairs},
+                ),
+            )
+    return annotations
+
+
+@contextlib.contextmanager
+def _replaced_environ(env: Dict[str, str]) -> Iterator[None]:
+    """Temporary replace all env vars, restoring the original environment on exit."""
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+@contextlib.contextmanager
+def _working_dir(path: Optional[str]) -> Iterator[None]:
+    saved = os.getcwd()
+    if path:
+        os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(saved)
+
+
+class Invocation(NamedTuple):
+    """Exit code and output of one in-process action run."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def invoke_action(
+    action_class: Type[ActionBase],
+    env: Dict[str, str],
+    cwd: Optional[str] = None,
+) -> Invocation:
+    """Run the action once in the process with the `env` as the whole environment.
+
+    Secrets, event payload and glob expansions cached by the previous invocation
+    are dropped, so invocations in one process do not see each other.
+    `sys.exit()` without code is success, any other exception (like an error in
+    the action `__init__`) is exit code 1 with the traceback in `stderr`.
+    """
+    masker.clear()
+    clear_cache()
+    clear_glob_cache()
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with _replaced_environ(env), _working_dir(cwd), contextlib.redirect_stdout(
+        stdout,
+    ), contextlib.redirect_stderr(stderr):
+        try:
+            action_class().run()
+        except SystemExit as exc:
+            exit_code = 0 if exc.code is None else exc.code if isinstance(exc.code, int) else 1
+        except Exception:  # noqa: BLE001  # reported as a failed run
+            traceback.print_exc()
+            exit_code = 1
+    return Invocation(exit_code, stdout.getvalue(), stderr.getvalue())
+
+
+class LocalRunner:
+    """Run an action like the GitHub runner does, but locally and in-process.
+
+    Usage:
+        ```python
+        runner = LocalRunner(MyAction, env={"GITHUB_REPOSITORY": "octocat/hello"})
+        result = runner.run({"my-input": "value"})
+        assert result.exit_code == 0
+        assert result.outputs["my-output"] == "value"
+
+        # thousands of synthetic invocations, each in isolated environment
+        results = runner.run_many({"my-input": str(i)} for i in range(1000))
+        ```
+
+    `inputs` use the names from `action.yml`, they are converted to `INPUT_*` env vars.
+    The action sees only these vars and `PASSTHROUGH_ENV` of the host, so the host
+    `GITHUB_*` and `INPUT_*` vars do not leak into the run.
+    Registered secrets and cached event payload / glob expansions are dropped before
+    each run, see `invoke_action()`.
+
+    `run_many()` runs invocations in worker processes, so the action class should be
+    importable (defined at a module level).
+    """
+
+    def __init__(
+        self,
+        action_class: Type[ActionBase],
+        env: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Init with the action class and the env vars common for all invocations."""
+        self.action_class = action_class
+        self.env = env or {}
+
+    def run(
+        self,
+        inputs: Optional[Dict[str, str]] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> RunResult:
+        """Run the action once and collect the results."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / "output.txt"
+            summary_file = Path(temp_dir) / "summary.md"
+            runner_temp = Path(temp_dir) / "temp"
+            runner_temp.mkdir()
+            action_env = {
+                **{name: os.environ[name] for name in PASSTHROUGH_ENV if name in os.environ},
+                "CI": "true",
+                "GITHUB_ACTIONS": "true",
+                "GITHUB_OUTPUT": str(output_file),
+                "GITHUB_STEP_SUMMARY": str(summary_file),
+                "RUNNER_TEMP": str(runner_temp),
+                **self.env,
+                **(env or {}),
+                **{INPUT_PREFIX + name.upper(): value for name, value in (inputs or {}).items()},
+            }
+            invocation = invoke_action(self.action_class, action_env)
+            return RunResult(
+                exit_code=invocation.exit_code,
+                outputs=parse_outputs(_read_text(output_file)),
+                summary=_read_text(summary_file),
+                annotations=parse_annotations(invocation.stdout),
+                stdout=invocation.stdout,
+                stderr=invocation.stderr,
+            )
+
+    def run_many(
+        self,
+        invocations: Iterable[Dict[str, str]],
+        max_workers: Optional[int] = None,
+        chunksize: int = 16,
+    ) -> List[RunResult]:
+        """Run the action for each inputs dict in parallel worker processes.
+
+        Each worker process has its own environment, so invocations do not interfere.
+        Results are in the order of `invocations`.
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.run, invocations, chunksize=chunksize))
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
@@ -0,0 +1,105 @@
+"""Scrub secrets from everything the action writes.
+
+All registered secrets are compiled into one trie-shaped regexp, so the scan cost
+per char does not grow with the number of secrets as it would with a `str.replace()`
+loop or a flat alternation.
+"""
+
+import base64
+import json
+import re
+from typing import Dict, List, Optional, Pattern, Set
+from urllib.parse import quote
+
+MASK = "***"
+
+
+def secret_variants(secret: str) -> List[str]:
+    """Each line of the secret, the secret itself, and its common encodings."""
+    variants = [line for line in secret.splitlines() if line.strip()]
+    variants.append(secret)
+    variants.append(base64.b64encode(secret.encode()).decode())
+    variants.append(quote(secret, safe=""))
+    variants.append(json.dumps(secret)[1:-1])
+    unique = []
+    for variant in variants:
+        if variant and variant not in unique:
+            unique.append(variant)
+    return unique
+
+
+def is_single_line(value: str) -> bool:
+    """If the value can be sent in one workflow command."""
+    return "\n" not in value and "\r" not in value
+
+
+def _trie_pattern(words: Set[str]) -> str:
+    """Regexp with common prefixes factored out, preferring the longest match."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: Dict[str, dict]) -> str:
+    prefix = []
+    # follow the chain of single-child nodes iteratively, so long secrets do not hit
+    # the recursion limit
+    while "" not in node and len(node) == 1:
+        char, node = next(iter(node.items()))
+        prefix.append(re.escape(char))
+    branches = [re.escape(char) + _node_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return "".join(prefix)
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if "" in node:
+        pattern = f"(?:{pattern})?"
+    return "".join(prefix) + pattern
+
+
+class SecretMasker:
+    """Registry of secrets with a precompiled scrubber.
+
+    Usage:
+        ```python
+        masker = SecretMasker()
+        masker.add("s3cr3t")
+        masker.mask("token=s3cr3t")  # "token=***"
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Init empty registry."""
+        self._secrets: Set[str] = set()
+        self._regexp: Optional[Pattern[str]] = None
+
+    def add(self, secret: str) -> List[str]:
+        """Register the secret, return the new values to mask (variants not seen before)."""
+        new = [variant for variant in secret_variants(secret) if variant not in self._secrets]
+        if new:
+            self._secrets.update(new)
+            self._regexp = None
+        return new
+
+    def mask(self, text: str) -> str:
+        """Replace all registered secrets in the text with `***`."""
+        if not self._secrets or not text:
+            return text
+        if self._regexp is None:
+            self._regexp = re.compile(_trie_pattern(self._secrets))
+        return self._regexp.sub(MASK, text)
+
+    def clear(self) -> None:
+        """Forget all registered secrets."""
+        self._secrets.clear()
+        self._regexp = None
+
+    def __len__(self) -> int:
+        return len(self._secrets)
+
+
+masker = SecretMasker()
+"""Process-wide masker used by the action output, summary and message writers."""
@@ -0,0 +1,224 @@
+"""Cross-run memoization of actions that are pure functions of their inputs and files.
+
+Results (outputs and the summary fragment) are stored in a size-bounded LRU directory
+under `runner_tool_cache`, so the next run with the same inputs replays them
+without running `main()`.
+Secrets registered with `add_mask()` are masked in the stored results as they are
+in the outputs and summary files.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from github_custom_actions.github_vars import runner_temp_dir, runner_tool_cache_dir
+from github_custom_actions.globs import expand_globs
+from github_custom_actions.hashing import HASH_CACHE_FILE, FileHasher
+from github_custom_actions.masking import masker
+
+MEMO_MAX_BYTES = 100 * 1024 * 1024
+MEMO_DIR = "github-custom-actions-memo"
+RESULT_FILE = "result.json"
+
+MainMethod = TypeVar("MainMethod", bound=Callable[..., None])
+
+
+def _declared_values(vars_obj: Any, names: Iterable[str]) -> Dict[str, Optional[str]]:
+    values: Dict[str, Optional[str]] = {}
+    for name in names:
+        try:
+            value = getattr(vars_obj, name)
+        except AttributeError:
+            value = None
+        values[name] = None if value is None else str(value)
+    return values
+
+
+def _matched_files(root: Path, patterns: Sequence[str]) -> List[Path]:
+    """All files matching the patterns, ignored by git or not, as they can change the result."""
+    return sorted(set(expand_globs(patterns, root, exclude=(), gitignore=False)))
+
+
+class ResultCache:
+    """Directory of memoized results, least recently used are evicted above `max_bytes`.
+
+    Each entry is a directory named by the key with `result.json` and the files of
+    multiline outputs.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = MEMO_MAX_BYTES) -> None:
+        """Init with the cache directory, it is created on the first store."""
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], Path]]:
+        """Stored result and its entry directory, None if not cached."""
+        entry = self.directory / key
+        try:
+            result = json.loads((entry / RESULT_FILE).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(entry)  # mark as recently used
+        return result, entry
+
+    def copy_files(
+        self,
+        entry: Path,
+        files: Sequence[Sequence[str]],
+        directory: Path,
+    ) -> Optional[List[Tuple[str, Path]]]:
+        """Copy the multiline outputs of the entry, None if it was evicted meanwhile."""
+        copies = []
+        for name, file_name in files:
+            copy = directory / file_name
+            try:
+                shutil.copyfile(entry / "outputs" / file_name, copy)
+            except FileNotFoundError:
+                return None
+            copies.append((name, copy))
+        return copies
+
+    def store(self, key: str, outputs: Dict[str, Any], summary: str) -> None:
+        """Store the result atomically and evict the least recently used entries.
+
+        Registered secrets are masked in the outputs and the summary.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_entry = self.directory / f"{key}.tmp-{os.getpid()}"
+        shutil.rmtree(temp_entry, ignore_errors=True)
+        (temp_entry / "outputs").mkdir(parents=True)
+        values, files = {}, []
+        for index, (name, value) in enumerate(outputs.items()):
+            text = masker.mask(str(value))
+            if "\n" in text:  # multiline value read back from the outputs file
+                (temp_entry / "outputs" / str(index)).write_text(text, encoding="utf-8")
+                files.append([name, str(index)])
+            else:
+                values[name] = text
+        (temp_entry / RESULT_FILE).write_text(
+            json.dumps({"outputs": values, "files": files, "summary": masker.mask(summary)}),
+            encoding="utf-8",
+        )
+        try:
+            temp_entry.rename(self.directory / key)
+        except OSError:  # stored concurrently by another run
+            shutil.rmtree(temp_entry, ignore_errors=True)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits `max_bytes`."""
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.is_dir() and ".tmp-" not in entry.name:
+                size = sum(path.stat().st_size for path in entry.rglob("*") if path.is_file())
+                entries.append((entry.stat().st_mtime, size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def memo_key(
+    action: Any,
+    env: Sequence[str] = (),
+    files: Sequence[str] = (),
+    version: str = "",
+) -> str:
+    """Key of the action result: declared inputs, `env` vars and digests of `files`.
+
+    `files` are glob patterns relative to `github_workspace` (or the current dir).
+    """
+    try:
+        root = action.env.github_workspace or Path.cwd()
+    except AttributeError:
+        root = Path.cwd()
+    inputs = [name for name in action.inputs.get_type_hints() if not name.startswith("_")]
+    hasher = FileHasher(runner_tool_cache_dir(action.env) / HASH_CACHE_FILE)
+    digests = hasher.digests(_matched_files(root, files))
+    key_data = {
+        "action": f"{action.__class__.__module__}.{action.__class__.__qualname__}",
+        "version": version,
+        "inputs": _declared_values(action.inputs, inputs),
+        "env": _declared_values(action.env, env),
+        "files": [[path.relative_to(root).as_posix(), digest] for path, digest in digests.items()],
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _replay(action: Any, cache: ResultCache, result: Dict[str, Any], entry: Path) -> bool:
+    """Set the stored outputs and summary, False if the entry was evicted meanwhile.
+
+    Multiline outputs are copied out of the cache first, so a concurrent eviction
+    cannot remove them half way.
+    """
+    with tempfile.TemporaryDirectory(dir=runner_temp_dir(action.env)) as directory:
+        copies = cache.copy_files(entry, result["files"], Path(directory))
+        if copies is None:
+            return False
+        for name, value in result["outputs"].items():
+            action.outputs[name] = value
+        for name, path in copies:
+            action.outputs.set_from_file(name, path)
+    if result["summary"]:
+        action.summary += result["summary"]
+    return True
+
+
+def memoize(
+    *,
+    env: Sequence[str] = (),
+    files: Sequence[str] = (),
+    version: str = "",
+    max_bytes: int = MEMO_MAX_BYTES,
+) -> Callable[[MainMethod], MainMethod]:
+    """Decorator for `ActionBase.main()` to reuse the result of a previous run.
+
+    The key is built from all declared inputs, the `env` fields of `GithubVars`
+    (like `"github_repository"`), the content of the files matched by `files` glob
+    patterns and `version` (change it to invalidate the cache after changing the code).
+
+    On a cache hit the outputs and the summary written by `main()` are replayed
+    without calling it. Messages and annotations are not replayed.
+    Secrets are stored masked, so the replayed outputs and summary have `***` instead.
+
+    Usage:
+        ```python
+        class MyAction(ActionBase):
+            @memoize(env=["github_repository"], files=["schema/**/*.json"])
+            def main(self):
+                self.outputs.schema_hash = generate_schema()
+        ```
+    """
+
+    def decorator(main: MainMethod) -> MainMethod:
+        @functools.wraps(main)
+        def wrapper(self: Any) -> None:
+            cache = ResultCache(
+                runner_tool_cache_dir(self.env) / MEMO_DIR / self.__class__.__name__,
+                max_bytes,
+            )
+            key = memo_key(self, env, files, version)
+            cached = cache.load(key)
+            if cached is not None and _replay(self, cache, *cached):
+                self.debug("Memoized result %s is replayed", key)
+                return
+
+            summary_before = self.summary
+            main(self)
+            summary = self.summary
+            cache.store(
+                key,
+                dict(self.outputs),
+                summary[len(summary_before) :] if summary.startswith(summary_before) else "",
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,150 @@
+"""Run several actions as one step in one interpreter.
+
+Instead of a workflow step per small Python action (each starting Python, re-reading
+the environment and rewriting `GITHUB_OUTPUT`), run them back to back in one step:
+```python
+ActionPipeline([
+    PipelineStep(BuildAction, step_id="build"),
+    PipelineStep(PublishAction, inputs={"path": "${{ steps.build.outputs.artifact }}"}),
+]).run()
+```
+
+The actions share one `GithubVars` snapshot, outputs are passed to the next actions'
+inputs in memory, and the combined outputs are written to `GITHUB_OUTPUT` once at the end.
+Summaries of the actions are appended to one step summary.
+"""
+
+import contextlib
+import os
+import re
+from typing import Dict, Iterator, List, Match, NamedTuple, Optional, Sequence, Type
+
+from github_custom_actions.action_base import ActionBase
+from github_custom_actions.file_attr_dict_vars import FileAttrDictVars
+from github_custom_actions.github_vars import GithubVars
+from github_custom_actions.inputs_outputs import INPUT_PREFIX
+from github_custom_actions.step_summary import (
+    SUMMARY_SIZE_LIMIT,
+    StepSummaryProperty,
+    SummaryOverflow,
+)
+from github_custom_actions.vars_storage import FileStorage, MemoryStorage, VarsStorage
+
+_OUTPUT_EXPRESSION_RE = re.compile(r"\$\{\{\s*steps\.([\w-]+)\.outputs\.([\w-]+)\s*\}\}")
+
+_summary = StepSummaryProperty("github_step_summary")
+
+
+class PipelineStep(NamedTuple):
+    """Action to run in the pipeline."""
+
+    action_class: Type[ActionBase]
+    inputs: Optional[Dict[str, str]] = None
+    """Input name -> value, `${{ steps.<id>.outputs.<name> }}` is replaced with the output.
+
+    Inputs not listed here are taken from the environment of the pipeline step."""
+    step_id: Optional[str] = None
+    """Id to refer to the step outputs, the action class name by default."""
+
+
+@contextlib.contextmanager
+def _step_inputs(inputs: Dict[str, str]) -> Iterator[None]:
+    """Temporary set the inputs env vars."""
+    names = [INPUT_PREFIX + name.upper() for name in inputs]
+    saved = {name: os.environ.get(name) for name in names}
+    os.environ.update(zip(names, inputs.values()))
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+
+
+def _output_values(outputs: FileAttrDictVars) -> Dict[str, str]:
+    """Unmasked output values, with the content of the outputs set from files."""
+    return {key: str(outputs[key]) for key in outputs}
+
+
+class ActionPipeline:
+    """Run actions one after another in the process, passing outputs to inputs in memory.
+
+    Stops at the first failing action.
+    Outputs of the actions that ran are appended to `GITHUB_OUTPUT` even if one fails,
+    if actions set the same output the last one wins.
+    The actions share the step summary if `GITHUB_STEP_SUMMARY` is set.
+    """
+
+    summary = _summary
+    summary_limit: int = SUMMARY_SIZE_LIMIT
+    summary_overflow: SummaryOverflow = "truncate"
+
+    def __init__(
+        self,
+        steps: Sequence[PipelineStep],
+        *,
+        outputs_storage: Optional[VarsStorage] = None,
+    ) -> None:
+        """Init with the steps and the combined outputs storage, `GITHUB_OUTPUT` by default."""
+        self.steps = list(steps)
+        self.env = GithubVars()
+        self.outputs_storage = outputs_storage
+        self.step_outputs: Dict[str, Dict[str, str]] = {}
+        """Step id -> outputs of the steps that ran."""
+        self._outputs_data: List[bytes] = []
+
+    def resolve(self, value: str) -> str:
+        """Replace `${{ steps.<id>.outputs.<name> }}` with the outputs of the steps that ran.
+
+        Outputs the step did not set are empty as in workflows.
+        """
+
+        def output(match: Match[str]) -> str:
+            step_id, name = match.groups()
+            if step_id not in self.step_outputs:
+                raise ValueError(f"Step `{step_id}` did not run before `{value}`")
+            return self.step_outputs[step_id].get(name, "")
+
+        return _OUTPUT_EXPRESSION_RE.sub(output, value)
+
+    def run(self) -> None:
+        """Run all steps, the failing one exits the process as `ActionBase.run()` does."""
+        try:
+            for step in self.steps:
+                self.run_step(step)
+        finally:
+            self._write_outputs()
+
+    def run_step(self, step: PipelineStep) -> ActionBase:
+        """Run one action with the resolved inputs, keep its outputs in memory."""
+        step_id = step.step_id or step.action_class.__name__
+        inputs = {name: self.resolve(value) for name, value in (step.inputs or {}).items()}
+        storage = MemoryStorage()
+        with _step_inputs(inputs):
+            action = step.action_class(outputs_storage=storage)
+            action.env = self.env
+            if self._has_summary():
+                _summary.share(self, action)
+            try:
+                action.run()
+            finally:
+                self.step_outputs[step_id] = _output_values(action.outputs)
+                if storage.data:
+                    self._outputs_data.append(storage.data)
+        return action
+
+    def _has_summary(self) -> bool:
+        try:
+            return bool(self.env.github_step_summary)
+        except AttributeError:
+            return False
+
+    def _write_outputs(self) -> None:
+        """Append the outputs to the lines already written by the step."""
+        if not self._outputs_data:
+            return
+        storage = self.outputs_storage or FileStorage(self.env.github_output)
+        with storage.open_append() as file:
+            file.write(b"\n".join(self._outputs_data) + b"\n")
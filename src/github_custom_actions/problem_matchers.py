@@ -0,0 +1,90 @@
+"""Problem matchers: the runner parses tool output into annotations instead of Python.
+
+https://github.com/actions/toolkit/blob/main/docs/problem-matchers.md
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+PATTERN_FIELDS = ("file", "line", "column", "severity", "code", "message")
+_NAMED_GROUP_RE = re.compile(r"\(\?P<(\w+)>")
+
+
+class ProblemPattern(NamedTuple):
+    """One line pattern of a problem matcher.
+
+    Fields other than `regexp` and `loop` are the regexp group numbers.
+    """
+
+    regexp: str
+    file: Optional[int] = None
+    line: Optional[int] = None
+    column: Optional[int] = None
+    severity: Optional[int] = None
+    code: Optional[int] = None
+    message: Optional[int] = None
+    loop: bool = False
+    """Repeat the last pattern of a multiline matcher for the following lines."""
+
+    @classmethod
+    def from_regex(cls, regexp: str, loop: bool = False) -> "ProblemPattern":
+        """Pattern from a Python regexp with named groups.
+
+        Groups with names from `PATTERN_FIELDS` are mapped to the pattern fields.
+        The names are removed from the regexp because the runner does not support
+        the Python named groups syntax.
+
+        Usage:
+            ```python
+            ProblemPattern.from_regex(
+                r"^(?P<file>[^:]+):(?P<line>\\d+):(?P<column>\\d+): (?P<code>\\w+) (?P<message>.+)$"
+            )
+            ```
+        """
+        groups = re.compile(regexp).groupindex
+        unknown = set(groups) - set(PATTERN_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown problem matcher groups {sorted(unknown)}")
+        return cls(
+            regexp=_NAMED_GROUP_RE.sub("(", regexp),
+            loop=loop,
+            **groups,
+        )
+
+    def as_json(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"regexp": self.regexp}
+        result.update(
+            (name, getattr(self, name))
+            for name in PATTERN_FIELDS
+            if getattr(self, name) is not None
+        )
+        if self.loop:
+            result["loop"] = True
+        return result
+
+
+def matcher_json(
+    owner: str,
+    patterns: List[ProblemPattern],
+    severity: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Problem matcher file content."""
+    matcher: Dict[str, Any] = {"owner": owner}
+    if severity is not None:
+        matcher["severity"] = severity
+    matcher["pattern"] = [pattern.as_json() for pattern in patterns]
+    return {"problemMatcher": [matcher]}
+
+
+def write_matcher(
+    path: Path,
+    owner: str,
+    patterns: List[ProblemPattern],
+    severity: Optional[str] = None,
+) -> Path:
+    """Write the problem matcher file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(matcher_json(owner, patterns, severity), indent=2))
+    return path
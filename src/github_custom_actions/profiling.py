@@ -0,0 +1,115 @@
+"""Opt-in profiling of the action business logic.
+
+Profiling is switched on with the environment variable `ACTION_PROFILE`
+(set it in the `env:` of the workflow step), so you can profile a production action
+without changing its code.
+"""
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, NamedTuple, Optional
+
+if TYPE_CHECKING:  # imported on use, `env_flag()` and `env_int()` do not need the profiler
+    import pstats
+
+PROFILE_ENV_VAR = "ACTION_PROFILE"
+PROFILE_TOP_ENV_VAR = "ACTION_PROFILE_TOP"
+DEFAULT_PROFILE_TOP = 20
+
+_FALSE_VALUES = ("", "0", "false", "no", "off")
+
+
+class ProfileEntry(NamedTuple):
+    """Statistics of one profiled function."""
+
+    function: str
+    calls: int
+    total_time: float
+    """Time spent in the function itself, seconds."""
+    cumulative_time: float
+    """Time spent in the function and everything it called, seconds."""
+
+
+def env_flag(name: str) -> bool:
+    """If the environment variable is set to a true-ish value."""
+    return os.environ.get(name, "").strip().lower() not in _FALSE_VALUES
+
+
+def env_int(name: str, default: int) -> int:
+    """Integer from the environment variable, `default` if it is not set or not an integer.
+
+    An invalid value is reported as a warning instead of failing the action.
+    """
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"::warning::{name}=`{value}` is not an integer, using {default}")
+        return default
+
+
+def profiling_top() -> Optional[int]:
+    """Number of hot functions to report, or None if profiling is not enabled.
+
+    Profiling is enabled if `ACTION_PROFILE` is set to a true-ish value.
+    The number of functions to report is taken from `ACTION_PROFILE_TOP`.
+    """
+    if not env_flag(PROFILE_ENV_VAR):
+        return None
+    return env_int(PROFILE_TOP_ENV_VAR, DEFAULT_PROFILE_TOP)
+
+
+def profile_call(
+    func: Callable[[], None],
+    stats_file: Path,
+    top: int = DEFAULT_PROFILE_TOP,
+    on_stats: Optional[Callable[[List[ProfileEntry]], None]] = None,
+) -> None:
+    """Call `func` under cProfile and save `.pstats` to `stats_file`.
+
+    Statistics are saved even if `func` raises, so you can diagnose failing runs.
+    `on_stats` is called with the `top` functions sorted by cumulative time.
+    """
+    import cProfile  # noqa: PLC0415
+    import pstats  # noqa: PLC0415
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(func)
+    finally:
+        stats_file.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(stats_file))
+        if on_stats is not None:
+            on_stats(top_functions(pstats.Stats(profiler), top))
+
+
+def top_functions(stats: "pstats.Stats", top: int) -> List[ProfileEntry]:
+    """Extract `top` functions with the largest cumulative time."""
+    import pstats  # noqa: PLC0415
+
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    entries = []
+    for func in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+        _, calls, total_time, cumulative_time, _ = stats.stats[func]  # type: ignore[attr-defined]
+        entries.append(
+            ProfileEntry(pstats.func_std_string(func), calls, total_time, cumulative_time),
+        )
+    return entries
+
+
+def render_profile(entries: List[ProfileEntry], stats_file: Path) -> str:
+    """Render profiling results as a markdown table for the step summary."""
+    lines = [
+        "\n### Profile\n",
+        f"Full statistics: `{stats_file}`\n",
+        "| Function | Calls | Total, s | Cumulative, s |",
+        "| --- | ---: | ---: | ---: |",
+    ]
+    lines.extend(
+        f"| `{entry.function.replace('|', '&#124;')}` | {entry.calls} "
+        f"| {entry.total_time:.4f} | {entry.cumulative_time:.4f} |"
+        for entry in entries
+    )
+    return "\n".join(lines) + "\n"
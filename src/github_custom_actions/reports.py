@@ -0,0 +1,131 @@
+"""Streaming ingestion of SARIF, JUnit and checkstyle reports into annotations.
+
+Reports are read record by record, so memory does not depend on the report size.
+"""
+
+import xml.etree.ElementTree as ET  # noqa: S405  # reports are produced by our own tools
+from pathlib import Path
+from typing import Any, Dict, Iterator, Literal, Optional, Tuple, Union
+
+from github_custom_actions.annotations import CollectedAnnotation
+from github_custom_actions.json_stream import JsonScanner
+
+ReportFormat = Literal["sarif", "junit", "checkstyle"]
+
+SARIF_LEVELS = {"error": "error", "warning": "warning", "note": "notice", "none": "notice"}
+CHECKSTYLE_SEVERITIES = {"error": "error", "warning": "warning", "info": "notice"}
+
+
+def iter_report(
+    path: Union[str, Path],
+    report_format: Optional[ReportFormat] = None,
+) -> Iterator[CollectedAnnotation]:
+    """Iterate over the report findings as annotations.
+
+    If `report_format` is not specified, it is detected by the file.
+    """
+    path = Path(path)
+    report_format = report_format or detect_format(path)
+    if report_format == "sarif":
+        return iter_sarif(path)
+    if report_format == "junit":
+        return iter_junit(path)
+    if report_format == "checkstyle":
+        return iter_checkstyle(path)
+    raise ValueError(f"Unknown report format `{report_format}`")
+
+
+def detect_format(path: Path) -> ReportFormat:
+    """Detect the report format by the file extension or XML root tag."""
+    if path.suffix.lower() in (".sarif", ".json"):
+        return "sarif"
+    for _, elem in ET.iterparse(str(path), events=("start",)):  # noqa: S314
+        if elem.tag == "checkstyle":
+            return "checkstyle"
+        if elem.tag in ("testsuites", "testsuite"):
+            return "junit"
+        break
+    raise ValueError(f"Cannot detect report format of `{path}`")
+
+
+def iter_sarif(path: Path) -> Iterator[CollectedAnnotation]:
+    """Iterate over `runs[].results[]` of a SARIF report decoding one result at a time."""
+    with path.open(encoding="utf-8") as file:
+        scanner = JsonScanner(file=file)
+        scanner.locate(["runs"])
+        for _ in scanner.iter_array():
+            for key in scanner.iter_object():
+                if key != "results":
+                    scanner.skip_value()
+                    continue
+                for _ in scanner.iter_array():
+                    yield _sarif_annotation(scanner.decode())
+
+
+def _sarif_annotation(result: Dict[str, Any]) -> CollectedAnnotation:
+    location = (result.get("locations") or [{}])[0].get("physicalLocation", {})
+    uri = location.get("artifactLocation", {}).get("uri")
+    region = location.get("region", {})
+    return CollectedAnnotation(
+        severity=SARIF_LEVELS.get(result.get("level", "warning"), "warning"),
+        message=result.get("message", {}).get("text", ""),
+        file=uri[len("file://") :] if uri and uri.startswith("file://") else uri,
+        line=region.get("startLine"),
+        column=region.get("startColumn"),
+        end_line=region.get("endLine"),
+        end_column=region.get("endColumn"),
+        rule=result.get("ruleId"),
+    )
+
+
+def iter_junit(path: Path) -> Iterator[CollectedAnnotation]:
+    """Iterate over failed and errored JUnit test cases."""
+    for testcase, _ in _iter_elements(path, "testcase"):
+        for problem in testcase:
+            if problem.tag not in ("failure", "error"):
+                continue
+            message = problem.get("message") or (problem.text or "").strip().split("\n")[0]
+            line = testcase.get("line")
+            yield CollectedAnnotation(
+                severity="error",
+                message=message,
+                title=".".join(
+                    part for part in (testcase.get("classname"), testcase.get("name")) if part
+                ),
+                file=testcase.get("file"),
+                line=int(line) if line else None,
+                rule=problem.get("type"),
+            )
+
+
+def iter_checkstyle(path: Path) -> Iterator[CollectedAnnotation]:
+    """Iterate over checkstyle `<file><error/></file>` findings."""
+    for error, file in _iter_elements(path, "error"):
+        severity = CHECKSTYLE_SEVERITIES.get(error.get("severity", "error"))
+        if severity is None:  # "ignore"
+            continue
+        line, column = error.get("line"), error.get("column")
+        yield CollectedAnnotation(
+            severity=severity,
+            message=error.get("message", ""),
+            file=file.get("name") if file is not None else None,
+            line=int(line) if line else None,
+            column=int(column) if column else None,
+            rule=error.get("source"),
+        )
+
+
+def _iter_elements(path: Path, tag: str) -> Iterator[Tuple[ET.Element, Optional[ET.Element]]]:
+    """Yield complete `tag` elements with their parents, dropping them from the tree after."""
+    stack = []
+    for event, elem in ET.iterparse(str(path), events=("start", "end")):  # noqa: S314
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag == tag:
+            parent = stack[-1] if stack else None
+            yield elem, parent
+            if parent is not None:
+                parent.remove(elem)
+            elem.clear()
@@ -0,0 +1,172 @@
+"""Opt-in resource usage instrumentation of the action business logic.
+
+Switched on with the environment variable `ACTION_RESOURCES` (or `ActionBase.track_resources`).
+Records CPU time, peak memory, block I/O and the bytes written to the outputs and summary
+files, and optionally the top allocations traced with `tracemalloc`
+(`ACTION_RESOURCES_TRACEMALLOC` is the number of allocations to report).
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover  # Windows
+    resource = None  # type: ignore[assignment]
+
+from github_custom_actions.profiling import env_flag, env_int
+
+RESOURCES_ENV_VAR = "ACTION_RESOURCES"
+TRACEMALLOC_ENV_VAR = "ACTION_RESOURCES_TRACEMALLOC"
+RESOURCES_OUTPUT = "resources"
+"""Output with the resource usage as JSON."""
+
+
+class ResourceUsage(NamedTuple):
+    """Resources used by the measured code."""
+
+    wall_seconds: float
+    cpu_user_seconds: float
+    cpu_system_seconds: float
+    peak_rss_bytes: Optional[int]
+    """Peak resident memory of the process, None if not available on the platform."""
+    read_blocks: Optional[int]
+    write_blocks: Optional[int]
+    written_bytes: Dict[str, int]
+    """Growth of the watched files, like outputs and summary."""
+    traced_peak_bytes: Optional[int] = None
+    """Peak memory allocated by Python, if `tracemalloc` was on."""
+    top_allocations: Tuple[Tuple[str, int], ...] = ()
+    """`(file:line, bytes)` of the biggest allocations alive at the end."""
+
+
+def resources_enabled() -> bool:
+    """If `ACTION_RESOURCES` is set to a true-ish value."""
+    return env_flag(RESOURCES_ENV_VAR)
+
+
+def tracemalloc_top() -> int:
+    """Number of top allocations to report from `ACTION_RESOURCES_TRACEMALLOC`, 0 - off.
+
+    An invalid value is reported as a warning and switches the tracing off.
+    """
+    return env_int(TRACEMALLOC_ENV_VAR, 0)
+
+
+def _file_size(path: Optional[Path]) -> int:
+    try:
+        return path.stat().st_size if path is not None else 0
+    except OSError:
+        return 0
+
+
+class ResourceMonitor:
+    """Measure resources used between `start()` and `stop()`.
+
+    Usage:
+        ```python
+        monitor = ResourceMonitor({"outputs": output_path}, tracemalloc_top=10)
+        monitor.start()
+        work()
+        usage = monitor.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        files: Optional[Dict[str, Optional[Path]]] = None,
+        tracemalloc_top: int = 0,
+    ) -> None:
+        """Init with the files to watch and the number of top allocations to report."""
+        self.files = files or {}
+        self.tracemalloc_top = tracemalloc_top
+        self._started_tracing = False
+        self._sizes: Dict[str, int] = {}
+        self._rusage: Any = None
+        self._cpu = self._wall = 0.0
+
+    def start(self) -> None:
+        self._sizes = {name: _file_size(path) for name, path in self.files.items()}
+        if self.tracemalloc_top:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            elif hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                tracemalloc.reset_peak()
+        self._rusage = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+        self._cpu = time.process_time()
+        self._wall = time.perf_counter()
+
+    def stop(self) -> ResourceUsage:
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        traced_peak, top_allocations = None, ()
+        if self.tracemalloc_top and tracemalloc.is_tracing():
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            statistics = tracemalloc.take_snapshot().statistics("lineno")
+            top_allocations = tuple(
+                (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size)
+                for stat in statistics[: self.tracemalloc_top]
+            )
+            if self._started_tracing:
+                tracemalloc.stop()
+        written = {name: _file_size(path) - self._sizes[name] for name, path in self.files.items()}
+        if self._rusage is None:
+            return ResourceUsage(
+                wall_seconds=wall,
+                cpu_user_seconds=cpu,
+                cpu_system_seconds=0.0,
+                peak_rss_bytes=None,
+                read_blocks=None,
+                write_blocks=None,
+                written_bytes=written,
+                traced_peak_bytes=traced_peak,
+                top_allocations=top_allocations,
+            )
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        rss_unit = 1 if sys.platform == "darwin" else 1024  # bytes on macOS, KiB on Linux
+        return ResourceUsage(
+            wall_seconds=wall,
+            cpu_user_seconds=usage.ru_utime - self._rusage.ru_utime,
+            cpu_system_seconds=usage.ru_stime - self._rusage.ru_stime,
+            peak_rss_bytes=usage.ru_maxrss * rss_unit,
+            read_blocks=usage.ru_inblock - self._rusage.ru_inblock,
+            write_blocks=usage.ru_oublock - self._rusage.ru_oublock,
+            written_bytes=written,
+            traced_peak_bytes=traced_peak,
+            top_allocations=top_allocations,
+        )
+
+
+def _mb(size: Optional[int]) -> str:
+    return "n/a" if size is None else f"{size / 1024 / 1024:.1f} MB"
+
+
+def render_resources(usage: ResourceUsage) -> str:
+    """Render the resource usage as a markdown table for the step summary."""
+    rows = [
+        ("Wall time", f"{usage.wall_seconds:.2f} s"),
+        (
+            "CPU user / system",
+            f"{usage.cpu_user_seconds:.2f} s / {usage.cpu_system_seconds:.2f} s",
+        ),
+        ("Peak RSS", _mb(usage.peak_rss_bytes)),
+        (
+            "Block I/O read / write",
+            "n/a" if usage.read_blocks is None else f"{usage.read_blocks} / {usage.write_blocks}",
+        ),
+    ]
+    rows.extend(
+        (f"Written to {name}", f"{size} bytes") for name, size in usage.written_bytes.items()
+    )
+    if usage.traced_peak_bytes is not None:
+        rows.append(("Python allocations peak", _mb(usage.traced_peak_bytes)))
+    lines = ["\n### Resources\n", "| Resource | Usage |", "| --- | ---: |"]
+    lines.extend(f"| {name} | {value} |" for name, value in rows)
+    if usage.top_allocations:
+        lines += ["", "| Allocated at | Size |", "| --- | ---: |"]
+        lines.extend(f"| `{where}` | {_mb(size)} |" for where, size in usage.top_allocations)
+    return "\n".join(lines) + "\n"
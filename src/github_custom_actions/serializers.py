@@ -0,0 +1,118 @@
+"""Compact JSON encoding of structured vars, with `orjson` backend if it is installed.
+
+Outputs annotated as `dict`, `list`, dataclasses or NamedTuples are written as compact
+JSON, so the workflow can read them with `fromJSON()`.
+Both backends give the same JSON: non-str dict keys are converted to strings,
+NamedTuples nested in values are arrays and NaN / infinity are `null`.
+"""
+
+import dataclasses
+import json
+import math
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover  # optional dependency
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Values `json` / `orjson` do not serialize by themselves."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, tuple):  # NamedTuple, `json` writes it as an array
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """The value with NaN and infinity replaced by None, as `orjson` writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if value is None or isinstance(value, (str, int)):
+        return value
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list) or type(value) is tuple:
+        return [_finite(item) for item in value]
+    try:
+        return _finite(_default(value))
+    except TypeError:
+        return value  # the encoder reports it
+
+
+def dumps(value: Any) -> str:
+    """Compact JSON, single line."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS).decode(
+            "utf-8",
+        )
+    try:
+        return _json_dumps(value)
+    except ValueError:  # NaN or infinity, not valid JSON
+        return _json_dumps(_finite(value))
+
+
+def _json_dumps(value: Any) -> str:
+    return json.dumps(
+        value,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+        default=_default,
+    )
+
+
+def loads(text: str) -> Any:
+    """Parse JSON."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _is_named_tuple(type_hint: Any) -> bool:
+    return (
+        isinstance(type_hint, type)
+        and issubclass(type_hint, tuple)
+        and hasattr(type_hint, "_fields")
+    )
+
+
+class Codec(NamedTuple):
+    """Encoder and decoder of one structured var."""
+
+    encode: Callable[[Any], str]
+    decode: Callable[[str], Any]
+
+
+def codec_for(type_hint: Any) -> Optional[Codec]:
+    """JSON codec for the type hint, None for scalar types that are written with `str()`."""
+    origin = getattr(type_hint, "__origin__", None) or type_hint
+    if origin in (dict, list):
+        return Codec(dumps, loads)
+    if dataclasses.is_dataclass(type_hint):
+        return Codec(dumps, lambda text: type_hint(**loads(text)))
+    if _is_named_tuple(type_hint):
+        return Codec(
+            lambda value: dumps(value._asdict()),
+            lambda text: type_hint(**loads(text)),
+        )
+    return None
+
+
+def compile_codecs(type_hints: Dict[str, Any]) -> Dict[str, Codec]:
+    """Codecs for the structured vars of the class."""
+    codecs = {}
+    for name, type_hint in type_hints.items():
+        if name.startswith("_"):
+            continue
+        codec = codec_for(type_hint)
+        if codec is not None:
+            codecs[name] = codec
+    return codecs
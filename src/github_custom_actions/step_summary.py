@@ -0,0 +1,145 @@
+"""Step summary that keeps within the runner size limit."""
+
+from pathlib import Path
+from typing import Any, Literal, Optional, Type
+
+from github_custom_actions.github_vars import runner_temp_dir
+from github_custom_actions.masking import masker
+
+SUMMARY_SIZE_LIMIT = 1024 * 1024
+"""GitHub rejects step summaries bigger than 1 MiB."""
+
+SummaryOverflow = Literal["truncate", "drop", "spill"]
+
+TRUNCATED_MARKER = "\n\n> **Summary is truncated**: it exceeds the size limit of {limit} bytes.\n"
+DROPPED_MARKER = (
+    "\n\n> **Some summary sections are omitted**: the summary exceeds "
+    "the size limit of {limit} bytes.\n"
+)
+SPILLED_MARKER = (
+    "\n\n> **Summary exceeds the size limit of {limit} bytes**, "
+    "the full report is saved to `{path}`.\n"
+)
+MARKER_RESERVE = 512
+"""Bytes reserved for the overflow marker."""
+
+
+class _SummaryState:
+    """What is written to the summary file, so appends do not re-read it."""
+
+    def __init__(self, path: Path, text: str, size: int) -> None:
+        self.path = path
+        self.text = text
+        """Full text as the action sees it, including the parts that did not fit."""
+        self.size = size
+        """Bytes in the summary file."""
+        self.marker_written = False
+        self.spill_path: Optional[Path] = None
+
+
+class StepSummaryProperty:
+    """Property descriptor for the step summary file with a running byte counter.
+
+    Reading returns the full text appended by the action, so `summary += text` works as
+    with any `str`.
+    Appends are detected and only the new text is written to the file - the file is never
+    re-read or re-written.
+
+    When the summary would exceed `summary_limit` of the object (1 MiB by default)
+    it follows the object's `summary_overflow` policy:
+
+    - `truncate` - cut the text at the limit and add a marker, ignore further appends.
+    - `drop` - skip appended sections that do not fit, add a marker once.
+      Sections that were appended earlier have higher priority and are kept.
+    - `spill` - add a marker with the path of the file under `env.runner_temp`,
+      where the full summary is saved and further appends go.
+    """
+
+    def __init__(self, var_name: str) -> None:
+        """Initialize the property descriptor.
+
+        `var_name` is the name of the object's `env` attribute with the path to the file.
+        """
+        self.var_name = var_name
+        self.state_name = f"_{var_name}_state"
+
+    def __get__(self, obj: Any, objtype: Optional[Type[Any]] = None) -> str:
+        return self._state(obj).text
+
+    def __set__(self, obj: Any, value: str) -> None:
+        path = getattr(obj.env, self.var_name)
+        state = obj.__dict__.get(self.state_name)
+        if state is not None and state.path == path and value.startswith(state.text):
+            delta = value[len(state.text) :]
+        else:
+            state = _SummaryState(path, "", 0)
+            obj.__dict__[self.state_name] = state
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+            delta = value
+        state.text = value
+        self._append(obj, state, delta)
+
+    def share(self, source: Any, target: Any) -> None:
+        """Make `target` append to the summary of `source` without re-reading the file.
+
+        Both objects should have the same `env` path, they see the combined text.
+        """
+        target.__dict__[self.state_name] = self._state(source)
+
+    def _state(self, obj: Any) -> _SummaryState:
+        path = getattr(obj.env, self.var_name)
+        state = obj.__dict__.get(self.state_name)
+        if state is None or state.path != path:
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                data = b""
+            state = _SummaryState(path, data.decode("utf-8"), len(data))
+            obj.__dict__[self.state_name] = state
+        return state
+
+    def _append(self, obj: Any, state: _SummaryState, delta: str) -> None:
+        if not delta:
+            return
+        data = masker.mask(delta).encode("utf-8")
+        limit: int = obj.summary_limit
+        policy: SummaryOverflow = obj.summary_overflow
+        if state.spill_path is not None:
+            _append_bytes(state.spill_path, data)
+            return
+        if state.marker_written and policy == "truncate":
+            return
+        room = limit if state.marker_written else limit - MARKER_RESERVE
+        if state.size + len(data) <= room:
+            self._write(state, data)
+            return
+
+        if policy == "spill":
+            state.spill_path = runner_temp_dir(obj.env) / f"{obj.__class__.__name__}-summary.md"
+            state.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            state.spill_path.write_text(masker.mask(state.text), encoding="utf-8")
+            marker = SPILLED_MARKER.format(limit=limit, path=state.spill_path)
+        elif policy == "truncate":
+            part = data[: max(room - state.size, 0)]
+            self._write(state, part.decode("utf-8", errors="ignore").encode("utf-8"))
+            marker = TRUNCATED_MARKER.format(limit=limit)
+        elif policy == "drop":
+            if state.marker_written:
+                return
+            marker = DROPPED_MARKER.format(limit=limit)
+        else:
+            raise ValueError(f"Unknown summary overflow policy `{policy}`")
+        if not state.marker_written:
+            self._write(state, marker.encode("utf-8"))
+            state.marker_written = True
+
+    @staticmethod
+    def _write(state: _SummaryState, data: bytes) -> None:
+        _append_bytes(state.path, data)
+        state.size += len(data)
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    with path.open("ab") as file:
+        file.write(data)
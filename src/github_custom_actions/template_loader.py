@@ -0,0 +1,83 @@
+"""Template search path for `ActionBase.render_template()`.
+
+Search path entries are tried in order:
+
+- directory path, like `$GITHUB_ACTION_PATH/templates`
+- `package:<name>` or `package:<name>/<dir>` - templates shipped in the Python package
+  (`templates` dir by default), also from a zipped package
+- `<archive>.zip` or `<archive>.zip/<dir>` - templates in a zip archive
+
+Jinja environments are cached per search path, so templates are found and compiled once
+per process. Without `auto_reload` the compiled templates are reused without checking
+if the files changed, so repeated renders do not touch the file system.
+"""
+
+import posixpath
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemLoader,
+    PackageLoader,
+    TemplateNotFound,
+)
+
+TEMPLATES_DIR = "templates"
+PACKAGE_PREFIX = "package:"
+PACKAGE_TEMPLATES_DIR = Path(__file__).resolve().parent / TEMPLATES_DIR
+"""Templates dir of this package, the last entry of the default search path."""
+
+
+class ZipLoader(BaseLoader):
+    """Load templates from a zip archive, optionally from a dir inside it."""
+
+    def __init__(self, archive: Path, prefix: str = "") -> None:
+        """Init with the archive path and the dir in the archive."""
+        self.archive = archive
+        self.prefix = prefix.strip("/")
+
+    def get_source(
+        self,
+        environment: Environment,  # noqa: ARG002  # jinja loader interface
+        template: str,
+    ) -> Tuple[str, Optional[str], Optional[Callable[[], bool]]]:
+        name = posixpath.join(self.prefix, template) if self.prefix else template
+        try:
+            mtime = self.archive.stat().st_mtime
+            with zipfile.ZipFile(self.archive) as archive:
+                source = archive.read(name).decode("utf-8")
+        except (OSError, KeyError) as exc:
+            raise TemplateNotFound(template) from exc
+        return source, f"{self.archive}/{name}", lambda: self.archive.stat().st_mtime == mtime
+
+
+def search_path_loader(entry: str) -> BaseLoader:
+    """Jinja loader for the search path entry."""
+    if entry.startswith(PACKAGE_PREFIX):
+        package, _, directory = entry[len(PACKAGE_PREFIX) :].partition("/")
+        return PackageLoader(package, directory or TEMPLATES_DIR)
+    archive, zip_ext, prefix = entry.partition(".zip")
+    if zip_ext and (not prefix or prefix.startswith("/")):
+        return ZipLoader(Path(archive + zip_ext), prefix)
+    return FileSystemLoader(entry)
+
+
+@lru_cache(maxsize=None)
+def template_environment(search_path: Tuple[str, ...], auto_reload: bool = False) -> Environment:
+    """Jinja environment shared by all actions with the search path."""
+    return Environment(  # noqa: S701
+        loader=ChoiceLoader([search_path_loader(entry) for entry in search_path]),
+        auto_reload=auto_reload,
+    )
+
+
+def default_search_path(dirs: Sequence[Any]) -> Tuple[str, ...]:
+    """`templates` in each of the dirs that is set, then the package templates dir."""
+    return tuple(str(Path(directory) / TEMPLATES_DIR) for directory in dirs if directory) + (
+        str(PACKAGE_TEMPLATES_DIR),
+    )
@@ -0,0 +1,154 @@
+"""Run external tools streaming their output with bounded memory."""
+
+import asyncio
+import re
+import subprocess
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from github_custom_actions.annotations import AnnotationCollector
+
+TAIL_LINES = 50
+LINE_LIMIT = 1024 * 1024
+"""Max line length, longer lines are split."""
+
+SEVERITY_ALIASES = {
+    "error": "error",
+    "fatal": "error",
+    "warning": "warning",
+    "warn": "warning",
+    "note": "notice",
+    "notice": "notice",
+    "info": "notice",
+}
+
+Command = Sequence[Union[str, Path]]
+
+
+class ToolResult(NamedTuple):
+    args: List[str]
+    returncode: int
+    tail: List[str]
+    """Last lines of stdout and stderr."""
+    annotations: int
+    """Number of lines matched by the `pattern`."""
+
+
+class _LineHandler:
+    """Tee a line to the log, keep the tail and parse annotations."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        pattern: Optional[str],
+        severity: str,
+        annotations: Optional[AnnotationCollector],
+        tail_lines: int,
+        prefix: str,
+        on_line: Optional[Callable[[str], None]],
+    ) -> None:
+        self.regexp = re.compile(pattern) if pattern else None
+        self.severity = severity
+        self.annotations = annotations
+        self.tail: deque = deque(maxlen=tail_lines)
+        self.prefix = prefix
+        self.on_line = on_line
+        self.matched = 0
+
+    def __call__(self, line: str, log: object) -> None:
+        print(f"{self.prefix}{line}", file=log, flush=True)  # type: ignore[arg-type]
+        self.tail.append(line)
+        if self.on_line is not None:
+            self.on_line(line)
+        if self.regexp is None:
+            return
+        match = self.regexp.search(line)
+        if match is None:
+            return
+        self.matched += 1
+        if self.annotations is None:
+            return
+        groups: Dict[str, Optional[str]] = match.groupdict()
+        severity = groups.get("severity")
+        line_no, column = groups.get("line"), groups.get("column")
+        self.annotations.add(
+            SEVERITY_ALIASES.get((severity or "").lower(), self.severity),
+            groups.get("message") or line,
+            file=groups.get("file"),
+            line=int(line_no) if line_no else None,
+            column=int(column) if column else None,
+            rule=groups.get("code"),
+        )
+
+
+async def _pump(stream: asyncio.StreamReader, handler: _LineHandler, log: object) -> None:
+    while True:
+        try:
+            raw = await stream.readuntil(b"\n")
+        except asyncio.IncompleteReadError as exc:  # the last line without newline
+            if exc.partial:
+                handler(exc.partial.decode("utf-8", errors="replace").rstrip("\r"), log)
+            return
+        except asyncio.LimitOverrunError as exc:
+            raw = await stream.readexactly(exc.consumed)
+        handler(raw.decode("utf-8", errors="replace").rstrip("\r\n"), log)
+
+
+async def run_tool_async(  # noqa: PLR0913
+    args: Command,
+    *,
+    pattern: Optional[str] = None,
+    severity: str = "error",
+    annotations: Optional[AnnotationCollector] = None,
+    tail_lines: int = TAIL_LINES,
+    prefix: str = "",
+    on_line: Optional[Callable[[str], None]] = None,
+    check: bool = False,
+    cwd: Optional[Union[str, Path]] = None,
+    env: Optional[Dict[str, str]] = None,
+) -> ToolResult:
+    """Run the tool streaming stdout / stderr line by line.
+
+    Each line is printed to the action log (with `prefix`), the last `tail_lines` are kept
+    for the result, and lines matched by the `pattern` regexp are added to `annotations`.
+    `pattern` uses named groups `file`, `line`, `column`, `severity`, `code`, `message`.
+
+    With `check=True` raises `subprocess.CalledProcessError` with the tail as `output`
+    if the tool fails.
+    """
+    str_args = [str(arg) for arg in args]
+    handler = _LineHandler(pattern, severity, annotations, tail_lines, prefix, on_line)
+    process = await asyncio.create_subprocess_exec(
+        *str_args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+        limit=LINE_LIMIT,
+    )
+    await asyncio.gather(
+        _pump(process.stdout, handler, sys.stdout),  # type: ignore[arg-type]
+        _pump(process.stderr, handler, sys.stderr),  # type: ignore[arg-type]
+    )
+    returncode = await process.wait()
+    result = ToolResult(str_args, returncode, list(handler.tail), handler.matched)
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, str_args, output="\n".join(result.tail))
+    return result
+
+
+async def run_tools_async(commands: Sequence[Command], **kwargs: object) -> List[ToolResult]:
+    """Run the tools concurrently, output lines are prefixed with the tool name."""
+    return list(
+        await asyncio.gather(
+            *(
+                run_tool_async(
+                    command,
+                    prefix=f"[{Path(str(command[0])).name}] ",
+                    **kwargs,  # type: ignore[arg-type]
+                )
+                for command in commands
+            ),
+        ),
+    )
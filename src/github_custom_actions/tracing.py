@@ -0,0 +1,105 @@
+"""Opt-in tracing of the action phases to a Chrome trace file.
+
+Tracing is switched on with the environment variable `ACTION_TRACE`.
+Nested spans (inputs validation, outputs load and save, template rendering, `main()`, ...)
+are written to `<RUNNER_TEMP>/<action class name>.trace.json`, one event per line,
+in the Chrome trace event format, so the file can be opened in `chrome://tracing`
+or [Perfetto](https://ui.perfetto.dev) after downloading it as an artifact.
+
+When tracing is off, `span()` returns a shared no-op context manager.
+"""
+
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from github_custom_actions.profiling import env_flag
+
+TRACE_ENV_VAR = "ACTION_TRACE"
+
+_NO_SPAN: ContextManager[None] = contextlib.nullcontext()
+
+
+class Tracer:
+    """Collect spans as Chrome trace "complete" events."""
+
+    def __init__(self) -> None:
+        """Init empty trace."""
+        self.events: List[Dict[str, Any]] = []
+        self.pid = os.getpid()
+
+    @contextlib.contextmanager
+    def span(self, name: str, args: Dict[str, Any]) -> Iterator[None]:
+        """Record the time spent in the block, even if it raises."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def write(self, path: Path) -> None:
+        """Write the events as JSON array with one event per line."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        events = sorted(self.events, key=lambda event: event["ts"])
+        lines = (json.dumps(event, default=str) for event in events)
+        path.write_text("[\n" + ",\n".join(lines) + "\n]\n", encoding="utf-8")
+
+
+_tracer: Optional[Tracer] = None
+
+
+def tracing_enabled() -> bool:
+    """If `ACTION_TRACE` is set to a true-ish value."""
+    return env_flag(TRACE_ENV_VAR)
+
+
+def tracing_active() -> bool:
+    """If spans are being collected."""
+    return _tracer is not None
+
+
+def start_tracing() -> Tracer:
+    """Start collecting spans in the process, if not started yet."""
+    global _tracer  # noqa: PLW0603
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing(path: Path) -> Optional[Path]:
+    """Stop collecting spans and write them to `path`, None if tracing was not started."""
+    global _tracer  # noqa: PLW0603
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return None
+    tracer.write(path)
+    return path
+
+
+def span(name: str, **args: Any) -> ContextManager[None]:
+    """Trace span of the block, `args` are shown in the trace viewer.
+
+    Usage:
+        ```python
+        with span("download", url=url):
+            ...
+        ```
+    """
+    if _tracer is None:
+        return _NO_SPAN
+    return _tracer.span(name, args)
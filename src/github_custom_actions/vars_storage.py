@@ -0,0 +1,185 @@
+"""Storage backends for `FileAttrDictVars`: file, in-memory and file object."""
+
+import io
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, ContextManager, Iterator, Optional
+
+
+class VarsStorage:
+    """Where `FileAttrDictVars` keeps the `key=value` text.
+
+    Implement `read_text()` and `open_write()` to add a backend,
+    and `open_tail()` / `open_append()` if the backend can write the end of the text in place.
+    """
+
+    def read_text(self) -> str:
+        """Stored text, raise `FileNotFoundError` if nothing is stored yet."""
+        raise NotImplementedError
+
+    def open_write(self) -> ContextManager[IO[bytes]]:
+        """Context manager with a binary stream that replaces the stored text."""
+        raise NotImplementedError
+
+    @contextmanager
+    def open_tail(self, offset: int) -> Iterator[IO[bytes]]:
+        """Context manager with a binary stream that replaces the stored bytes after `offset`.
+
+        The default implementation rewrites the whole text.
+        """
+        try:
+            head = self.read_text().encode("utf-8")[:offset]
+        except FileNotFoundError:
+            head = b""
+        with self.open_write() as file:
+            file.write(head)
+            yield file
+
+    @contextmanager
+    def open_append(self) -> Iterator[IO[bytes]]:
+        """Context manager with a binary stream that appends lines to the stored text.
+
+        A newline is added first if the stored text does not end with it.
+        The default implementation rewrites the whole text.
+        """
+        try:
+            head = self.read_text().encode("utf-8")
+        except FileNotFoundError:
+            head = b""
+        with self.open_write() as file:
+            file.write(_line_end(head))
+            yield file
+
+
+def _line_end(data: bytes) -> bytes:
+    """`data` ending with a newline if it is not empty."""
+    return data if not data or data.endswith(b"\n") else data + b"\n"
+
+
+def _end_line(file: IO[bytes]) -> None:
+    """Add a newline at the end of the file, if it is not empty and does not end with it."""
+    if file.seek(0, io.SEEK_END) > 0:
+        file.seek(-1, io.SEEK_END)
+        if file.read(1) != b"\n":
+            file.seek(0, io.SEEK_END)
+            file.write(b"\n")
+
+
+class FileStorage(VarsStorage):
+    """Vars in a file, like `GITHUB_OUTPUT`."""
+
+    def __init__(self, path: Path) -> None:
+        """Init with the file path, the file and its parents are created on write."""
+        self.path = path
+
+    def read_text(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+    @contextmanager
+    def open_write(self) -> Iterator[IO[bytes]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("wb") as file:
+            yield file
+
+    @contextmanager
+    def open_tail(self, offset: int) -> Iterator[IO[bytes]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        with os.fdopen(fd, "r+b") as file:
+            file.truncate(offset)
+            file.seek(offset)
+            yield file
+
+    @contextmanager
+    def open_append(self) -> Iterator[IO[bytes]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a+b") as file:
+            _end_line(file)
+            yield file
+
+    def __str__(self) -> str:
+        return str(self.path)
+
+
+class MemoryStorage(VarsStorage):
+    """Vars in memory, no disk I/O.
+
+    Usage:
+        ```python
+        storage = MemoryStorage()
+        action = MyAction(outputs_storage=storage)
+        action.run()
+        print(storage.text)
+        ```
+    """
+
+    def __init__(self, text: Optional[str] = None) -> None:
+        """Init with the initial text, None means nothing is stored yet."""
+        self.data = None if text is None else text.encode("utf-8")
+
+    @property
+    def text(self) -> str:
+        """Stored text, empty if nothing is stored."""
+        return "" if self.data is None else self.data.decode("utf-8")
+
+    def read_text(self) -> str:
+        if self.data is None:
+            raise FileNotFoundError("Nothing is stored in memory")
+        return self.text
+
+    @contextmanager
+    def open_write(self) -> Iterator[IO[bytes]]:
+        buffer = io.BytesIO()
+        yield buffer
+        self.data = buffer.getvalue()
+
+    @contextmanager
+    def open_tail(self, offset: int) -> Iterator[IO[bytes]]:
+        buffer = io.BytesIO()
+        yield buffer
+        self.data = (self.data or b"")[:offset] + buffer.getvalue()
+
+    @contextmanager
+    def open_append(self) -> Iterator[IO[bytes]]:
+        buffer = io.BytesIO()
+        yield buffer
+        self.data = _line_end(self.data or b"") + buffer.getvalue()
+
+    def __str__(self) -> str:
+        return "<memory>"
+
+
+class FileObjectStorage(VarsStorage):
+    """Vars in an open seekable binary file object, for example a shared buffer."""
+
+    def __init__(self, file: IO[bytes]) -> None:
+        """Init with the file object open for reading and writing."""
+        self.file = file
+
+    def read_text(self) -> str:
+        self.file.seek(0)
+        return self.file.read().decode("utf-8")
+
+    @contextmanager
+    def open_write(self) -> Iterator[IO[bytes]]:
+        self.file.seek(0)
+        self.file.truncate()
+        yield self.file
+        self.file.flush()
+
+    @contextmanager
+    def open_tail(self, offset: int) -> Iterator[IO[bytes]]:
+        self.file.seek(offset)
+        self.file.truncate()
+        yield self.file
+        self.file.flush()
+
+    @contextmanager
+    def open_append(self) -> Iterator[IO[bytes]]:
+        _end_line(self.file)
+        yield self.file
+        self.file.flush()
+
+    def __str__(self) -> str:
+        return str(getattr(self.file, "name", "<file object>"))
@@ -0,0 +1,184 @@
+"""Warm worker: run many action invocations in one long-lived interpreter.
+
+Interpreter startup, imports, action class metadata and compiled templates are paid once.
+Each invocation gets fresh `env`, `inputs` and `outputs` built from the environment
+sent by the client, so the worker can serve all steps of a job on a self-hosted runner.
+
+Start the worker once in the job, and replace `python my_action.py` in the steps with
+the thin client:
+```bash
+python -m github_custom_actions.worker serve my_action:MyAction --socket "$RUNNER_TEMP/a.sock" &
+...
+python -m github_custom_actions.worker call --socket "$RUNNER_TEMP/a.sock"
+...
+python -m github_custom_actions.worker stop --socket "$RUNNER_TEMP/a.sock"
+```
+
+Without `--socket` the worker reads requests from stdin and writes responses to stdout.
+
+The protocol is one JSON object per line.
+Request `{"env": {...}, "cwd": "..."}`,
+response `{"exit_code": 0, "stdout": "...", "stderr": "..."}`.
+Request `{"command": "stop"}` stops the worker.
+If the action or the request fails outside of `ActionBase.run()`, the response has
+`exit_code` 1 and the traceback in `stderr`, the worker keeps serving.
+
+Invocations run one at a time because the environment and the working dir are per process.
+The action output is sent to the client after the invocation, not streamed.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import traceback
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Type, Union
+
+from github_custom_actions.action_base import ActionBase
+from github_custom_actions.local_runner import invoke_action
+
+STOP_COMMAND = "stop"
+RESPONSE_KEYS = ("exit_code", "stdout", "stderr")
+
+
+class ActionWorker:
+    """Serve action invocations keeping the action class warm.
+
+    Usage:
+        ```python
+        worker = ActionWorker(MyAction)
+        response = worker.invoke(dict(os.environ))
+        worker.serve_socket(Path(os.environ["RUNNER_TEMP"]) / "a.sock")
+        ```
+    """
+
+    def __init__(self, action_class: Type[ActionBase]) -> None:
+        """Init with the action class, its type hints are resolved once here."""
+        self.action_class = action_class
+        action_class.get_type_hints()
+
+    def invoke(self, env: Dict[str, str], cwd: Optional[str] = None) -> Dict[str, Any]:
+        """Run the action once with the `env` as the whole environment, see `invoke_action()`.
+
+        Any exception (like an error in the action `__init__`) is returned as exit code 1
+        with the traceback in `stderr`, so it does not stop the worker.
+        """
+        return invoke_action(self.action_class, env, cwd)._asdict()
+
+    def handle(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Process one request, None means the worker should stop."""
+        if request.get("command") == STOP_COMMAND:
+            return None
+        return self.invoke(request["env"], request.get("cwd"))
+
+    def serve_stream(self, rfile: IO[bytes], wfile: IO[bytes]) -> bool:
+        """Serve requests until EOF, return False if asked to stop."""
+        for line in rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.handle(json.loads(line))
+            except Exception:  # noqa: BLE001  # bad request, answer and keep serving
+                response = {"exit_code": 1, "stdout": "", "stderr": traceback.format_exc()}
+            if response is None:
+                return False
+            wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            wfile.flush()
+        return True
+
+    def serve_socket(self, path: Union[str, Path]) -> None:
+        """Serve clients on the Unix socket until a stop request."""
+        worker = self
+        running = True
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                nonlocal running
+                running = worker.serve_stream(self.rfile, self.wfile)
+
+        path = Path(path)
+        if path.exists():
+            path.unlink()
+        with socketserver.UnixStreamServer(str(path), Handler) as server:
+            try:
+                while running:
+                    server.handle_request()
+            finally:
+                path.unlink()
+
+
+def call_worker(
+    socket_path: Union[str, Path],
+    env: Optional[Dict[str, str]] = None,
+    cwd: Optional[str] = None,
+) -> int:
+    """Run the action in the worker as if it was started in this process.
+
+    Sends this process environment and working dir, prints the action output,
+    returns the action exit code, or 1 if the worker did not send a valid response.
+    """
+    request = {"env": dict(os.environ if env is None else env), "cwd": cwd or os.getcwd()}
+    response = _request(socket_path, request)
+    if not isinstance(response, dict) or any(key not in response for key in RESPONSE_KEYS):
+        sys.stderr.write(f"Unexpected response from the worker: {response!r}\n")
+        return 1
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return int(response["exit_code"])
+
+
+def stop_worker(socket_path: Union[str, Path]) -> None:
+    """Ask the worker to stop."""
+    _request(socket_path, {"command": STOP_COMMAND})
+
+
+def _request(socket_path: Union[str, Path], request: Dict[str, Any]) -> Dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:  # type: ignore[attr-defined]
+        sock.connect(str(socket_path))
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            sock.shutdown(socket.SHUT_WR)
+            line = stream.readline()
+    return json.loads(line) if line else {}
+
+
+def load_action_class(spec: str) -> Type[ActionBase]:
+    """Import the action class by `module:Class`, the module is searched from the current dir."""
+    module_name, _, class_name = spec.partition(":")
+    if not class_name:
+        raise ValueError(f"Expected `module:Class`, got `{spec}`")
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    return getattr(importlib.import_module(module_name), class_name)  # type: ignore[no-any-return]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m github_custom_actions.worker")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="Start the worker")
+    serve.add_argument("action", help="Action class as `module:Class`")
+    serve.add_argument("--socket", help="Unix socket path, stdin / stdout if not set")
+    for name, help_text in (("call", "Run the action in the worker"), ("stop", "Stop the worker")):
+        commands.add_parser(name, help=help_text).add_argument("--socket", required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "call":
+        return call_worker(args.socket)
+    if args.command == "stop":
+        stop_worker(args.socket)
+        return 0
+    worker = ActionWorker(load_action_class(args.action))
+    if args.socket:
+        worker.serve_socket(args.socket)
+    else:
+        worker.serve_stream(sys.stdin.buffer, sys.stdout.buffer)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,8 @@ def get_allowed_doc_languages():
 
 ALLOWED_DOC_LANGUAGES = get_allowed_doc_languages()
 ALLOWED_VERSION_TYPES = ["release", "bug", "feature"]
+BENCHMARK_CMD = "python -m pytest benchmarks --benchmark-storage=benchmarks/baselines"
+BENCHMARK_REGRESSION_THRESHOLD = "mean:25%"
 
 
 @task
@@ -83,6 +85,27 @@ def uv(c: Context):
     c.run("curl -LsSf https://astral.sh/uv/install.sh | sh")
 
 
+@task
+def bench(c: Context):
+    """Run benchmarks and fail on regressions against the saved baseline."""
+    c.run(
+        f"{BENCHMARK_CMD} --benchmark-compare "
+        f"--benchmark-compare-fail={BENCHMARK_REGRESSION_THRESHOLD}",
+    )
+
+
+@task
+def bench_save(c: Context):
+    """Run benchmarks and save the results as the new baseline."""
+    c.run(f"{BENCHMARK_CMD} --benchmark-save=baseline")
+
+
+@task
+def importtime(c: Context):
+    """Show the heaviest imports of the package (`python -X importtime`)."""
+    c.run("python benchmarks/importtime.py")
+
+
 @task
 def pre(c):
     """Run pre-commit checks"""
@@ -41,6 +41,12 @@ class Action(ActionBase):
     outputs: Outputs
 
 
+@pytest.fixture
+def action_class():
+    """Action class for tests that create the action themselves."""
+    return Action
+
+
 @pytest.fixture(scope="function")
 def action(inputs, outputs):
     return Action()
@@ -3,6 +3,7 @@ import os
 import pytest
 from unittest.mock import patch, MagicMock
 from github_custom_actions.action_base import ActionBase, ActionInputs, ActionOutputs, GithubVars
+from github_custom_actions.attr_dict_vars import VarField
 
 
 def test_action_base_summary(action):
@@ -130,3 +131,32 @@ def test_file_text_property(test_action, tmp_path, file_exists):
         new_content = "New content"
         test_action.summary = new_content
         assert test_file.read_text() == new_content
+
+
+class ValidatedInputs(ActionInputs):
+    name: str
+    level: str
+
+    _fields = {
+        "name": VarField("name", required=True),
+        "level": VarField("level", choices=("low", "high")),
+    }
+
+
+class ValidatedAction(ActionBase):
+    inputs: ValidatedInputs
+    outputs: MockOutputs
+
+    def main(self):
+        raise AssertionError("main() should not run with invalid inputs")
+
+
+def test_run_validates_inputs_before_main(mock_env_vars, capsys):
+    with patch.dict(os.environ, {"INPUT_LEVEL": "max"}), pytest.raises(SystemExit) as exc:
+        ValidatedAction().run()
+    assert exc.value.code == 1
+    errors = [line for line in capsys.readouterr().out.splitlines() if line.startswith("::error")]
+    assert errors == [
+        "::error title=Invalid input::`name` (INPUT_NAME) is required",
+        "::error title=Invalid input::`level` `max` is not one of `low`, `high`",
+    ]
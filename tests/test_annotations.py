@@ -0,0 +1,77 @@
+import pytest
+
+from github_custom_actions.annotations import AnnotationCollector
+from github_custom_actions.vars_storage import MemoryStorage
+
+
+def test_annotations_top_and_dedup():
+    collector = AnnotationCollector(max_per_severity=2)
+    for i in range(5):
+        collector.add("warning", f"W{i}", file="b.py", line=i, rule="W1")
+    collector.add("warning", "W0", file="b.py", line=0, rule="W1")
+    collector.add("warning", "Important", file="a.py", line=9, priority=1)
+    collector.add("error", "E", file="a.py", line=1, rule="E1")
+
+    assert len(collector) == 7
+    assert collector.duplicates == 1
+    assert [(a.severity, a.message) for a in collector.top()] == [
+        ("error", "E"),
+        ("warning", "Important"),
+        ("warning", "W0"),
+    ]
+
+
+def test_annotations_dedup_window():
+    collector = AnnotationCollector(max_seen=2)
+    for message in ("a", "b", "a", "c", "b", "a"):
+        collector.add("notice", message)
+    assert collector.duplicates == 1
+    assert len(collector._seen) == 2
+
+
+def test_annotations_unknown_severity():
+    with pytest.raises(ValueError, match="severity"):
+        AnnotationCollector().add("fatal", "x")
+
+
+def test_annotations_summary():
+    collector = AnnotationCollector(max_groups=2)
+    collector.add("error", "E", file="a.py", rule="E1")
+    collector.add("warning", "W", file="a.py", rule="E1")
+    collector.add("notice", "N", file="b.py", rule="N1")
+    collector.add("notice", "N", file="c.py", rule="N1")
+    collector.add("notice", "N", file="c.py", rule="N|2")
+
+    summary = collector.render_summary(max_rows=2)
+    assert "Shown 5 of 5 annotations." in summary
+    assert "| a.py | E1 | 1 | 1 | 0 |" in summary
+    assert "1 more file / rule groups are not shown." in summary
+
+
+def test_run_emits_annotations(action, capsys):
+    action.annotations = AnnotationCollector(max_per_severity=1)
+
+    def main():
+        action.annotations.add("error", "First", file="a.py", line=1)
+        action.annotations.add("error", "Second", file="a.py", line=2)
+
+    action.main = main
+    action.run()
+
+    assert capsys.readouterr().out == "::error file=a.py,line=1::First\n"
+    assert "Shown 1 of 2 annotations." in action.summary
+
+
+def test_run_annotations_without_step_summary(inputs, action_class, monkeypatch, capsys):
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+    action = action_class(outputs_storage=MemoryStorage())
+
+    def main():
+        action.annotations.add("warning", "Careful")
+        raise ValueError("failed")
+
+    action.main = main
+    with pytest.raises(SystemExit) as exc_info:
+        action.run()
+    assert exc_info.value.code == 1
+    assert "::warning::Careful" in capsys.readouterr().out
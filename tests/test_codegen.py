@@ -0,0 +1,83 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+from github_custom_actions import ActionInputs
+from github_custom_actions.codegen import action_fields, check_class, load_action_yml, main
+
+pytest.importorskip("yaml")
+
+ACTION_YML = """
+name: Demo
+inputs:
+  my-input:
+    description: |
+      The "input".
+    required: true
+  report-file:
+    default: report.json
+  dry_run:
+    default: false
+outputs:
+  result:
+    description: The result
+"""
+
+
+@pytest.fixture
+def action_yml(tmp_path):
+    path = tmp_path / "action.yml"
+    path.write_text(ACTION_YML)
+    return path
+
+
+def _import(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_classes(action_yml, tmp_path, monkeypatch):
+    module_path = tmp_path / "generated_io.py"
+    assert main([str(action_yml), "-o", str(module_path), "--path", "report-file"]) == 0
+    module = _import(module_path)
+
+    monkeypatch.setenv("INPUT_MY-INPUT", "value")
+    monkeypatch.setenv("INPUT_DRY_RUN", "true")
+    inputs = module.Inputs()
+    assert inputs.my_input == "value"
+    assert inputs.report_file == Path("report.json")  # default from action.yml
+    assert inputs.dry_run == "true"  # the name with underscore as in action.yml
+    assert module.Inputs.__doc__ is None
+    assert module.Inputs._fields["my_input"].required
+    assert set(module.Outputs.get_type_hints()) == {"result"}
+
+    inputs_fields, outputs_fields = action_fields(load_action_yml(action_yml), ["report-file"])
+    assert check_class(module.Inputs, inputs_fields) == []
+    assert check_class(module.Outputs, outputs_fields) == []
+
+
+def test_check_mode(action_yml, tmp_path, capsys):
+    module_path = tmp_path / "generated_io.py"
+    assert main([str(action_yml), "-o", str(module_path), "--check"]) == 1
+    main([str(action_yml), "-o", str(module_path)])
+    assert main([str(action_yml), "-o", str(module_path), "--check"]) == 0
+
+    action_yml.write_text(ACTION_YML.replace("dry_run", "force"))
+    capsys.readouterr()
+    assert main([str(action_yml), "-o", str(module_path), "--check"]) == 1
+    assert '+        "force": VarField("force", default="false"),' in capsys.readouterr().err
+
+
+def test_check_hand_written_class(action_yml):
+    class Inputs(ActionInputs):
+        my_input: str
+        extra: str
+
+    inputs_fields, _ = action_fields(load_action_yml(action_yml))
+    assert check_class(Inputs, inputs_fields) == [
+        "Inputs.report_file is missing",
+        "Inputs.dry_run is missing",
+        "Inputs.extra is not in action.yml",
+    ]
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
+from github_custom_actions.attr_dict_vars import VarField
 from github_custom_actions.env_attr_dict_vars import EnvAttrDictVars
 
 
@@ -66,3 +67,77 @@ def test_env_attr_dict_vars_iterating_variables():
     with pytest.raises(NotImplementedError):
         for key in vars:
             pass
+
+
+class ValidatedVars(EnvAttrDictVars):
+    count: int
+    mode: str
+    tag: str
+    dry_run: bool
+
+    _fields = {
+        "count": VarField("count", type=int, required=True),
+        "mode": VarField("mode", choices=("fast", "full"), default="fast"),
+        "tag": VarField("tag", pattern=r"v\d+"),
+        "dry_run": VarField("dry-run", type=bool, default="false"),
+    }
+
+    def _external_name(self, name: str) -> str:
+        return "INPUT_" + name.upper()
+
+
+def test_env_attr_dict_vars_validate_all_problems():
+    with patch.dict(
+        "os.environ",
+        {"INPUT_MODE": "slow", "INPUT_TAG": "latest", "INPUT_DRY-RUN": "yes"},
+    ):
+        assert ValidatedVars().validate_inputs() == [
+            "`count` (INPUT_COUNT) is required",
+            "`mode` `slow` is not one of `fast`, `full`",
+            "`tag` `latest` does not match `v\\d+`",
+            "`dry-run` is not a valid bool: `yes` is not `true` or `false`",
+        ]
+
+
+def test_env_attr_dict_vars_validated_values():
+    with patch.dict("os.environ", {"INPUT_COUNT": "3", "INPUT_TAG": ""}):
+        vars = ValidatedVars()
+        assert vars.validate_inputs() == []
+        assert vars.count == 3
+        assert vars.mode == "fast"
+        assert vars.dry_run is False
+
+
+class OptionalVars(EnvAttrDictVars):
+    _fields = {
+        "count": VarField("count", type=int),
+        "retries": VarField("retries", type=int, default="3"),
+        "dry_run": VarField("dry-run", type=bool),
+        "name": VarField("name"),
+    }
+
+    def _external_name(self, name: str) -> str:
+        return "INPUT_" + name.upper()
+
+
+def test_env_attr_dict_vars_empty_optional_values():
+    empty = {"INPUT_COUNT": "", "INPUT_RETRIES": "", "INPUT_DRY-RUN": "", "INPUT_NAME": ""}
+    with patch.dict("os.environ", empty):
+        vars = OptionalVars()
+        assert vars.validate_inputs() == []
+        assert vars.count is None
+        assert vars.retries == 3
+        assert vars.dry_run is None
+        assert vars.name == ""
+
+
+class HandWrittenVars(EnvAttrDictVars):
+    count: int
+
+    def _external_name(self, name: str) -> str:
+        return "INPUT_" + name.upper()
+
+
+def test_env_attr_dict_vars_hand_written_not_converted():
+    with patch.dict("os.environ", {"INPUT_COUNT": "03"}):
+        assert HandWrittenVars().count == "03"
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from github_custom_actions import event_payload
+from github_custom_actions.event_payload import EventPayload
+
+PAYLOAD = {
+    "after": "abc",
+    "commits": [
+        {"id": "1", "message": 'Fix "quotes" and {braces} [x]'},
+        {"id": "2", "message": "Second\nline"},
+    ],
+    "empty": [],
+    "pull_request": {"number": 42, "head": {"sha": "deadbeef"}, "draft": False},
+}
+
+
+@pytest.fixture
+def event_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(event_payload, "_text_cache", {})
+    monkeypatch.setattr(event_payload, "_data_cache", {})
+    path = tmp_path / "event.json"
+    path.write_text(json.dumps(PAYLOAD, indent=2))
+    return path
+
+
+@pytest.mark.parametrize("full_load", [False, True])
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("pull_request.head.sha", "deadbeef"),
+        ("pull_request.number", 42),
+        ("pull_request.draft", False),
+        ("commits.1.id", "2"),
+        ("commits.1.message", "Second\nline"),
+        ("commits.5.id", None),
+        ("pull_request.missing", None),
+        ("after.x", None),
+    ],
+)
+def test_event_get(event_file, full_load, path, expected):
+    event = EventPayload(event_file)
+    if full_load:
+        assert event["after"] == "abc"
+    assert event.get(path) == expected
+
+
+def test_event_iter_items(event_file):
+    event = EventPayload(event_file)
+    assert list(event.iter_items("commits")) == PAYLOAD["commits"]
+    assert list(event.iter_items("empty")) == []
+    with pytest.raises(TypeError):
+        list(event.iter_items("pull_request"))
+
+
+def test_event_cached_per_process(event_file):
+    assert EventPayload(event_file).get("after") == "abc"
+    event_file.write_text("{}")
+    assert EventPayload(event_file).get("after") == "abc"
+
+
+def test_action_event(action, event_file, monkeypatch):
+    monkeypatch.setenv("GITHUB_EVENT_PATH", str(event_file))
+    assert action.event.get("pull_request.number") == 42
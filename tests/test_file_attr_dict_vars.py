@@ -157,3 +157,46 @@ def test_file_attr_dict_vars_read_prefixed_names(temp_vars_file):
 
     vars["undocumented_var"] = "value3"
     assert temp_vars_file.read_text() == "ext!_undocumented_var=value3\next!_documented-var=value2"
+
+
+def test_file_attr_dict_vars_set_from_file(temp_vars_file, tmp_path):
+    report = tmp_path / "report.json"
+    report.write_text('{\n  "a": 1\n}')
+
+    vars = FileAttrDictVars(temp_vars_file)
+    vars["before"] = "1"
+    value = vars.set_from_file("report", report)
+    vars["after"] = "2"
+
+    assert vars["report"] == report.read_text()
+    assert value.read_text() == report.read_text()
+    assert temp_vars_file.read_text() == (
+        f'report<<{value.delimiter}\n{{\n  "a": 1\n}}\n{value.delimiter}\nbefore=1\nafter=2'
+    )
+
+    reloaded = FileAttrDictVars(temp_vars_file)
+    assert dict(reloaded) == {"report": report.read_text(), "before": "1", "after": "2"}
+    reloaded["after"] = "3"
+    assert dict(FileAttrDictVars(temp_vars_file))["report"] == report.read_text()
+
+
+def test_file_attr_dict_vars_set_from_file_written_once(temp_vars_file, tmp_path):
+    report = tmp_path / "report.txt"
+    report.write_text("big")
+    vars = FileAttrDictVars(temp_vars_file)
+    value = vars.set_from_file("report", report)
+    report.unlink()  # the content is already in the vars file
+
+    vars["a"] = "1"
+    vars["a"] = "2"
+    assert vars["report"] == "big"
+    assert temp_vars_file.read_text() == f"report<<{value.delimiter}\nbig\n{value.delimiter}\na=2"
+
+    del vars["report"]
+    assert temp_vars_file.read_text() == "a=2"
+
+
+def test_file_attr_dict_vars_set_from_missing_file(temp_vars_file, tmp_path):
+    vars = FileAttrDictVars(temp_vars_file)
+    with pytest.raises(FileNotFoundError):
+        vars.set_from_file("report", tmp_path / "missing.json")
@@ -0,0 +1,118 @@
+import re
+from pathlib import Path
+
+import pytest
+from github_custom_actions import ActionInputs
+from github_custom_actions.globs import (
+    GlobPattern,
+    clear_glob_cache,
+    expand_globs,
+    gitignore_rules,
+    glob_regex,
+    is_ignored,
+)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    files = [
+        "setup.py",
+        "src/app/main.py",
+        "src/app/data.json",
+        "src/app/build/gen.py",
+        "src/app/keep.log",
+        "src/app/other.log",
+        "src/tests/test_main.py",
+        "node_modules/pkg/index.py",
+        ".git/hooks/hook.py",
+        "docs/conf.py",
+    ]
+    for name in files:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+    (tmp_path / ".gitignore").write_text("# comment\nbuild/\n*.log\n/docs\n")
+    (tmp_path / "src" / "app" / ".gitignore").write_text("!keep.log\n")
+    clear_glob_cache()
+    return tmp_path
+
+
+def _expand(patterns, root, **kwargs):
+    return sorted(
+        path.relative_to(root).as_posix() for path in expand_globs(patterns, root, **kwargs)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern,path,matches",
+    [
+        ("**/*.py", "a.py", True),
+        ("**/*.py", "a/b/c.py", True),
+        ("*.py", "a/b.py", False),
+        ("src/**", "src/a/b", True),
+        ("file?.[ch]", "file1.c", True),
+        ("file[!0-9].c", "file1.c", False),
+    ],
+)
+def test_glob_regex(pattern, path, matches):
+    assert bool(re.fullmatch(glob_regex(pattern), path)) is matches
+
+
+def test_gitignore_rules():
+    rules = gitignore_rules("build/\n/top.txt\n*.tmp\n!keep.tmp\ndoc/*.md\n", "sub")
+    assert is_ignored(rules, "sub/a/build", is_dir=True)
+    assert not is_ignored(rules, "sub/a/build", is_dir=False)
+    assert is_ignored(rules, "sub/top.txt", is_dir=False)
+    assert not is_ignored(rules, "sub/a/top.txt", is_dir=False)
+    assert is_ignored(rules, "sub/a/x.tmp", is_dir=False)
+    assert not is_ignored(rules, "sub/a/keep.tmp", is_dir=False)
+    assert is_ignored(rules, "sub/doc/a.md", is_dir=False)
+    assert not is_ignored(rules, "other/x.tmp.txt", is_dir=False)
+
+
+def test_expand_globs_prunes_and_respects_gitignore(workspace):
+    assert _expand(["**/*.py"], workspace) == [
+        "setup.py",
+        "src/app/main.py",
+        "src/tests/test_main.py",
+    ]
+    assert _expand(["src/**/*.log", "src/app/*.json"], workspace) == [
+        "src/app/data.json",
+        "src/app/keep.log",
+    ]
+    assert _expand(["**/*.py", "!src/tests/**"], workspace, gitignore=False, exclude=()) == [
+        ".git/hooks/hook.py",
+        "docs/conf.py",
+        "node_modules/pkg/index.py",
+        "setup.py",
+        "src/app/build/gen.py",
+        "src/app/main.py",
+    ]
+
+
+def test_expand_globs_cached(workspace, monkeypatch):
+    assert _expand(["src/**/*.py"], workspace) == ["src/app/main.py", "src/tests/test_main.py"]
+    monkeypatch.setattr("github_custom_actions.globs._Walker", None)  # must not rescan
+    assert _expand(["src/**/*.py"], workspace) == ["src/app/main.py", "src/tests/test_main.py"]
+    monkeypatch.undo()
+    (workspace / "src" / "new.py").write_text("")
+    (workspace / "src" / "tests" / "test_main.py").unlink()
+    assert _expand(["src/**/*.py"], workspace) == ["src/app/main.py", "src/new.py"]
+
+
+def test_expand_globs_skips_dir_symlinks(workspace):
+    (workspace / "src" / "link").symlink_to(workspace / "src")
+    (workspace / "src" / "main.py").symlink_to(workspace / "src" / "app" / "main.py")
+    assert _expand(["src/*"], workspace) == ["src/main.py"]
+
+
+def test_glob_pattern_input(workspace, monkeypatch):
+    class Inputs(ActionInputs):
+        files: GlobPattern
+
+    monkeypatch.setenv("INPUT_FILES", "src/**/*.py\n\n!**/test_*.py\n")
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(workspace))
+    files = Inputs().files
+    assert isinstance(files, GlobPattern)
+    assert files.patterns == ["src/**/*.py", "!**/test_*.py"]
+    assert list(files.expand()) == [Path(workspace) / "src" / "app" / "main.py"]
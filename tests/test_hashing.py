@@ -0,0 +1,71 @@
+import hashlib
+import json
+import os
+
+from github_custom_actions.hashing import FileHasher, combine_digests, file_digest
+
+
+def test_file_digest_small_and_mmap(tmp_path, monkeypatch):
+    small, big = tmp_path / "small", tmp_path / "big"
+    small.write_bytes(b"abc")
+    big.write_bytes(b"x" * 100)
+    monkeypatch.setattr("github_custom_actions.hashing.MMAP_THRESHOLD", 10)
+    assert file_digest(small) == hashlib.sha256(b"abc").hexdigest()
+    assert file_digest(big) == hashlib.sha256(b"x" * 100).hexdigest()
+
+
+def test_hash_files_like_hash_files_function(tmp_path):
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.write_text("a")
+    b.write_text("b")
+    expected = hashlib.sha256(
+        hashlib.sha256(b"a").digest() + hashlib.sha256(b"b").digest(),
+    ).hexdigest()
+    hasher = FileHasher()
+    assert hasher.hash_files([b, a, a]) == expected
+    assert hasher.hash_files([]) == ""
+    assert combine_digests([]) == ""
+
+
+def test_hash_files_skips_not_files(tmp_path):
+    cache_path = tmp_path / "hashes.json"
+    path = tmp_path / "file"
+    path.write_text("a")
+    FileHasher(cache_path).hash_files([path])
+    path.unlink()
+    hasher = FileHasher(cache_path)
+    assert hasher.digests([path, tmp_path, tmp_path / "missing"]) == {}
+    assert hasher.hash_files([path]) == ""
+    assert json.loads(cache_path.read_text()) == {}
+
+
+def test_hash_cache_reused_until_stat_changes(tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache" / "hashes.json"
+    path = tmp_path / "file"
+    path.write_text("one")
+    first = FileHasher(cache_path).hash_files([path])
+    assert str(path) in json.loads(cache_path.read_text())
+
+    hashed = []
+    monkeypatch.setattr(
+        "github_custom_actions.hashing.file_digest",
+        lambda p: hashed.append(p) or hashlib.sha256(p.read_bytes()).hexdigest(),
+    )
+    assert FileHasher(cache_path).hash_files([path]) == first
+    assert hashed == []
+
+    path.write_text("two")
+    os.utime(path, ns=(1, 1))
+    assert FileHasher(cache_path).hash_files([path]) != first
+    assert hashed == [path]
+
+
+def test_action_hash_files(action, tmp_path, monkeypatch):
+    (tmp_path / "requirements.txt").write_text("jinja2")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "requirements.txt").write_text("ignored")
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path))
+    monkeypatch.setenv("RUNNER_TOOL_CACHE", str(tmp_path / "cache"))
+    assert action.hash_files("**/requirements.txt") == combine_digests(
+        [hashlib.sha256(b"jinja2").hexdigest()],
+    )
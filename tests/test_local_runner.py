@@ -0,0 +1,103 @@
+import os
+import sys
+
+from github_custom_actions.action_base import ActionBase
+from github_custom_actions.inputs_outputs import ActionInputs, ActionOutputs
+from github_custom_actions.local_runner import (
+    Annotation,
+    LocalRunner,
+    parse_annotations,
+    parse_outputs,
+)
+
+
+class GreetInputs(ActionInputs):
+    name: str
+
+
+class GreetOutputs(ActionOutputs):
+    greeting: str
+
+
+class GreetAction(ActionBase):
+    inputs: GreetInputs
+    outputs: GreetOutputs
+
+    def main(self):
+        if self.inputs.name == "fail":
+            raise ValueError("Bad name")
+        self.outputs.greeting = f"Hello, {self.inputs.name}!"
+        self.summary += self.render("### {{ inputs.name }} on {{ env.runner_os }}")
+        self.warning_message("Be polite", file="greet.py", line=1)
+
+
+class MaskAction(ActionBase):
+    inputs: GreetInputs
+    outputs: ActionOutputs
+
+    def main(self):
+        if self.inputs.name == "secret":
+            self.add_mask("abc")
+        elif self.inputs.name == "exit":
+            sys.exit()
+        self.outputs["out"] = "abc"
+
+
+def test_parse_outputs():
+    text = "a=1\nb<<EOF\nline1\nline2\nEOF\nc=x=y"
+    assert parse_outputs(text) == {"a": "1", "b": "line1\nline2", "c": "x=y"}
+
+
+def test_parse_annotations():
+    text = (
+        "plain\n::error file=a.py,line=3::Oops\n::debug::Debug\n"
+        "::warning file=C:\\src\\a.py,title=Note: 1%2C 2::a%0Ab: c"
+    )
+    assert parse_annotations(text) == [
+        Annotation("error", "Oops", {"file": "a.py", "line": "3"}),
+        Annotation("debug", "Debug", {}),
+        Annotation("warning", "a\nb: c", {"file": "C:\\src\\a.py", "title": "Note: 1, 2"}),
+    ]
+
+
+def test_local_runner_run(monkeypatch):
+    monkeypatch.setenv("INPUT_NAME", "host")
+    monkeypatch.setenv("RUNNER_OS", "host")
+    result = LocalRunner(GreetAction, env={"RUNNER_OS": "Linux"}).run({"name": "John"})
+
+    assert result.exit_code == 0
+    assert result.outputs == {"greeting": "Hello, John!"}
+    assert result.summary == "### John on Linux"
+    assert result.annotations == [
+        Annotation("warning", "Be polite", {"file": "greet.py", "line": "1"}),
+    ]
+    assert os.environ["INPUT_NAME"] == "host"
+
+
+def test_local_runner_isolated_from_host(monkeypatch):
+    monkeypatch.setenv("INPUT_NAME", "host")
+    result = LocalRunner(GreetAction).run()
+    assert result.exit_code == 1
+    assert "INPUT_NAME" in result.stderr
+
+
+def test_local_runner_failure():
+    result = LocalRunner(GreetAction).run({"name": "fail"})
+
+    assert result.exit_code == 1
+    assert "ValueError: Bad name" in result.stderr
+    assert result.outputs == {}
+
+
+def test_local_runner_run_many():
+    runner = LocalRunner(GreetAction, env={"RUNNER_OS": "Linux"})
+    results = runner.run_many(({"name": str(i)} for i in range(20)), max_workers=2)
+
+    assert [result.outputs["greeting"] for result in results] == [f"Hello, {i}!" for i in range(20)]
+
+
+def test_local_runner_runs_are_isolated():
+    runner = LocalRunner(MaskAction)
+    assert runner.run({"name": "secret"}).outputs == {"out": "***"}
+    assert runner.run({"name": "plain"}).outputs == {"out": "abc"}
+    assert runner.run({"name": "exit"}).exit_code == 0
@@ -0,0 +1,73 @@
+import pytest
+
+from github_custom_actions import masking
+from github_custom_actions.masking import SecretMasker, secret_variants
+
+
+@pytest.fixture
+def global_masker(monkeypatch):
+    new_masker = SecretMasker()
+    for module in ("masking", "action_base", "step_summary", "file_attr_dict_vars"):
+        monkeypatch.setattr(f"github_custom_actions.{module}.masker", new_masker)
+    return new_masker
+
+
+def test_secret_variants():
+    assert secret_variants('a b"\nc') == [
+        'a b"',
+        "c",
+        'a b"\nc',
+        "YSBiIgpj",
+        "a%20b%22%0Ac",
+        'a b\\"\\nc',
+    ]
+
+
+def test_mask_overlapping_secrets():
+    masker = SecretMasker()
+    assert masker.mask("nothing") == "nothing"
+    masker.add("abc")
+    masker.add("abcdef")
+    masker.add("ab.")
+    assert masker.mask("abcdefg abcx ab.c abx") == "***g ***x ***c abx"
+
+
+def test_mask_long_secret():
+    masker = SecretMasker()
+    masker.add("x" * 5000)
+    assert masker.mask("a" + "x" * 5000 + "b") == "a***b"
+
+
+def test_add_returns_only_new():
+    masker = SecretMasker()
+    assert masker.add("secret")[0] == "secret"
+    assert masker.add("secret") == []
+
+
+def test_action_add_mask(action, global_masker, capsys):
+    action.add_mask("s3cr3t")
+    out = capsys.readouterr().out
+    assert "::add-mask::s3cr3t\n" in out
+    assert "::add-mask::czNjcjN0\n" in out
+
+    action.add_mask("line1\r\nline2")
+    out = capsys.readouterr().out
+    assert out.startswith("::add-mask::line1\n::add-mask::line2\n")
+    assert all(line.startswith("::add-mask::") for line in out.splitlines())
+    assert global_masker.mask("line1\r\nline2") == "***"
+
+    action.add_mask("a%b")
+    out = capsys.readouterr().out.splitlines()
+    assert "::add-mask::a%25b" in out  # the runner reads it back as `a%b`
+    assert "::add-mask::a%2525b" in out  # URL-encoded `a%25b`
+
+    action.warning_message("token s3cr3t", title="s3cr3t")
+    assert capsys.readouterr().out == "::warning title=***::token ***\n"
+
+    action.summary += "Token: s3cr3t"
+    assert action.env.github_step_summary.read_text() == "Token: ***"
+
+    action.outputs["token"] = "s3cr3t"
+    assert action.env.github_output.read_text() == "token=***"
+    assert action.outputs["token"] == "s3cr3t"
+    assert masking.masker is global_masker
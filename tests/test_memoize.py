@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import pytest
+from github_custom_actions import ActionBase, ActionInputs, ActionOutputs
+from github_custom_actions.local_runner import parse_outputs
+from github_custom_actions.masking import masker
+from github_custom_actions.memoize import MEMO_DIR, ResultCache, memoize
+
+
+class SchemaInputs(ActionInputs):
+    name: str
+
+
+class SchemaOutputs(ActionOutputs):
+    schema: str
+
+
+class SchemaAction(ActionBase):
+    inputs: SchemaInputs
+    outputs: SchemaOutputs
+    calls = 0
+
+    @memoize(env=["github_repository"], files=["schema/*.json"])
+    def main(self):
+        SchemaAction.calls += 1
+        report = Path(self.env.runner_temp) / "report.txt"
+        report.write_text(f"line1\nline2 {self.inputs.name}")
+        self.outputs.schema = f"{self.inputs.name}-{SchemaAction.calls}"
+        self.outputs.set_from_file("report", report)
+        self.summary += f"Generated {self.inputs.name}"
+
+
+@pytest.fixture
+def memo_env(tmp_path, monkeypatch):
+    (tmp_path / "workspace" / "schema").mkdir(parents=True)
+    (tmp_path / "workspace" / "schema" / "a.json").write_text("{}")
+    (tmp_path / "temp").mkdir()
+    monkeypatch.setenv("RUNNER_TOOL_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path / "temp"))
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path / "workspace"))
+    monkeypatch.setenv("GITHUB_REPOSITORY", "octocat/hello")
+    monkeypatch.setenv("INPUT_NAME", "api")
+    SchemaAction.calls = 0
+    return tmp_path
+
+
+def _run(tmp_path, monkeypatch, step):
+    monkeypatch.setenv("GITHUB_OUTPUT", str(tmp_path / f"output{step}.txt"))
+    monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(tmp_path / f"summary{step}.md"))
+    action = SchemaAction()
+    action.run()
+    return action
+
+
+def test_memoize_replays_outputs_and_summary(memo_env, monkeypatch):
+    _run(memo_env, monkeypatch, 1)
+    _run(memo_env, monkeypatch, 2)
+    assert SchemaAction.calls == 1
+    assert parse_outputs((memo_env / "output2.txt").read_text()) == {
+        "schema": "api-1",
+        "report": "line1\nline2 api",
+    }
+    assert (memo_env / "summary2.md").read_text() == "Generated api"
+
+
+def test_memoize_evicted_entry_runs_main(memo_env, monkeypatch):
+    _run(memo_env, monkeypatch, 1)
+    for report in (memo_env / "cache" / MEMO_DIR).glob("*/*/outputs/*"):
+        report.unlink()
+    _run(memo_env, monkeypatch, 2)
+    assert SchemaAction.calls == 2
+    assert parse_outputs((memo_env / "output2.txt").read_text())["schema"] == "api-2"
+
+
+def test_memoize_key_inputs_env_files(memo_env, monkeypatch):
+    _run(memo_env, monkeypatch, 1)
+    monkeypatch.setenv("INPUT_NAME", "web")
+    _run(memo_env, monkeypatch, 2)
+    monkeypatch.setenv("GITHUB_REPOSITORY", "octocat/other")
+    _run(memo_env, monkeypatch, 3)
+    (memo_env / "workspace" / "schema" / "a.json").write_text('{"a": 1}')
+    _run(memo_env, monkeypatch, 4)
+    _run(memo_env, monkeypatch, 5)
+    assert SchemaAction.calls == 4
+    assert len(list((memo_env / "cache" / MEMO_DIR / "SchemaAction").iterdir())) == 4
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=250)
+    cache.store("a", {"out": "x" * 50}, "")
+    cache.store("b", {"out": "y" * 50}, "")
+    assert cache.load("a") is not None  # "b" is the least recently used now
+    cache.store("c", {"out": "z" * 50}, "")
+    assert cache.load("b") is None
+    assert cache.load("a")[0]["outputs"] == {"out": "x" * 50}
+    assert cache.load("c") is not None
+
+
+def test_result_cache_masks_secrets(tmp_path):
+    masker.add("s3cr3t")
+    try:
+        cache = ResultCache(tmp_path)
+        cache.store("a", {"token": "s3cr3t", "log": "1\ns3cr3t"}, "used s3cr3t")
+    finally:
+        masker.clear()
+    result, entry = cache.load("a")
+    assert result["outputs"] == {"token": "***"}
+    assert result["summary"] == "used ***"
+    assert (entry / "outputs" / "1").read_text() == "1\n***"
+    assert "s3cr3t" not in "".join(path.read_text() for path in entry.rglob("*") if path.is_file())
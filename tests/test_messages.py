@@ -1,6 +1,34 @@
-def test_debug_message(action, capsys):
+import pytest
+
+from github_custom_actions import ActionBase
+
+
+@pytest.fixture
+def runner_debug(monkeypatch):
+    monkeypatch.setenv("RUNNER_DEBUG", "1")
+
+
+def test_debug_message(action, runner_debug, capsys):
     action.debug("foo waz here")
-    assert capsys.readouterr().out == "::debug::foo waz here\n"
+    ActionBase.debug("static")
+    assert capsys.readouterr().out == "::debug::foo waz here\n::debug::static\n"
+
+
+def test_debug_message_lazy(action, runner_debug, capsys):
+    action.debug("%s waz %d", "foo", 1)
+    action.debug(lambda: "computed")
+    assert capsys.readouterr().out == "::debug::foo waz 1\n::debug::computed\n"
+
+
+def test_debug_message_disabled(action, capsys, monkeypatch):
+    monkeypatch.delenv("RUNNER_DEBUG", raising=False)
+
+    def expensive():
+        raise AssertionError("must not be called")
+
+    action.debug(expensive)
+    action.debug("%s", expensive)
+    assert capsys.readouterr().out == ""
 
 
 def test_error_message(action, capsys):
@@ -16,3 +44,10 @@ def test_notice_message(action, capsys):
 def test_warning_message(action, capsys):
     action.warning_message("Warning!", file="test.txt")
     assert capsys.readouterr().out == "::warning file=test.txt::Warning!\n"
+
+
+def test_message_escaping(action, capsys):
+    action.error_message("100%\nfailed\r", title="a: b, c", file="dir,1/a.py")
+    assert capsys.readouterr().out == (
+        "::error title=a%3A b%2C c,file=dir%2C1/a.py::100%25%0Afailed%0D\n"
+    )
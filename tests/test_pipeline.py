@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from github_custom_actions import ActionBase, ActionInputs, ActionOutputs
+from github_custom_actions.pipeline import ActionPipeline, PipelineStep
+from github_custom_actions.vars_storage import MemoryStorage
+
+
+class BuildInputs(ActionInputs):
+    name: str
+
+
+class BuildOutputs(ActionOutputs):
+    artifact: str
+
+
+class Build(ActionBase):
+    inputs: BuildInputs
+    outputs: BuildOutputs
+
+    def main(self):
+        self.outputs.artifact = f"{self.inputs.name}.whl"
+        self.summary += "built\n"
+
+
+class PublishInputs(ActionInputs):
+    path: str
+
+
+class PublishOutputs(ActionOutputs):
+    url: str
+
+
+class Publish(ActionBase):
+    inputs: PublishInputs
+    outputs: PublishOutputs
+
+    def main(self):
+        if self.inputs.path == "fail":
+            raise ValueError("boom")
+        self.outputs.url = f"https://example.com/{self.inputs.path}"
+        self.summary += "published\n"
+
+
+def test_pipeline(inputs, outputs, monkeypatch):
+    monkeypatch.setenv("INPUT_NAME", "pkg")
+    outputs.write_text("pre=1")
+    pipeline = ActionPipeline(
+        [
+            PipelineStep(Build, step_id="build"),
+            PipelineStep(Publish, inputs={"path": "dist/${{ steps.build.outputs.artifact }}"}),
+        ],
+    )
+    pipeline.run()
+
+    assert pipeline.step_outputs == {
+        "build": {"artifact": "pkg.whl"},
+        "Publish": {"url": "https://example.com/dist/pkg.whl"},
+    }
+    assert outputs.read_text() == (
+        "pre=1\nartifact=pkg.whl\nurl=https://example.com/dist/pkg.whl\n"
+    )
+    assert pipeline.summary == "built\npublished\n"
+    assert "INPUT_PATH" not in os.environ
+
+
+def test_pipeline_failure_writes_outputs(inputs, monkeypatch):
+    monkeypatch.setenv("INPUT_NAME", "pkg")
+    storage = MemoryStorage()
+    pipeline = ActionPipeline(
+        [
+            PipelineStep(Build),
+            PipelineStep(Publish, inputs={"path": "fail"}),
+            PipelineStep(Build, step_id="never"),
+        ],
+        outputs_storage=storage,
+    )
+    with pytest.raises(SystemExit):
+        pipeline.run()
+    assert storage.text == "artifact=pkg.whl\n"
+    assert "never" not in pipeline.step_outputs
+
+
+def test_pipeline_without_step_summary(inputs, monkeypatch):
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+    monkeypatch.setenv("INPUT_NAME", "pkg")
+
+    class Quiet(Build):
+        def main(self):
+            self.outputs.artifact = "quiet"
+
+    storage = MemoryStorage("pre=1\n")
+    ActionPipeline([PipelineStep(Quiet)], outputs_storage=storage).run()
+    assert storage.text == "pre=1\nartifact=quiet\n"
+
+
+def test_resolve_unknown_step(inputs):
+    with pytest.raises(ValueError, match="did not run"):
+        ActionPipeline([]).resolve("${{ steps.build.outputs.artifact }}")
@@ -0,0 +1,53 @@
+import json
+import re
+
+import pytest
+
+from github_custom_actions.problem_matchers import ProblemPattern, matcher_json
+
+REGEX = r"^(?P<file>[^:]+):(?P<line>\d+): (?:(?P<code>\w+) )?(?P<message>.+)$"
+
+
+def test_pattern_from_regex():
+    pattern = ProblemPattern.from_regex(REGEX)
+    assert pattern == ProblemPattern(
+        regexp=r"^([^:]+):(\d+): (?:(\w+) )?(.+)$", file=1, line=2, code=3, message=4
+    )
+    match = re.match(pattern.regexp, "a.py:3: E1 Bad")
+    assert match.group(pattern.file, pattern.code) == ("a.py", "E1")
+
+
+def test_pattern_unknown_group():
+    with pytest.raises(ValueError, match="name"):
+        ProblemPattern.from_regex(r"(?P<name>\w+)")
+
+
+def test_matcher_json():
+    patterns = [
+        ProblemPattern(r"^(.+)$", file=1),
+        ProblemPattern(r"^\s+(\d+) (.+)$", line=1, message=2, loop=True),
+    ]
+    assert matcher_json("tool", patterns, severity="warning") == {
+        "problemMatcher": [
+            {
+                "owner": "tool",
+                "severity": "warning",
+                "pattern": [
+                    {"regexp": r"^(.+)$", "file": 1},
+                    {"regexp": r"^\s+(\d+) (.+)$", "line": 1, "message": 2, "loop": True},
+                ],
+            }
+        ]
+    }
+
+
+def test_action_problem_matcher(action, tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+    with action.problem_matcher("lint", REGEX) as path:
+        print("a.py:1: Bad")
+
+    assert path == tmp_path / "lint-problem-matcher.json"
+    assert json.loads(path.read_text())["problemMatcher"][0]["pattern"][0]["file"] == 1
+    assert capsys.readouterr().out == (
+        f"::add-matcher::{path}\na.py:1: Bad\n::remove-matcher owner=lint::\n"
+    )
@@ -0,0 +1,65 @@
+import pstats
+
+import pytest
+
+from github_custom_actions.profiling import profiling_top, render_profile, ProfileEntry
+
+
+@pytest.mark.parametrize(
+    "value, top, expected",
+    [
+        (None, None, None),
+        ("false", None, None),
+        ("0", "5", None),
+        ("true", None, 20),
+        ("1", "5", 5),
+        ("1", "many", 20),
+    ],
+)
+def test_profiling_top(monkeypatch, value, top, expected):
+    monkeypatch.delenv("ACTION_PROFILE", raising=False)
+    monkeypatch.delenv("ACTION_PROFILE_TOP", raising=False)
+    if value is not None:
+        monkeypatch.setenv("ACTION_PROFILE", value)
+    if top is not None:
+        monkeypatch.setenv("ACTION_PROFILE_TOP", top)
+    assert profiling_top() == expected
+
+
+def test_render_profile(tmp_path):
+    entries = [ProfileEntry("a.py:1(f|g)", 3, 0.5, 1.25)]
+    table = render_profile(entries, tmp_path / "a.pstats")
+    assert "| `a.py:1(f&#124;g)` | 3 | 0.5000 | 1.2500 |" in table
+    assert str(tmp_path / "a.pstats") in table
+
+
+def test_run_profiled(action, monkeypatch, tmp_path):
+    monkeypatch.setenv("ACTION_PROFILE", "true")
+    monkeypatch.setenv("ACTION_PROFILE_TOP", "3")
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+
+    def main():
+        sum(range(1000))
+
+    action.main = main
+    action.run()
+
+    stats_file = tmp_path / "Action.pstats"
+    assert pstats.Stats(str(stats_file)).total_calls > 0
+    summary = action.summary
+    assert "### Profile" in summary
+    assert len([line for line in summary.splitlines() if line.startswith("| `")]) == 3
+
+
+def test_run_profiled_failure(action, monkeypatch, tmp_path):
+    monkeypatch.setenv("ACTION_PROFILE", "true")
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+
+    def main():
+        raise ValueError("boom")
+
+    action.main = main
+    with pytest.raises(SystemExit):
+        action.run()
+    assert (tmp_path / "Action.pstats").exists()
+    assert "### Profile" in action.summary
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from github_custom_actions import json_stream
+from github_custom_actions.annotations import CollectedAnnotation
+from github_custom_actions.reports import detect_format, iter_report
+
+SARIF = {
+    "version": "2.1.0",
+    "runs": [
+        {
+            "tool": {"driver": {"name": "ruff", "rules": [{"id": "F401"}]}},
+            "results": [
+                {
+                    "level": "error",
+                    "message": {"text": "Unused import"},
+                    "ruleId": "F401",
+                    "locations": [
+                        {
+                            "physicalLocation": {
+                                "artifactLocation": {"uri": "file://src/a.py"},
+                                "region": {"startLine": 3, "startColumn": 1},
+                            }
+                        }
+                    ],
+                },
+                {"message": {"text": "No location"}, "ruleId": "X1"},
+            ],
+        },
+        {"results": [{"level": "note", "message": {"text": "Note"}}]},
+    ],
+}
+
+JUNIT = """<?xml version="1.0"?>
+<testsuites><testsuite name="suite">
+  <testcase classname="tests.test_a" name="test_ok" file="tests/test_a.py" line="1"/>
+  <testcase classname="tests.test_a" name="test_bad" file="tests/test_a.py" line="7">
+    <failure message="assert 1 == 2" type="AssertionError">details</failure>
+  </testcase>
+  <testcase classname="tests.test_b" name="test_err"><error>Boom
+traceback</error></testcase>
+  <testcase classname="tests.test_b" name="test_skip"><skipped/></testcase>
+</testsuite></testsuites>
+"""
+
+CHECKSTYLE = """<?xml version="1.0"?>
+<checkstyle version="4.3">
+  <file name="src/a.py">
+    <error line="1" column="5" severity="warning" message="Too long" source="E501"/>
+    <error line="2" severity="ignore" message="Ignored" source="X"/>
+  </file>
+  <file name="src/b.py">
+    <error line="9" severity="info" message="Info" source="I1"/>
+  </file>
+</checkstyle>
+"""
+
+
+@pytest.fixture(params=[False, True])
+def small_chunks(request, monkeypatch):
+    if request.param:
+        monkeypatch.setattr(json_stream, "CHUNK_SIZE", 7)
+
+
+def test_sarif(tmp_path, small_chunks):
+    path = tmp_path / "report.sarif"
+    path.write_text(json.dumps(SARIF, indent=1))
+    assert list(iter_report(path)) == [
+        CollectedAnnotation(
+            "error", "Unused import", file="src/a.py", line=3, column=1, rule="F401"
+        ),
+        CollectedAnnotation("warning", "No location", rule="X1"),
+        CollectedAnnotation("notice", "Note"),
+    ]
+
+
+def test_junit(tmp_path):
+    path = tmp_path / "pytest.xml"
+    path.write_text(JUNIT)
+    assert detect_format(path) == "junit"
+    assert list(iter_report(path)) == [
+        CollectedAnnotation(
+            "error",
+            "assert 1 == 2",
+            title="tests.test_a.test_bad",
+            file="tests/test_a.py",
+            line=7,
+            rule="AssertionError",
+        ),
+        CollectedAnnotation("error", "Boom", title="tests.test_b.test_err"),
+    ]
+
+
+def test_checkstyle(tmp_path):
+    path = tmp_path / "lint.xml"
+    path.write_text(CHECKSTYLE)
+    assert detect_format(path) == "checkstyle"
+    assert list(iter_report(path)) == [
+        CollectedAnnotation("warning", "Too long", file="src/a.py", line=1, column=5, rule="E501"),
+        CollectedAnnotation("notice", "Info", file="src/b.py", line=9, rule="I1"),
+    ]
+
+
+def test_unknown_format(tmp_path):
+    path = tmp_path / "other.xml"
+    path.write_text("<html/>")
+    with pytest.raises(ValueError, match="Cannot detect"):
+        list(iter_report(path))
+
+
+def test_action_ingest_report(action, tmp_path):
+    path = tmp_path / "lint.xml"
+    path.write_text(CHECKSTYLE)
+    assert action.ingest_report(path) == 2
+    assert len(action.annotations) == 2
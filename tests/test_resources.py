@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from github_custom_actions.local_runner import parse_outputs
+from github_custom_actions.resources import (
+    ResourceMonitor,
+    ResourceUsage,
+    render_resources,
+    resources_enabled,
+    tracemalloc_top,
+)
+from github_custom_actions.vars_storage import MemoryStorage
+
+
+@pytest.mark.parametrize("value, expected", [(None, False), ("off", False), ("true", True)])
+def test_resources_enabled(monkeypatch, value, expected):
+    monkeypatch.delenv("ACTION_RESOURCES", raising=False)
+    if value is not None:
+        monkeypatch.setenv("ACTION_RESOURCES", value)
+    assert resources_enabled() is expected
+
+
+def test_monitor(tmp_path):
+    output = tmp_path / "output.txt"
+    monitor = ResourceMonitor({"outputs": output}, tracemalloc_top=2)
+    monitor.start()
+    data = [bytes(1024) for _ in range(1000)]
+    output.write_text("x" * 10)
+    usage = monitor.stop()
+    del data
+
+    assert usage.wall_seconds >= 0
+    assert usage.peak_rss_bytes > 0
+    assert usage.written_bytes == {"outputs": 10}
+    assert usage.traced_peak_bytes >= 1000 * 1024
+    assert len(usage.top_allocations) == 2
+
+
+def test_render_resources():
+    usage = ResourceUsage(1.5, 1.0, 0.25, 10 * 1024 * 1024, 3, 4, {"summary": 42})
+    table = render_resources(usage)
+    assert "### Resources" in table
+    assert "| CPU user / system | 1.00 s / 0.25 s |" in table
+    assert "| Peak RSS | 10.0 MB |" in table
+    assert "| Written to summary | 42 bytes |" in table
+    assert "Allocated at" not in table
+
+
+def test_run_tracks_resources(action, outputs, monkeypatch):
+    monkeypatch.setenv("ACTION_RESOURCES", "true")
+    monkeypatch.setenv("ACTION_RESOURCES_TRACEMALLOC", "3")
+    assert tracemalloc_top() == 3
+
+    def main():
+        action.outputs["my-output"] = "value"
+
+    action.main = main
+    action.run()
+
+    assert "### Resources" in action.summary
+    assert "| Allocated at | Size |" in action.summary
+    lines = outputs.read_text().splitlines()
+    assert lines[0] == "my-output=value"
+    usage = json.loads(lines[1].split("=", 1)[1])
+    assert usage["written_bytes"]["outputs"] == len("my-output=value")
+    assert len(usage["top_allocations"]) == 3
+
+
+def test_run_without_resources(action, monkeypatch):
+    monkeypatch.delenv("ACTION_RESOURCES", raising=False)
+    action.main = lambda: None
+    action.run()
+    assert "### Resources" not in action.summary
+
+
+def test_tracemalloc_top_invalid(monkeypatch, capsys):
+    monkeypatch.setenv("ACTION_RESOURCES_TRACEMALLOC", "all")
+    assert tracemalloc_top() == 0
+    assert "ACTION_RESOURCES_TRACEMALLOC=`all` is not an integer" in capsys.readouterr().out
+
+
+def test_run_tracks_resources_in_memory(inputs, action_class, monkeypatch):
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+    monkeypatch.delenv("GITHUB_STEP_SUMMARY", raising=False)
+    monkeypatch.setenv("ACTION_RESOURCES", "true")
+    storage = MemoryStorage()
+    action = action_class(outputs_storage=storage)
+    action.main = lambda: None
+    action.run()
+    assert json.loads(parse_outputs(storage.text)["resources"])["written_bytes"] == {}
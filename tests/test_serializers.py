@@ -0,0 +1,104 @@
+import dataclasses
+import json
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+import pytest
+from github_custom_actions import ActionOutputs
+from github_custom_actions import serializers
+from github_custom_actions.serializers import codec_for, dumps, loads
+
+
+@dataclasses.dataclass
+class Build:
+    name: str
+    artifacts: List[str]
+
+
+class Version(NamedTuple):
+    major: int
+    minor: int
+
+
+class StructuredOutputs(ActionOutputs):
+    matrix: Dict[str, List[str]]
+    tags: list
+    build: Build
+    version: Version
+    plain: str
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serializers, "orjson", None)
+    elif serializers.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_dumps_compact(backend):
+    value = {"a": [1, "ü"], "path": Path("x/y"), "build": Build("b", ["1"])}
+    assert dumps(value) == '{"a":[1,"ü"],"path":"x/y","build":{"name":"b","artifacts":["1"]}}'
+    assert loads(dumps(value))["build"] == {"name": "b", "artifacts": ["1"]}
+    with pytest.raises(TypeError):
+        dumps(object())
+
+
+def test_dumps_same_on_both_backends(backend):
+    value = {1: Version(1, 2), "nan": [float("nan"), float("inf")], "n": {None: Build("b", [])}}
+    assert dumps(value) == (
+        '{"1":[1,2],"nan":[null,null],"n":{"null":{"name":"b","artifacts":[]}}}'
+    )
+
+
+def test_codec_for_scalars():
+    assert codec_for(str) is None
+    assert codec_for(Path) is None
+    assert codec_for(int) is None
+
+
+def test_structured_outputs(outputs, backend):
+    structured = StructuredOutputs()
+    structured.matrix = {"os": ["ubuntu", "windows"]}
+    structured.tags = ["v1", "latest"]
+    structured.build = Build("app", ["app.whl"])
+    structured.version = Version(1, 2)
+    structured.plain = "text"
+    structured["extra"] = {"dict": "style"}
+
+    lines = outputs.read_text().splitlines()
+    assert lines == [
+        'matrix={"os":["ubuntu","windows"]}',
+        'tags=["v1","latest"]',
+        'build={"name":"app","artifacts":["app.whl"]}',
+        'version={"major":1,"minor":2}',
+        "plain=text",
+        'extra={"dict":"style"}',
+    ]
+    assert json.loads(lines[0].split("=", 1)[1]) == {"os": ["ubuntu", "windows"]}
+
+    reloaded = StructuredOutputs()
+    assert reloaded.matrix == {"os": ["ubuntu", "windows"]}
+    assert reloaded.build == Build("app", ["app.whl"])
+    assert reloaded.version == Version(1, 2)
+    assert reloaded.plain == "text"
+
+
+def test_output_attribute_reassigned(outputs):
+    structured = StructuredOutputs()
+    structured.plain = "a"
+    assert structured.plain == "a"
+    structured.plain = "b"
+    assert structured.plain == "b"
+
+
+def test_output_attribute_str_not_encoded(outputs, backend):
+    structured = StructuredOutputs()
+    structured.matrix = json.dumps({"os": ["ubuntu"]})
+    structured.version = '{"major":1,"minor":0}'
+    assert outputs.read_text().splitlines() == [
+        'matrix={"os": ["ubuntu"]}',
+        'version={"major":1,"minor":0}',
+    ]
+    assert StructuredOutputs().matrix == {"os": ["ubuntu"]}
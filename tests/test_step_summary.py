@@ -0,0 +1,73 @@
+from unittest.mock import patch
+
+import pytest
+
+from github_custom_actions.step_summary import MARKER_RESERVE
+
+LIMIT = MARKER_RESERVE + 100
+
+
+@pytest.fixture
+def small_summary(action):
+    action.summary_limit = LIMIT
+    return action
+
+
+def test_summary_appends_without_reading(action):
+    action.summary = "a"
+    with patch("pathlib.Path.read_bytes", side_effect=AssertionError("read")):
+        for _ in range(3):
+            action.summary += "b"
+    assert action.env.github_step_summary.read_text() == "abbb"
+    assert action.summary == "abbb"
+
+
+def test_summary_existing_file(action):
+    action.env.github_step_summary.write_text("before\n")
+    action.summary += "after"
+    assert action.env.github_step_summary.read_text() == "before\nafter"
+
+
+def test_summary_truncate(small_summary):
+    small_summary.summary += "@" * 60
+    small_summary.summary += "%" * 60
+    small_summary.summary += "&"
+    text = small_summary.env.github_step_summary.read_text()
+    assert text.startswith("@" * 60 + "%" * 40 + "\n\n> **Summary is truncated**")
+    assert "&" not in text
+    assert len(text.encode()) <= LIMIT
+    assert small_summary.summary == "@" * 60 + "%" * 60 + "&"
+
+
+def test_summary_drop(small_summary):
+    small_summary.summary_overflow = "drop"
+    small_summary.summary += "@" * 60
+    small_summary.summary += "%" * 60
+    small_summary.summary += "&" * 30
+    small_summary.summary += "~" * LIMIT
+    text = small_summary.env.github_step_summary.read_text()
+    assert "%" not in text
+    assert text.count("omitted") == 1
+    assert text.endswith("&" * 30)
+    assert "~" not in text
+
+
+def test_summary_spill(small_summary, tmp_path, monkeypatch):
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+    small_summary.summary_overflow = "spill"
+    small_summary.summary += "@" * 60
+    small_summary.summary += "%" * 60
+    small_summary.summary += "&"
+
+    spill_file = tmp_path / "Action-summary.md"
+    assert spill_file.read_text() == "@" * 60 + "%" * 60 + "&"
+    text = small_summary.env.github_step_summary.read_text()
+    assert text.startswith("@" * 60 + "\n\n> **Summary exceeds")
+    assert str(spill_file) in text
+
+
+def test_summary_rewrite_resets_limit(small_summary):
+    small_summary.summary += "@" * 200
+    small_summary.summary = "new"
+    small_summary.summary += "!"
+    assert small_summary.env.github_step_summary.read_text() == "new!"
@@ -0,0 +1,93 @@
+import zipfile
+
+import pytest
+from jinja2 import TemplateNotFound
+
+from github_custom_actions.template_loader import (
+    PACKAGE_TEMPLATES_DIR,
+    ZipLoader,
+    search_path_loader,
+    template_environment,
+)
+
+
+@pytest.fixture
+def templates_zip(tmp_path):
+    archive = tmp_path / "templates.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("tpl/hello.j2", "zip {{ name }}")
+    return archive
+
+
+def test_search_path_loader(tmp_path, templates_zip, monkeypatch):
+    assert search_path_loader(str(tmp_path)).searchpath == [str(tmp_path)]
+    loader = search_path_loader(f"{templates_zip}/tpl")
+    assert isinstance(loader, ZipLoader)
+    assert loader.prefix == "tpl"
+
+    (tmp_path / "my_action" / "report").mkdir(parents=True)
+    (tmp_path / "my_action" / "__init__.py").write_text("")
+    (tmp_path / "my_action" / "report" / "r.j2").write_text("package")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    environment = template_environment(("package:my_action/report",))
+    assert environment.get_template("r.j2").render() == "package"
+
+
+def test_search_path_order(tmp_path, templates_zip):
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "hello.j2").write_text("dir {{ name }}")
+    (tmp_path / "dir" / "only_dir.j2").write_text("only dir")
+    environment = template_environment((f"{templates_zip}/tpl", str(tmp_path / "dir")))
+    assert environment.get_template("hello.j2").render(name="x") == "zip x"
+    assert environment.get_template("only_dir.j2").render() == "only dir"
+    with pytest.raises(TemplateNotFound):
+        environment.get_template("missing.j2")
+
+
+def test_no_reload_without_auto_reload(tmp_path):
+    (tmp_path / "t.j2").write_text("v1")
+    environment = template_environment((str(tmp_path),))
+    assert environment is template_environment((str(tmp_path),))
+    assert environment.get_template("t.j2").render() == "v1"
+    (tmp_path / "t.j2").write_text("version 2")
+    assert environment.get_template("t.j2").render() == "v1"
+    reloading = template_environment((str(tmp_path),), auto_reload=True)
+    assert reloading.get_template("t.j2").render() == "version 2"
+
+
+def test_default_template_path(inputs, outputs, action_class, monkeypatch, tmp_path):
+    monkeypatch.setenv("GITHUB_ACTION_PATH", str(tmp_path / "action"))
+    monkeypatch.delenv("GITHUB_WORKSPACE", raising=False)
+    (tmp_path / "action" / "templates").mkdir(parents=True)
+    (tmp_path / "action" / "templates" / "report.md").write_text("# {{ title }}")
+    action = action_class()
+    assert action.get_template_path() == [
+        str(tmp_path / "action" / "templates"),
+        str(PACKAGE_TEMPLATES_DIR),
+    ]
+    assert action.render_template("report.md", title="Report") == "# Report"
+
+
+def test_workspace_templates_last(inputs, outputs, action_class, monkeypatch, tmp_path):
+    monkeypatch.delenv("GITHUB_ACTION_PATH", raising=False)
+    monkeypatch.setenv("GITHUB_WORKSPACE", str(tmp_path))
+    assert action_class().get_template_path() == [
+        str(PACKAGE_TEMPLATES_DIR),
+        str(tmp_path / "templates"),
+    ]
+
+
+def test_environment_built_on_render(inputs, outputs, action_class):
+    class NoTemplatesAction(action_class):
+        template_path = ("package:json",)
+
+    action = NoTemplatesAction()
+    with pytest.raises(ValueError):
+        action.render_template("report.md")
+
+
+def test_custom_template_path(inputs, outputs, action_class, templates_zip):
+    class ZipAction(action_class):
+        template_path = (f"{templates_zip}/tpl",)
+
+    assert ZipAction().render_template("hello.j2", name="action") == "zip action"
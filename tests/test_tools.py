@@ -0,0 +1,66 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PATTERN = r"^(?P<file>[^:]+):(?P<line>\d+): (?P<severity>\w+): (?P<message>.+)$"
+
+
+def python(code):
+    return [sys.executable, "-c", code]
+
+
+def test_run_tool(action, capsys):
+    result = action.run_tool(
+        python(
+            "import sys\n"
+            "for i in range(100): print(f'line {i}')\n"
+            "print('a.py:3: warn: Bad thing')\n"
+            "print('err', file=sys.stderr)\n"
+            "sys.exit(2)"
+        ),
+        pattern=PATTERN,
+        tail_lines=3,
+    )
+
+    assert result.returncode == 2
+    assert sorted(result.tail) == sorted(["line 99", "a.py:3: warn: Bad thing", "err"])
+    assert result.annotations == 1
+    [annotation] = action.annotations.top()
+    assert (annotation.severity, annotation.file, annotation.line, annotation.message) == (
+        "warning",
+        "a.py",
+        3,
+        "Bad thing",
+    )
+    captured = capsys.readouterr()
+    assert "line 0\n" in captured.out
+    assert captured.err == "err\n"
+
+
+def test_run_tool_check(action):
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        action.run_tool(python("print('boom'); raise SystemExit(1)"), check=True)
+    assert exc_info.value.output == "boom"
+
+
+def test_run_tool_long_line(action, monkeypatch):
+    from github_custom_actions import tools
+
+    monkeypatch.setattr(tools, "LINE_LIMIT", 100)
+    result = action.run_tool(python("print('x' * 250, end='')"))
+    assert "".join(result.tail) == "x" * 250
+
+
+def test_run_tools(action, capsys):
+    results = action.run_tools(
+        [python("print('one')"), python("print('two')")],
+        pattern=r"^(?P<message>t\w+)$",
+    )
+
+    assert [result.tail for result in results] == [["one"], ["two"]]
+    assert [a.message for a in action.annotations.top()] == ["two"]
+    out = capsys.readouterr().out
+    name = Path(sys.executable).name
+    assert f"[{name}] one\n" in out
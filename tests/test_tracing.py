@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from github_custom_actions.tracing import (
+    span,
+    start_tracing,
+    stop_tracing,
+    tracing_active,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_tracer(tmp_path):
+    stop_tracing(tmp_path / "leftover.trace.json")
+    yield
+    stop_tracing(tmp_path / "leftover.trace.json")
+
+
+def test_span_is_noop_when_disabled(tmp_path):
+    assert not tracing_active()
+    assert span("a") is span("b", key="value")
+    with span("a"):
+        pass
+    assert stop_tracing(tmp_path / "trace.json") is None
+    assert not (tmp_path / "trace.json").exists()
+
+
+def test_nested_spans(tmp_path):
+    start_tracing()
+    with span("outer", key="value"):
+        with span("inner"):
+            pass
+        with pytest.raises(ValueError), span("failed"):
+            raise ValueError
+    trace_file = stop_tracing(tmp_path / "trace.json")
+
+    assert not tracing_active()
+    lines = trace_file.read_text().splitlines()
+    assert lines[0] == "[" and lines[-1] == "]"
+    events = {event["name"]: event for event in json.loads(trace_file.read_text())}
+    assert list(events) == ["outer", "inner", "failed"]
+    outer, inner = events["outer"], events["inner"]
+    assert outer["ph"] == "X"
+    assert outer["args"] == {"key": "value"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_run_writes_trace(inputs, outputs, action_class, monkeypatch, tmp_path):
+    monkeypatch.setenv("ACTION_TRACE", "true")
+    monkeypatch.setenv("RUNNER_TEMP", str(tmp_path))
+    action = action_class()
+
+    def main():
+        action.outputs["my-output"] = action.render("{{ inputs.my_input }}")
+
+    action.main = main
+    action.run()
+
+    events = json.loads((tmp_path / "Action.trace.json").read_text())
+    names = [event["name"] for event in events]
+    for name in ("action.init", "action.run", "inputs.validate", "main", "render", "vars.save"):
+        assert name in names
+    assert not tracing_active()
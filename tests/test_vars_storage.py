@@ -0,0 +1,109 @@
+import io
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+from github_custom_actions.file_attr_dict_vars import FileAttrDictVars
+from github_custom_actions.vars_storage import (
+    FileObjectStorage,
+    FileStorage,
+    MemoryStorage,
+    VarsStorage,
+)
+
+
+def test_memory_storage_empty():
+    storage = MemoryStorage()
+    with pytest.raises(FileNotFoundError):
+        storage.read_text()
+    assert storage.text == ""
+    assert dict(FileAttrDictVars(storage)) == {}
+
+
+def test_memory_storage_vars():
+    storage = MemoryStorage("a=1")
+    vars = FileAttrDictVars(storage)
+    assert vars["a"] == "1"
+    vars["b"] = "2"
+    assert storage.text == "a=1\nb=2"
+    assert dict(FileAttrDictVars(storage)) == {"a": "1", "b": "2"}
+
+
+def test_memory_storage_set_from_file(tmp_path):
+    report = tmp_path / "report.txt"
+    report.write_text("content")
+    storage = MemoryStorage()
+    vars = FileAttrDictVars(storage)
+    value = vars.set_from_file("report", report)
+    vars["a"] = "1"
+    assert storage.text == f"report<<{value.delimiter}\ncontent\n{value.delimiter}\na=1"
+    assert vars["report"] == "content"
+
+
+def test_file_object_storage_set_from_file(tmp_path):
+    report = tmp_path / "report.txt"
+    report.write_text("content\n")
+    with tempfile.TemporaryFile() as file:
+        vars = FileAttrDictVars(FileObjectStorage(file))
+        vars["a"] = "long value"
+        value = vars.set_from_file("report", report)
+        vars["a"] = "1"
+        file.seek(0)
+        assert file.read() == f"report<<{value.delimiter}\ncontent\n{value.delimiter}\na=1".encode()
+
+
+def test_file_object_storage():
+    with tempfile.TemporaryFile() as file:
+        storage = FileObjectStorage(file)
+        vars = FileAttrDictVars(storage)
+        vars["a"] = "long value"
+        vars["a"] = "1"
+        file.seek(0)
+        assert file.read() == b"a=1"
+        assert dict(FileAttrDictVars(storage)) == {"a": "1"}
+
+
+def test_file_storage_creates_parents(tmp_path):
+    path = tmp_path / "sub" / "vars.txt"
+    vars = FileAttrDictVars(FileStorage(path))
+    vars["a"] = "1"
+    assert path.read_text() == "a=1"
+    assert str(FileStorage(path)) == str(path)
+
+
+def test_action_outputs_storage(inputs, outputs, action_class):
+    storage = MemoryStorage()
+    action = action_class(outputs_storage=storage)
+    action.outputs.my_output = "value"
+    assert storage.text == "my-output=value"
+    assert not outputs.exists()
+
+
+class VarsStorageOnly(VarsStorage):
+    """Backend with the default `open_tail()` and `open_append()`."""
+
+    def __init__(self):
+        self.memory = MemoryStorage()
+
+    def read_text(self):
+        return self.memory.read_text()
+
+    @contextmanager
+    def open_write(self):
+        with self.memory.open_write() as file:
+            yield file
+
+
+def test_open_append(tmp_path):
+    storages = [
+        FileStorage(tmp_path / "out.txt"),
+        MemoryStorage(),
+        FileObjectStorage(io.BytesIO()),
+        VarsStorageOnly(),
+    ]
+    for storage in storages:
+        for lines in (b"a=1", b"b=2\n", b"c=3"):
+            with storage.open_append() as file:
+                file.write(lines)
+        assert storage.read_text() == "a=1\nb=2\nc=3", storage
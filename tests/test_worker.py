@@ -0,0 +1,114 @@
+import io
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+from github_custom_actions import ActionBase, ActionInputs, ActionOutputs
+from github_custom_actions.masking import masker, secret_variants
+from github_custom_actions.worker import ActionWorker, call_worker, main, stop_worker
+
+
+class EchoInputs(ActionInputs):
+    name: str
+
+
+class EchoOutputs(ActionOutputs):
+    greeting: str
+
+
+class EchoAction(ActionBase):
+    inputs: EchoInputs
+    outputs: EchoOutputs
+
+    def main(self) -> None:
+        if self.inputs.name == "fail":
+            raise RuntimeError("failed")
+        self.add_mask(self.inputs.name)
+        self.outputs.greeting = f"Hello {self.inputs.name}"
+        print(f"hi {self.inputs.name} from {os.getcwd()}")
+
+
+def _env(tmp_path, name):
+    return {
+        "INPUT_NAME": name,
+        "GITHUB_OUTPUT": str(tmp_path / f"{name}.out"),
+        "GITHUB_STEP_SUMMARY": str(tmp_path / f"{name}.md"),
+    }
+
+
+def test_worker_invocations_are_isolated(tmp_path):
+    worker = ActionWorker(EchoAction)
+    saved_env = dict(os.environ)
+
+    first = worker.invoke(_env(tmp_path, "first"), cwd=str(tmp_path))
+    worker.invoke(_env(tmp_path, "second"))
+
+    assert first["exit_code"] == 0
+    assert (tmp_path / "first.out").read_text() == "greeting=Hello ***"
+    assert f"from {tmp_path}" in first["stdout"]
+    assert (tmp_path / "second.out").read_text() == "greeting=Hello ***"
+    assert len(masker) == len(secret_variants("second"))
+    assert dict(os.environ) == saved_env
+
+
+def test_worker_failure(tmp_path):
+    response = ActionWorker(EchoAction).invoke(_env(tmp_path, "fail"))
+    assert response["exit_code"] == 1
+    assert "RuntimeError: failed" in response["stderr"]
+
+
+class BrokenAction(EchoAction):
+    def __init__(self) -> None:
+        raise RuntimeError("broken init")
+
+
+def test_worker_init_failure(tmp_path):
+    response = ActionWorker(BrokenAction).invoke(_env(tmp_path, "a"))
+    assert response["exit_code"] == 1
+    assert "RuntimeError: broken init" in response["stderr"]
+
+
+def test_worker_serve_stream(tmp_path):
+    requests = b"\n".join(
+        json.dumps(request).encode()
+        for request in ({"env": _env(tmp_path, "a")}, {}, {"command": "stop"}, {"env": {}})
+    )
+    wfile = io.BytesIO()
+    assert ActionWorker(EchoAction).serve_stream(io.BytesIO(requests), wfile) is False
+    responses = [json.loads(line) for line in wfile.getvalue().splitlines()]
+    assert [response["exit_code"] for response in responses] == [0, 1]
+    assert "KeyError" in responses[1]["stderr"]
+
+
+def test_call_worker_invalid_response(monkeypatch, capsys):
+    monkeypatch.setattr("github_custom_actions.worker._request", lambda *_: {})
+    assert call_worker("w.sock", {}) == 1
+    assert "Unexpected response" in capsys.readouterr().err
+
+
+def test_worker_socket(tmp_path, capsys):
+    socket_path = Path(tempfile.mkdtemp()) / "w.sock"
+    thread = threading.Thread(target=ActionWorker(EchoAction).serve_socket, args=(socket_path,))
+    thread.start()
+    try:
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            threading.Event().wait(0.01)
+        assert call_worker(socket_path, _env(tmp_path, "a")) == 0
+        assert call_worker(socket_path, _env(tmp_path, "fail")) == 1
+    finally:
+        stop_worker(socket_path)
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+    assert (tmp_path / "a.out").read_text() == "greeting=Hello ***"
+    assert "RuntimeError" in capsys.readouterr().err
+
+
+def test_worker_main_requires_module_class():
+    with pytest.raises(ValueError, match="module:Class"):
+        main(["serve", "EchoAction"])